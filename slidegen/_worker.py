@@ -0,0 +1,83 @@
+"""Long-lived runner that executes generated slide scripts inside one warm interpreter.
+
+Started by :class:`slidegen.execution.ExecutionEngine` when the persistent worker is
+enabled. Each stdin line is a JSON request naming the script, its arguments, the
+working directory and the log files; the script runs as ``__main__`` with its output
+redirected into those logs, and the worker answers with one JSON line holding the
+exit code. The worker exits when stdin closes.
+
+This file is run by path with ``-P``, so it must not import anything from ``slidegen``.
+"""
+from __future__ import annotations
+
+import json
+import os
+import runpy
+import sys
+import traceback
+
+try:  # Warm the import cache generated scripts rely on.
+    import pptx  # noqa: F401
+except ImportError:  # pragma: no cover - the script will report the missing dependency
+    pass
+
+
+def _exit_code(code: object) -> int:
+    if code is None:
+        return 0
+    if isinstance(code, int):
+        return code
+    print(code, file=sys.stderr)
+    return 1
+
+
+def _run(request: dict) -> int:
+    script = request["script"]
+    sys.stdout.flush()
+    sys.stderr.flush()
+    saved_fds = os.dup(1), os.dup(2)
+    for target_fd, log_path in ((1, request["stdout_log"]), (2, request["stderr_log"])):
+        log_fd = os.open(log_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        os.dup2(log_fd, target_fd)
+        os.close(log_fd)
+    saved_argv, saved_path, saved_cwd = sys.argv, list(sys.path), os.getcwd()
+    try:
+        os.chdir(request["cwd"])
+        # Mirror `python script.py`: argv[0] is the script and its directory leads sys.path.
+        sys.argv = [script, *request["args"]]
+        sys.path.insert(0, os.path.dirname(os.path.abspath(script)))
+        runpy.run_path(script, run_name="__main__")
+        return 0
+    except SystemExit as exit_request:
+        return _exit_code(exit_request.code)
+    except BaseException:  # pylint: disable=broad-except
+        traceback.print_exc()
+        return 1
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os.dup2(saved_fds[0], 1)
+        os.dup2(saved_fds[1], 2)
+        os.close(saved_fds[0])
+        os.close(saved_fds[1])
+        sys.argv, sys.path[:] = saved_argv, saved_path
+        os.chdir(saved_cwd)
+
+
+def main() -> None:
+    # Replies go to a private copy of stdout; fd 1 itself only ever points at script logs
+    # or devnull, so stray prints can never corrupt the protocol.
+    channel = os.fdopen(os.dup(1), "w", encoding="utf-8")
+    devnull = os.open(os.devnull, os.O_WRONLY)
+    os.dup2(devnull, 1)
+    os.close(devnull)
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        return_code = _run(json.loads(line))
+        channel.write(json.dumps({"return_code": return_code}) + "\n")
+        channel.flush()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,14 +1,21 @@
 from __future__ import annotations
 
-import json
+import os
 import shutil
-from dataclasses import dataclass
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Iterable, Optional
+from typing import BinaryIO, Iterable, Optional
 
+from . import serialization
+from .logging_config import get_logger
 from .types import ImageInput, RunMetadata
 
+logger = get_logger(__name__)
+
 
 @dataclass(frozen=True)
 class RunPaths:
@@ -18,22 +25,117 @@ class RunPaths:
     scripts_dir: Path
     outputs_dir: Path
     logs_dir: Path
+    # String forms for per-iteration joins, built once instead of re-deriving PurePaths.
+    input_dir_str: str = field(init=False, repr=False, compare=False)
+    outputs_dir_str: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "input_dir_str", os.fspath(self.input_dir))
+        object.__setattr__(self, "outputs_dir_str", os.fspath(self.outputs_dir))
+
+
+def utc_stamp(microseconds: bool = True) -> str:
+    """Current UTC time as ``YYYYMMDD_HHMMSS[_ffffff]``, formatted without strftime."""
+    now = datetime.now(timezone.utc)
+    stamp = f"{now.year:04d}{now.month:02d}{now.day:02d}_{now.hour:02d}{now.minute:02d}{now.second:02d}"
+    return f"{stamp}_{now.microsecond:06d}" if microseconds else stamp
+
+
+def fast_copy(source: Path, target: Path, preserve_metadata: bool = True) -> None:
+    """Copy ``source`` to ``target``, letting the kernel move the bytes where possible.
+
+    Uses ``os.copy_file_range`` on Linux and otherwise defers to shutil, which already
+    picks the platform fast path (sendfile, fcopyfile, or CopyFile2 on Windows). The
+    bytes go to a temporary file that then replaces ``target``, so an existing target,
+    which may be a hard link to another file, is never opened for writing.
+    """
+    if target.exists() and os.path.samefile(source, target):
+        raise shutil.SameFileError(f"{source} and {target} are the same file")
+    descriptor, temp_name = tempfile.mkstemp(dir=target.parent, prefix=f".{target.name}.", suffix=".tmp")
+    temp_path = Path(temp_name)
+    try:
+        with os.fdopen(descriptor, "wb") as destination:
+            copied = _copy_file_range(source, destination)
+        if not copied:
+            shutil.copyfile(source, temp_path)
+        if preserve_metadata:
+            shutil.copystat(source, temp_path)
+        else:
+            shutil.copymode(source, temp_path)  # mkstemp creates the file owner-only
+        os.replace(temp_path, target)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+
+
+def _copy_file_range(source: Path, destination: BinaryIO) -> bool:
+    """Copy ``source`` into ``destination`` in the kernel; False when unsupported."""
+    copy_file_range = getattr(os, "copy_file_range", None)
+    if copy_file_range is None:
+        return False
+    try:
+        with source.open("rb") as src:
+            while copy_file_range(src.fileno(), destination.fileno(), 1 << 30):
+                pass
+    except OSError:
+        # Older kernels and some filesystems reject copy_file_range.
+        return False
+    return True
+
+
+def link_or_copy(source: Path, target: Path) -> bool:
+    """Publish ``source`` at ``target`` as a hard link, copying when linking is not possible.
+
+    Linking moves no bytes when both paths share a filesystem; cross-device targets,
+    filesystems without hard links, and permission errors fall back to :func:`fast_copy`.
+    The link is made under a temporary name and renamed over ``target``, so a
+    concurrent writer can never write through it. Returns True when a link was made.
+    """
+    temp_path = target.with_name(f".{target.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        os.link(source, temp_path)
+    except OSError:
+        fast_copy(source, target)
+        return False
+    try:
+        os.replace(temp_path, target)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+    return True
+
+
+def _input_name(source: Path, claimed: dict[str, Path]) -> str:
+    """Name for ``source`` in a run's input directory that no other source has claimed."""
+    name, index = source.name, 1
+    while claimed.setdefault(name, source) != source:
+        index += 1
+        name = f"{source.stem}_{index}{source.suffix}"
+    return name
 
 
 class ArtifactManager:
     def __init__(self, base_output_dir: Path) -> None:
+        # create_run makes the base directory on demand along with the run directory.
         self._base_output_dir = base_output_dir
-        self._base_output_dir.mkdir(parents=True, exist_ok=True)
 
     def create_run(self, run_id: Optional[str] = None) -> RunPaths:
-        run_identifier = run_id or datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S_%f")
+        run_identifier = run_id or utc_stamp()
         base_dir = self._base_output_dir / run_identifier
         input_dir = base_dir / "input"
         scripts_dir = base_dir / "scripts"
         outputs_dir = base_dir / "outputs"
         logs_dir = base_dir / "logs"
+        existing: set[str] = set()
+        try:
+            os.makedirs(base_dir)
+        except FileExistsError:
+            # Reused run id: list the directory once instead of probing each child.
+            with os.scandir(base_dir) as entries:
+                existing = {entry.name for entry in entries if entry.is_dir()}
         for directory in (input_dir, scripts_dir, outputs_dir, logs_dir):
-            directory.mkdir(parents=True, exist_ok=True)
+            if directory.name not in existing:
+                os.mkdir(directory)
         return RunPaths(
             run_id=run_identifier,
             base_dir=base_dir,
@@ -45,28 +147,56 @@ class ArtifactManager:
 
     def persist_prompt(self, run_paths: RunPaths, prompt: str) -> Path:
         prompt_path = run_paths.input_dir / "prompt.txt"
-        prompt_path.write_text(prompt, encoding="utf-8")
+        encoded = prompt.encode("utf-8")
+        try:
+            # Resumed runs usually find the same prompt already on disk.
+            if prompt_path.stat().st_size == len(encoded) and prompt_path.read_bytes() == encoded:
+                return prompt_path
+        except FileNotFoundError:
+            pass
+        prompt_path.write_bytes(encoded)
         return prompt_path
 
     def store_reference_image(self, run_paths: RunPaths, reference_image: Optional[Path]) -> Optional[Path]:
         if not reference_image:
             return None
         target = run_paths.input_dir / reference_image.name
-        shutil.copy2(reference_image, target)
+        fast_copy(reference_image, target)
         return target
 
     def store_images(self, run_paths: RunPaths, images: Iterable[ImageInput]) -> Iterable[ImageInput]:
+        """Copy the request's images into the run's input directory.
+
+        Generated scripts receive these paths, so they are real copies rather than
+        links: a script saving over an image cannot touch the user's original.
+        Sources that share a file name are stored under distinct names.
+        """
+        images = list(images)
+        claimed = {image.path.name: image.path for image in images if image.path.parent == run_paths.input_dir}
         stored = []
+        copies: dict[Path, Path] = {}
         for image in images:
-            target = run_paths.input_dir / image.path.name
-            if image.path != target:
-                shutil.copy2(image.path, target)
+            if image.path.parent == run_paths.input_dir:
+                # Already stored for this run (e.g. a re-run); nothing to copy.
+                stored.append(image)
+                continue
+            target = run_paths.input_dir / _input_name(image.path, claimed)
+            copies[target] = image.path
             stored.append(ImageInput(name=image.name, path=target, description=image.description))
+        if len(copies) > 1:
+            # Copies are I/O bound and release the GIL, so overlap them. Targets are
+            # distinct, so no two workers write the same file.
+            with ThreadPoolExecutor(max_workers=min(8, len(copies))) as executor:
+                list(executor.map(fast_copy, copies.values(), copies.keys()))
+        else:
+            for target, source in copies.items():
+                fast_copy(source, target)
         return stored
 
     def write_metadata(self, run_paths: RunPaths, metadata: RunMetadata) -> Path:
         metadata_path = run_paths.base_dir / "metadata.json"
-        metadata_path.write_text(json.dumps(metadata.to_dict(), indent=2), encoding="utf-8")
+        with metadata_path.open("wb", buffering=1 << 16) as handle:
+            serialization.dump(metadata.json_fields(), handle)
         return metadata_path
 
     def persist_script(self, run_paths: RunPaths, version_id: str, content: str) -> Path:
@@ -75,11 +205,8 @@ class ArtifactManager:
         script_path.write_text(content, encoding="utf-8")
         return script_path
 
-    def persist_execution_logs(self, run_paths: RunPaths, version_id: str, stdout: str, stderr: str) -> None:
-        stdout_path = run_paths.logs_dir / f"{version_id}_stdout.log"
-        stderr_path = run_paths.logs_dir / f"{version_id}_stderr.log"
-        stdout_path.write_text(stdout, encoding="utf-8")
-        stderr_path.write_text(stderr, encoding="utf-8")
+    def execution_log_paths(self, run_paths: RunPaths, version_id: str) -> tuple[Path, Path]:
+        return run_paths.logs_dir / f"{version_id}_stdout.log", run_paths.logs_dir / f"{version_id}_stderr.log"
 
     def persist_score(self, run_paths: RunPaths, version_id: str, score: RunMetadata) -> Path:  # pragma: no cover - reserved for future usage
         # TODO: Store per-version score summaries; current metadata already captures this detail.
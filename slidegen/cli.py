@@ -2,20 +2,19 @@ from __future__ import annotations
 
 import argparse
 import json
-import shutil
-from datetime import datetime, timezone
+import re
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List
+from typing import TYPE_CHECKING, Dict, List
 
-from .artifacts import ArtifactManager
+from .artifacts import ArtifactManager, link_or_copy, utc_stamp
 from .config import Settings, load_settings
-from .logging_config import get_logger, setup_logging
-from .openai_client import OpenAIClient
-from .screenshot import ScreenshotService
-from .scoring import ScoringService
-from .state import SlideGenStateMachine
+from .logging_config import PROGRESS, get_logger, setup_logging
 from .types import ImageInput, SlideRequest
 
+if TYPE_CHECKING:
+    from .state import SlideGenStateMachine
+
 logger = get_logger(__name__)
 
 
@@ -57,24 +56,32 @@ def load_prompt(args: argparse.Namespace) -> str:
     raise ValueError("Prompt is required")
 
 
+_IMAGE_SPEC_RE = re.compile(r"^\s*([^|]*?)\s*\|\s*([^|\s][^|]*?)\s*\|\s*(.*?)\s*$", re.DOTALL)
+
+
 def parse_image_specs(values: List[str]) -> List[ImageInput]:
     images: List[ImageInput] = []
     for raw_value in values:
-        parts = raw_value.split("|", 2)
-        if len(parts) != 3:
+        match = _IMAGE_SPEC_RE.match(raw_value)
+        if not match:
             raise ValueError(f"Invalid image specification: {raw_value}")
-        name, path_str, description = (part.strip() for part in parts)
-        path = Path(path_str).expanduser().resolve()
+        name, path_str, description = match.groups()
+        path = _resolve_path(Path(path_str))
         if not path.exists():
             raise FileNotFoundError(f"Image path not found: {path}")
         images.append(ImageInput(name=name, path=path, description=description))
     return images
 
 
+@lru_cache(maxsize=256)
+def _resolve_path(path: Path) -> Path:
+    return path.expanduser().resolve()
+
+
 def build_settings(args: argparse.Namespace) -> Settings:
     overrides: Dict[str, str] = {}
     if args.output_dir:
-        overrides["DEFAULT_OUTPUT_DIR"] = str(args.output_dir.expanduser().resolve())
+        overrides["DEFAULT_OUTPUT_DIR"] = str(_resolve_path(args.output_dir))
     if args.mock_openai and args.real_openai:
         raise ValueError("Cannot specify both --mock-openai and --real-openai")
     if args.mock_openai:
@@ -85,6 +92,12 @@ def build_settings(args: argparse.Namespace) -> Settings:
 
 
 def create_state_machine(settings: Settings, artifact_manager: ArtifactManager) -> SlideGenStateMachine:
+    # Imported here so --help and argument errors don't pay for openai, pptx, or PIL.
+    from .openai_client import OpenAIClient
+    from .scoring import ScoringService
+    from .screenshot import ScreenshotService
+    from .state import SlideGenStateMachine
+
     openai_client = OpenAIClient(settings.openai)
     screenshot_service = ScreenshotService(settings.openai.mock_mode)
     scoring_service = ScoringService(settings.score_weights, openai_client)
@@ -105,7 +118,7 @@ def run() -> None:
     
     prompt = load_prompt(args)
     images = parse_image_specs(args.images)
-    reference_image = args.reference_image.expanduser().resolve() if args.reference_image else None
+    reference_image = _resolve_path(args.reference_image) if args.reference_image else None
 
     settings = build_settings(args)
     
@@ -137,47 +150,46 @@ def run() -> None:
         metadata = state_machine.run(request, run_paths=run_paths)
     except Exception as error:
         logger.error("CRITICAL ERROR: %s", error, exc_info=True)
-        logger.progress("X CRITICAL ERROR: %s", error)  # type: ignore[attr-defined]
+        logger.log(PROGRESS, "X CRITICAL ERROR: %s", error)
         raise SystemExit(1) from error
 
     # Copy best PPTX to workspace root with timestamp
     workspace_pptx: Path | None = None
     if metadata.best_version_id:
-        run_dir = settings.io.default_output_dir / metadata.run_id
-        best_pptx = run_dir / "outputs" / f"slide_{metadata.best_version_id}.pptx"
+        best_pptx = run_paths.outputs_dir / f"slide_{metadata.best_version_id}.pptx"
         if best_pptx.exists():
-            timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
+            timestamp = utc_stamp(microseconds=False)
             workspace_pptx = settings.io.workspace_dir / f"slide_{timestamp}.pptx"
-            shutil.copy2(best_pptx, workspace_pptx)
+            link_or_copy(best_pptx, workspace_pptx)
             logger.info("Best slide copied to workspace: %s", workspace_pptx)
-            logger.progress("✓ Best slide saved to: %s", workspace_pptx.name)  # type: ignore[attr-defined]
-            logger.progress("  Full path: %s", workspace_pptx)  # type: ignore[attr-defined]
+            logger.log(PROGRESS, "✓ Best slide saved to: %s", workspace_pptx.name)
+            logger.log(PROGRESS, "  Full path: %s", workspace_pptx)
 
     summary: Dict[str, object] = {
         "run_id": metadata.run_id,
         "best_version_id": metadata.best_version_id,
         "best_score": metadata.best_score.to_dict() if metadata.best_score else None,
         "status": metadata.status.value,
-        "output_dir": str(settings.io.default_output_dir / metadata.run_id),
+        "output_dir": str(run_paths.base_dir),
         "workspace_pptx": str(workspace_pptx) if workspace_pptx else None,
     }
     
     logger.info("Run summary: %s", json.dumps(summary, indent=2))
-    logger.progress("\n%s", json.dumps(summary, indent=2))  # type: ignore[attr-defined]
+    logger.log(PROGRESS, "\n%s", json.dumps(summary, indent=2))
     
     # Exit with error code if the workflow failed
     if metadata.status.value == "failed":
         logger.error("Workflow failed")
-        logger.progress("X Workflow failed")  # type: ignore[attr-defined]
+        logger.log(PROGRESS, "X Workflow failed")
         
         # Show the last error details
         if metadata.iterations:
             last_iteration = metadata.iterations[-1]
             if last_iteration.execution and last_iteration.execution.stderr:
                 logger.error("Last error: %s", last_iteration.execution.stderr)
-                logger.progress("Error details:")  # type: ignore[attr-defined]
-                logger.progress("%s", last_iteration.execution.stderr)  # type: ignore[attr-defined]
-                logger.progress("Full logs in: %s/logs/", summary['output_dir'])  # type: ignore[attr-defined]
+                logger.log(PROGRESS, "Error details:")
+                logger.log(PROGRESS, "%s", last_iteration.execution.stderr)
+                logger.log(PROGRESS, "Full logs in: %s/logs/", summary['output_dir'])
         
         raise SystemExit(1)
 
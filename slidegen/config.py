@@ -1,12 +1,12 @@
 from __future__ import annotations
 
 import os
+import re
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Optional
 
-from dotenv import dotenv_values
-
 
 @dataclass(frozen=True)
 class OpenAIConfig:
@@ -20,6 +20,15 @@ class OpenAIConfig:
     azure_endpoint: Optional[str]
     azure_deployment: Optional[str]
     azure_api_version: Optional[str]
+    max_concurrency: int = 4  # in-flight requests allowed by the async client
+    response_cache_dir: Optional[Path] = None  # disabled when unset
+    requests_per_minute: int = 0  # 0 disables client-side rate limiting
+    tokens_per_minute: int = 0
+    vision_max_dim: int = 0  # long-side pixel limit for request images; 0 sends them unscaled
+    score_with_assets: bool = False  # attach the user's image assets to scoring requests
+    scoring_model: Optional[str] = None  # None scores with default_model (or the Azure deployment); load_config sets gpt-4o-mini unless Azure is on
+    max_retries: int = 2  # SDK retries for 429, 5xx and connection errors
+    image_detail: str = "high"  # vision detail for request images: "low", "high" or "auto"
 
 
 @dataclass(frozen=True)
@@ -28,6 +37,11 @@ class BehaviorConfig:
     max_improvement_iterations: int
     execution_timeout_seconds: int
     target_score_threshold: float
+    presentation_validation: str = "fast"  # "off", "fast" (zip index check), or "full" (python-pptx load)
+    image_map_via_stdin: bool = False
+    persistent_script_worker: bool = False
+    max_parallel_executions: int = 0  # 0 means one per CPU
+    initial_candidates: int = 1
 
 
 @dataclass(frozen=True)
@@ -56,11 +70,51 @@ class Settings:
 
 
 def _load_environment(env_path: Optional[Path]) -> Dict[str, str]:
-    env_values: Dict[str, str] = {}
     if env_path and env_path.exists():
-        env_values.update({k: v for k, v in dotenv_values(env_path).items() if v is not None})
-    env_values.update({k: v for k, v in os.environ.items() if isinstance(v, str)})
-    return env_values
+        return {**_parse_env_file(env_path), **os.environ}
+    return dict(os.environ)
+
+
+# One assignment per match. Quoted values may span lines; text after the closing
+# quote (e.g. a comment) is ignored, as are lines that are not assignments.
+_ENV_ASSIGNMENT_RE = re.compile(
+    r"""^[ \t]*(?:export[ \t]+)?(?P<key>[A-Za-z_][\w.]*)[ \t]*=[ \t]*
+    (?:'(?P<single>(?:\\.|[^'\\])*)'|"(?P<double>(?:\\.|[^"\\])*)"|(?P<bare>[^\n]*))""",
+    re.MULTILINE | re.VERBOSE | re.DOTALL,
+)
+_ENV_ESCAPE_RE = re.compile(r"\\(.)", re.DOTALL)
+_ENV_DOUBLE_ESCAPES = {"n": "\n", "t": "\t", "r": "\r", '"': '"', "'": "'", "\\": "\\"}
+_ENV_VARIABLE_RE = re.compile(r"\$\{(?P<name>[^}:]+)(?::-(?P<default>[^}]*))?\}")
+
+
+def _parse_env_file(env_path: Path) -> Dict[str, str]:
+    """Parse a ``.env`` file with the same syntax python-dotenv accepts.
+
+    Supports comments, an ``export`` prefix, single-quoted literals, double-quoted
+    values with backslash escapes, quoted values spanning several lines, and
+    ``${VAR}`` / ``${VAR:-default}`` interpolation in unquoted and double-quoted
+    values. Variables resolve against the process environment first, then against
+    keys defined earlier in the file.
+    """
+    values: Dict[str, str] = {}
+
+    def interpolate(value: str) -> str:
+        def lookup(match: re.Match[str]) -> str:
+            name = match.group("name")
+            found = os.environ.get(name, values.get(name))
+            return found if found is not None else match.group("default") or ""
+        return _ENV_VARIABLE_RE.sub(lookup, value)
+
+    for match in _ENV_ASSIGNMENT_RE.finditer(env_path.read_text(encoding="utf-8")):
+        single, double, bare = match.group("single", "double", "bare")
+        if single is not None:
+            value = _ENV_ESCAPE_RE.sub(lambda escape: escape.group(1) if escape.group(1) in "'\\" else escape.group(0), single)
+        elif double is not None:
+            value = interpolate(_ENV_ESCAPE_RE.sub(lambda escape: _ENV_DOUBLE_ESCAPES.get(escape.group(1), escape.group(0)), double))
+        else:
+            value = interpolate(bare.split(" #", 1)[0].strip())
+        values[match.group("key")] = value
+    return values
 
 
 def _to_bool(value: Optional[str], default: bool = False) -> bool:
@@ -69,6 +123,21 @@ def _to_bool(value: Optional[str], default: bool = False) -> bool:
     return value.strip().lower() in {"1", "true", "yes", "on"}
 
 
+@lru_cache(maxsize=16)
+def _score_weights(completeness: str, content_accuracy: str, layout_match: str, visual_quality: str) -> ScoreWeights:
+    """Parse and validate the raw weight values once per distinct combination."""
+    score_weights = ScoreWeights(
+        completeness=float(completeness),
+        content_accuracy=float(content_accuracy),
+        layout_match=float(layout_match),
+        visual_quality=float(visual_quality),
+    )
+    total_weight = score_weights.total
+    if not 0.99 <= total_weight <= 1.01:  # allow minor float drift
+        raise ValueError("Score weights must sum to 1.0")
+    return score_weights
+
+
 def load_settings(
     env_path: Optional[Path] = None,
     overrides: Optional[Dict[str, str]] = None,
@@ -107,6 +176,27 @@ def load_settings(
         elif not api_key:
             raise ValueError("OPENAI_API_KEY is required when OPENAI_USE_MOCK is false")
 
+    max_concurrency = int(env_data.get("OPENAI_MAX_CONCURRENCY", "4"))
+    if max_concurrency < 1:
+        raise ValueError("OPENAI_MAX_CONCURRENCY must be at least 1")
+
+    requests_per_minute = int(env_data.get("OPENAI_REQUESTS_PER_MINUTE", "0"))
+    tokens_per_minute = int(env_data.get("OPENAI_TOKENS_PER_MINUTE", "0"))
+    if requests_per_minute < 0 or tokens_per_minute < 0:
+        raise ValueError("OPENAI_REQUESTS_PER_MINUTE and OPENAI_TOKENS_PER_MINUTE must not be negative")
+
+    max_retries = int(env_data.get("OPENAI_MAX_RETRIES", "2"))
+    if max_retries < 0:
+        raise ValueError("OPENAI_MAX_RETRIES must not be negative")
+
+    vision_max_dim = int(env_data.get("OPENAI_VISION_MAX_DIM", "0"))
+    if vision_max_dim < 0:
+        raise ValueError("OPENAI_VISION_MAX_DIM must not be negative")
+
+    image_detail = env_data.get("OPENAI_IMAGE_DETAIL", "high").strip().lower()
+    if image_detail not in {"low", "high", "auto"}:
+        raise ValueError("OPENAI_IMAGE_DETAIL must be one of: low, high, auto")
+
     openai = OpenAIConfig(
         api_key=api_key,
         default_model=env_data.get("OPENAI_DEFAULT_MODEL", "gpt-4o-mini"),
@@ -117,13 +207,35 @@ def load_settings(
         azure_endpoint=azure_endpoint,
         azure_deployment=azure_deployment,
         azure_api_version=azure_api_version,
+        max_concurrency=max_concurrency,
+        response_cache_dir=Path(env_data["OPENAI_RESPONSE_CACHE_DIR"]) if env_data.get("OPENAI_RESPONSE_CACHE_DIR") else None,
+        vision_max_dim=vision_max_dim,
+        score_with_assets=_to_bool(env_data.get("OPENAI_SCORE_WITH_ASSETS"), default=False),
+        scoring_model=env_data.get("OPENAI_SCORING_MODEL", None if use_azure else "gpt-4o-mini") or None,
+        requests_per_minute=requests_per_minute,
+        tokens_per_minute=tokens_per_minute,
+        max_retries=max_retries,
+        image_detail=image_detail,
     )
 
+    presentation_validation = env_data.get("PRESENTATION_VALIDATION", "fast").strip().lower()
+    if presentation_validation not in {"off", "fast", "full"}:
+        raise ValueError("PRESENTATION_VALIDATION must be one of: off, fast, full")
+
+    initial_candidates = int(env_data.get("INITIAL_CANDIDATES", "1"))
+    if initial_candidates < 1:
+        raise ValueError("INITIAL_CANDIDATES must be at least 1")
+
     behavior = BehaviorConfig(
         max_script_retries=int(env_data.get("MAX_SCRIPT_RETRIES", "3")),
         max_improvement_iterations=int(env_data.get("MAX_IMPROVEMENT_ITERATIONS", "2")),
         execution_timeout_seconds=int(env_data.get("EXECUTION_TIMEOUT_SECONDS", "120")),
         target_score_threshold=float(env_data.get("TARGET_SCORE_THRESHOLD", "80")),
+        presentation_validation=presentation_validation,
+        image_map_via_stdin=_to_bool(env_data.get("IMAGE_MAP_VIA_STDIN"), default=False),
+        persistent_script_worker=_to_bool(env_data.get("PERSISTENT_SCRIPT_WORKER"), default=False),
+        max_parallel_executions=int(env_data.get("MAX_PARALLEL_EXECUTIONS", "0")),
+        initial_candidates=initial_candidates,
     )
 
     io_config = IOConfig(
@@ -131,16 +243,12 @@ def load_settings(
         workspace_dir=workspace_dir,
     )
 
-    score_weights = ScoreWeights(
-        completeness=float(env_data.get("SCORE_WEIGHT_COMPLETENESS", "0.3")),
-        content_accuracy=float(env_data.get("SCORE_WEIGHT_CONTENT_ACCURACY", "0.3")),
-        layout_match=float(env_data.get("SCORE_WEIGHT_LAYOUT_MATCH", "0.25")),
-        visual_quality=float(env_data.get("SCORE_WEIGHT_VISUAL_QUALITY", "0.15")),
+    score_weights = _score_weights(
+        env_data.get("SCORE_WEIGHT_COMPLETENESS", "0.3"),
+        env_data.get("SCORE_WEIGHT_CONTENT_ACCURACY", "0.3"),
+        env_data.get("SCORE_WEIGHT_LAYOUT_MATCH", "0.25"),
+        env_data.get("SCORE_WEIGHT_VISUAL_QUALITY", "0.15"),
     )
-
-    total_weight = score_weights.total
-    if not 0.99 <= total_weight <= 1.01:  # allow minor float drift
-        raise ValueError("Score weights must sum to 1.0")
     default_output_dir.mkdir(parents=True, exist_ok=True)
 
     return Settings(
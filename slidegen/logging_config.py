@@ -1,37 +1,38 @@
 """Centralized logging configuration for slidegen."""
 from __future__ import annotations
 
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
 from pathlib import Path
 from typing import Optional
 
 
-# Custom log level for console progress messages
+# Custom log level for console progress messages; emit with logger.log(PROGRESS, ...)
 PROGRESS = 25  # Between INFO (20) and WARNING (30)
 logging.addLevelName(PROGRESS, "PROGRESS")
 
+# Background thread that writes the run's log file; see setup_logging.
+_file_listener: Optional[logging.handlers.QueueListener] = None
 
-class ProgressFilter(logging.Filter):
-    """Filter that only allows PROGRESS level messages."""
-    def filter(self, record: logging.LogRecord) -> bool:
-        return record.levelno == PROGRESS
 
+def _stop_file_listener() -> None:
+    """Drain queued file records, then flush and close the file handlers."""
+    global _file_listener
+    if _file_listener is None:
+        return
+    _file_listener.stop()
+    for handler in _file_listener.handlers:
+        target = handler.target if isinstance(handler, logging.handlers.MemoryHandler) else None
+        handler.close()
+        if target is not None:
+            target.close()
+    _file_listener = None
 
-class ExcludeProgressFilter(logging.Filter):
-    """Filter that excludes PROGRESS level messages."""
-    def filter(self, record: logging.LogRecord) -> bool:
-        return record.levelno != PROGRESS
 
-
-def progress(logger: logging.Logger, message: str, *args, **kwargs) -> None:
-    """Log a progress message that will be shown to the user on console."""
-    if logger.isEnabledFor(PROGRESS):
-        logger._log(PROGRESS, message, args, **kwargs)
-
-
-# Add progress method to Logger class
-logging.Logger.progress = progress  # type: ignore[attr-defined]
+atexit.register(_stop_file_listener)
 
 
 def setup_logging(log_file_path: Optional[Path] = None, console_level: int = PROGRESS) -> None:
@@ -39,7 +40,9 @@ def setup_logging(log_file_path: Optional[Path] = None, console_level: int = PRO
     Configure logging for a run.
     
     Sets up two handlers:
-    1. File handler - logs everything at INFO level and above to the run's log file
+    1. File handler - logs everything at INFO level and above to the run's log file.
+       Records are queued and written by a background thread in batches, so callers
+       never block on disk IO; errors and shutdown flush the buffer.
     2. Console handler - only shows PROGRESS level messages to the user
     
     Args:
@@ -50,8 +53,11 @@ def setup_logging(log_file_path: Optional[Path] = None, console_level: int = PRO
     root_logger = logging.getLogger()
     root_logger.setLevel(logging.DEBUG)  # Capture everything, handlers will filter
     
-    # Remove any existing handlers
-    root_logger.handlers.clear()
+    # Remove any existing handlers, flushing anything they still buffer
+    for handler in list(root_logger.handlers):
+        root_logger.removeHandler(handler)
+        handler.close()
+    _stop_file_listener()
     
     # Create formatters
     file_formatter = logging.Formatter(
@@ -67,16 +73,27 @@ def setup_logging(log_file_path: Optional[Path] = None, console_level: int = PRO
     if log_file_path:
         log_file_path.parent.mkdir(parents=True, exist_ok=True)
         file_handler = logging.FileHandler(log_file_path, mode='a', encoding='utf-8')
-        file_handler.setLevel(logging.INFO)
         file_handler.setFormatter(file_formatter)
-        file_handler.addFilter(ExcludeProgressFilter())  # Don't duplicate progress in file
-        root_logger.addHandler(file_handler)
+        buffered_handler = logging.handlers.MemoryHandler(
+            capacity=512,
+            flushLevel=logging.ERROR,
+            target=file_handler,
+            flushOnClose=True,
+        )
+        record_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+        queue_handler = logging.handlers.QueueHandler(record_queue)
+        queue_handler.setLevel(logging.INFO)
+        queue_handler.addFilter(lambda record: record.levelno != PROGRESS)  # Don't duplicate progress in file
+        root_logger.addHandler(queue_handler)
+        global _file_listener
+        _file_listener = logging.handlers.QueueListener(record_queue, buffered_handler)
+        _file_listener.start()
     
     # Set up console handler for user-facing progress messages
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(console_level)
     console_handler.setFormatter(console_formatter)
-    console_handler.addFilter(ProgressFilter())  # Only show PROGRESS messages
+    console_handler.addFilter(lambda record: record.levelno == PROGRESS)  # Only show PROGRESS messages
     root_logger.addHandler(console_handler)
 
 
@@ -86,29 +103,32 @@ def get_logger(name: str) -> logging.Logger:
 
 
 def log_ai_request(logger: logging.Logger, operation: str, prompt: str,  reference_image: Optional[Path] = None, previous_image: Optional[Path] = None, model: Optional[str] = None) -> None:
-    """Log an AI request with clear formatting."""
-    logger.info("=" * 80)
-    logger.info("AI REQUEST: %s", operation)
-
+    """Log an AI request with clear formatting, as a single record."""
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    lines = ["=" * 80, f"AI REQUEST: {operation}"]
     if reference_image:
-        logger.info("Reference Image: %s", reference_image)
-    
+        lines.append(f"Reference Image: {reference_image}")
     if previous_image:
-        logger.info("Previous Image: %s", previous_image)
-
+        lines.append(f"Previous Image: {previous_image}")
     if model:
-        logger.info("Model: %s", model)
-    logger.info("-" * 80)
-    logger.info("PROMPT:\n%s", prompt)
-    logger.info("=" * 80)
+        lines.append(f"Model: {model}")
+    lines += ["-" * 80, "PROMPT:", prompt, "=" * 80]
+    logger.info("%s", "\n".join(lines))
 
 
-def log_ai_response(logger: logging.Logger, operation: str, response: str, request_id: Optional[str] = None) -> None:
-    """Log an AI response with clear formatting."""
-    logger.info("=" * 80)
-    logger.info("AI RESPONSE: %s", operation)
+def log_ai_response(logger: logging.Logger, operation: str, response: str, *args: object, request_id: Optional[str] = None) -> None:
+    """Log an AI response with clear formatting, as a single record.
+
+    ``response`` may be a ``%``-style format string for ``args``; it is only
+    interpolated when INFO is enabled.
+    """
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    if args:
+        response = response % args
+    lines = ["=" * 80, f"AI RESPONSE: {operation}"]
     if request_id:
-        logger.info("Request ID: %s", request_id)
-    logger.info("-" * 80)
-    logger.info("RESPONSE:\n%s", response)
-    logger.info("=" * 80)
+        lines.append(f"Request ID: {request_id}")
+    lines += ["-" * 80, "RESPONSE:", response, "=" * 80]
+    logger.info("%s", "\n".join(lines))
@@ -1,21 +1,221 @@
 from __future__ import annotations
 
-import base64
+import asyncio
 import hashlib
+import importlib.util
+import io
+import json
+import re
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
+from itertools import repeat
 from pathlib import Path
-from typing import Iterable, Optional
+from typing import Any, BinaryIO, Dict, Iterable, Optional, Sequence
 
-from openai import AzureOpenAI, OpenAI
+from openai import (
+    AsyncAzureOpenAI,
+    AsyncOpenAI,
+    AzureOpenAI,
+    DefaultAsyncHttpxClient,
+    DefaultHttpxClient,
+    OpenAI,
+    RateLimitError,
+)
+from openai.types.chat import ChatCompletion
 
+from . import serialization
 from .config import OpenAIConfig
 from .logging_config import get_logger, log_ai_request, log_ai_response
-from .prompt_store import PromptStore
-from .types import ImageInput, ScoreBreakdown
+from .prompt_store import PromptStore, RenderedPrompt
+from .rate_limiter import RateLimiter, estimate_tokens, retry_after_seconds
+from .response_cache import ResponseCache
+from .types import ImageInput, ScoreBreakdown, SlideRequest
+
+try:
+    from pybase64 import b64encode
+except ImportError:  # pragma: no cover - pybase64 is an optional speedup
+    from base64 import b64encode
 
 logger = get_logger(__name__)
 
 
+_DATA_URL_CACHE_SIZE = 16
+_ENCODE_CHUNK_SIZE = 3 * 64 * 1024  # a multiple of 3, so chunks encode without padding
+_data_urls: OrderedDict[tuple[str, str, int], str] = OrderedDict()
+_data_urls_lock = threading.Lock()
+
+
+@lru_cache(maxsize=64)
+def _file_sha256(path: str, mtime_ns: int, size: int) -> str:
+    # mtime_ns and size are only part of the cache key: a rewritten file is hashed again.
+    with open(path, "rb") as image_file:
+        return hashlib.file_digest(image_file, "sha256").hexdigest()
+
+
+def _encode_data_url(path: str, digest: str, size: int, mime_type: str, max_dim: int = 0) -> str:
+    """Return the data URL for the file at ``path``, cached by content digest.
+
+    Keying on content means copies of the same image (e.g. the reference image
+    stored again in each run directory) share one encoded URL.
+    """
+    key = (digest, mime_type, max_dim)
+    with _data_urls_lock:
+        url = _data_urls.get(key)
+        if url is not None:
+            _data_urls.move_to_end(key)
+            return url
+    url = _read_data_url(path, size, mime_type, max_dim)
+    with _data_urls_lock:
+        _data_urls[key] = url
+        while len(_data_urls) > _DATA_URL_CACHE_SIZE:
+            _data_urls.popitem(last=False)
+    return url
+
+
+def _read_data_url(path: str, size: int, mime_type: str, max_dim: int) -> str:
+    """Encode an image as a data URL, shrinking it to ``max_dim`` on the long side if it is larger.
+
+    Downscaled images are re-encoded as JPEG; the API tiles images at a bounded
+    resolution anyway, so extra pixels only add upload size and vision tokens.
+    """
+    if max_dim:
+        from PIL import Image, UnidentifiedImageError  # Only needed when downscaling is enabled.
+
+        try:
+            with Image.open(path) as image:
+                if max(image.size) > max_dim:
+                    image.thumbnail((max_dim, max_dim), Image.Resampling.LANCZOS)
+                    buffer = io.BytesIO()
+                    image.convert("RGB").save(buffer, "JPEG", quality=85, optimize=True)
+                    size = buffer.tell()
+                    buffer.seek(0)
+                    return _stream_data_url(buffer, size, "image/jpeg")
+        except UnidentifiedImageError:
+            logger.debug("Sending %s unscaled: format not recognised", path)
+    with open(path, "rb") as image_file:
+        return _stream_data_url(image_file, size, mime_type)
+
+
+def _stream_data_url(source: BinaryIO, size: int, mime_type: str) -> str:
+    """Base64-encode about ``size`` bytes from ``source`` into a data URL, a chunk at a time.
+
+    Output goes into one buffer pre-sized from ``size`` and is decoded to ``str``
+    once, so the raw image and intermediate encoded copies are never all held at
+    the same time.
+    """
+    prefix = f"data:{mime_type};base64,".encode("ascii")
+    output = bytearray(len(prefix) + 4 * -(-size // 3))
+    output[:len(prefix)] = prefix
+    position = len(prefix)
+    chunk = bytearray(_ENCODE_CHUNK_SIZE)
+    view = memoryview(chunk)
+    # Buffered readers fill the chunk except at EOF, so only the last chunk is padded.
+    while read := source.readinto(chunk):
+        encoded = b64encode(view[:read])
+        output[position:position + len(encoded)] = encoded
+        position += len(encoded)
+    if position != len(output):  # the file changed size since it was stat'ed
+        del output[position:]
+    return output.decode("ascii")
+
+
+# Static parts of the mock script, joined once; only the title, tag and bullets vary.
+_MOCK_SCRIPT_HEAD = "\n".join([
+    "import argparse",
+    "import json",
+    "from pathlib import Path",
+    "from typing import Dict, Optional",
+    "",
+    "from pptx import Presentation",
+    "from pptx.util import Inches, Pt",
+    "",
+    "",
+    "def build_text_frame(slide, title_text, bullet_points):",
+    "    left = Inches(0.6)",
+    "    top = Inches(0.6)",
+    "    width = Inches(12.1)",
+    "    height = Inches(3.8)",
+    "    textbox = slide.shapes.add_textbox(left, top, width, height)",
+    "    text_frame = textbox.text_frame",
+    "    text_frame.text = title_text",
+    "    text_frame.paragraphs[0].font.size = Pt(40)",
+    "    text_frame.paragraphs[0].font.bold = True",
+    "    for bullet in bullet_points:",
+    "        paragraph = text_frame.add_paragraph()",
+    "        paragraph.text = bullet",
+    "        paragraph.level = 1",
+    "        paragraph.font.size = Pt(20)",
+    "",
+    "",
+    "def place_images(slide, image_map):",
+    "    image_specs = []",
+    "    if not image_specs:",
+    "        return",
+    "    base_left = Inches(0.5)",
+    "    base_top = Inches(4.5)",
+    "    spacing = Inches(0.3)",
+    "    image_width = Inches(2.8)",
+    "    image_height = Inches(2.2)",
+    "    max_per_row = max(1, min(3, len(image_specs)))",
+    "    for index, (name, path, description) in enumerate(image_specs):",
+    "        if not path:",
+    "            continue",
+    "        try:",
+    "            column = index % max_per_row",
+    "            row = index // max_per_row",
+    "            left = base_left + (image_width + spacing) * column",
+    "            top = base_top + (image_height + spacing) * row",
+    "            slide.shapes.add_picture(path, left, top, width=image_width, height=image_height)",
+    "            if description:",
+    "                caption_top = min(top + image_height + Inches(0.1), Inches(7.0))",
+    "                caption_box = slide.shapes.add_textbox(left, caption_top, image_width, Inches(0.6))",
+    "                caption_frame = caption_box.text_frame",
+    "                caption_frame.text = description",
+    "                caption_frame.paragraphs[0].font.size = Pt(12)",
+    "                caption_frame.paragraphs[0].font.italic = True",
+    "        except Exception as error:  # pylint: disable=broad-except",
+    "            print(f\"Failed to place image {name}: {error}\", flush=True)",
+    "",
+    "",
+    "def main(output_path: Path, image_map: Optional[Dict[str, str]] = None):",
+    "    image_map = image_map or {}",
+    "    presentation = Presentation()",
+    "    presentation.slide_width = Inches(13.33)",
+    "    presentation.slide_height = Inches(7.5)",
+    "    slide = presentation.slides.add_slide(presentation.slide_layouts[6])",
+    "    bullet_points = []",
+])
+_MOCK_SCRIPT_TAIL = "\n".join([
+    "    place_images(slide, image_map)",
+    "    presentation.save(output_path)",
+    "",
+    "",
+    "def parse_args():",
+    '    parser = argparse.ArgumentParser(description="Generated slide authoring script")',
+    '    parser.add_argument("--output", required=True, type=Path)',
+    '    parser.add_argument("--images", required=False, type=Path)',
+    "    return parser.parse_args()",
+    "",
+    "",
+    "def load_image_map(images_path: Optional[Path]) -> Dict[str, str]:",
+    "    if not images_path or not images_path.exists():",
+    "        return {}",
+    "    with images_path.open(\"r\", encoding=\"utf-8\") as handle:",
+    "        return json.load(handle)",
+    "",
+    "",
+    "if __name__ == \"__main__\":",
+    "    args = parse_args()",
+    "    image_map = load_image_map(args.images)",
+    "    main(args.output, image_map)",
+])
+
+
 @dataclass
 class ScriptGenerationResult:
     script: str
@@ -23,51 +223,225 @@ class ScriptGenerationResult:
     prompt_payload: str
 
 
+@dataclass
+class ScriptBatch:
+    """Handle for initial-script requests submitted through the Batch API."""
+
+    batch_id: str
+    prompt_payloads: list[str]
+
+
+@dataclass
+class ScoringBatch:
+    """Handle for scoring requests submitted through the Batch API."""
+
+    batch_id: str
+    size: int
+
+
+_BATCH_FAILED_STATUSES = frozenset({"failed", "expired", "cancelled"})
+
+# A fenced block: opening fence with optional language tag, body, closing fence on its own line.
+_CODE_BLOCK_RE = re.compile(r"^[ \t]*```[ \t]*([\w+-]*)[^\n]*\n(.*?)^[ \t]*```", re.DOTALL | re.MULTILINE)
+_PYTHON_FENCE_TAGS = frozenset({"", "python", "python3", "py"})
+_PROMPT_CACHE_SIZE = 64
+_REASONING_MODEL_PREFIXES = ("o1", "o3", "gpt-5")  # and their variants
+# HTTP/2 multiplexes concurrent requests over one connection, but needs the optional h2 package.
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+_IMAGE_MIME_TYPES = {
+    ".png": "image/png",
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".gif": "image/gif",
+    ".webp": "image/webp",
+    ".bmp": "image/bmp",
+}
+_GENERATION_ROLE = "You are an expert Python developer. Return only executable Python code."
+_SCORING_ROLE = "You are an expert presentation evaluator. Analyze slides objectively and return only valid JSON."
+_RATE_LIMIT_RETRIES = 3
+# Structured output for scoring: the model can only emit these keys, so no prose
+# or markdown wrapping is generated and every field is guaranteed to be present.
+_SCORE_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "score_breakdown",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                **{key: {"type": "number"} for key in ("completeness", "content_accuracy", "layout_match", "visual_quality")},
+                "issues": {"type": "array", "items": {"type": "string"}},
+            },
+            "required": ["completeness", "content_accuracy", "layout_match", "visual_quality", "issues"],
+            "additionalProperties": False,
+        },
+    },
+}
+
+
+@lru_cache(maxsize=1)
+def _encoding_pool() -> ThreadPoolExecutor:
+    # File reads and base64 encoding release the GIL, so images encode in parallel.
+    return ThreadPoolExecutor(max_workers=4, thread_name_prefix="image-encode")
+
+
+@lru_cache(maxsize=16)
+def _system_content(role: str, static_prefix: str) -> str:
+    # Memoized prompts reuse the same prefix string, whose hash Python caches, so a hit is cheap.
+    if not static_prefix:
+        return role
+    return f"{role}\n\n{static_prefix}"
+
+
+@lru_cache(maxsize=16)
+def _prefix_sha256(static_prefix: str) -> Any:
+    # Matches the separator RenderedPrompt.text puts between prefix and suffix.
+    return hashlib.sha256(f"{static_prefix}\n\n".encode("utf-8"))
+
+
+@lru_cache(maxsize=16)
+def _prompt_cache_key(system_message: str) -> str:
+    return "slidegen-" + hashlib.blake2b(system_message.encode("utf-8"), digest_size=8).hexdigest()
+
+
+@lru_cache(maxsize=32)
+def _format_image_table(images: tuple[ImageInput, ...]) -> str:
+    if not images:
+        return "(no images provided)"
+    return "\n".join(f"- {image.name}: {image.description} ({image.path})" for image in images)
+
+
 class OpenAIClient:
-    """High level abstraction over LLM powered behaviors."""
+    """High level abstraction over LLM powered behaviors.
+
+    Every operation has a blocking form and an ``a``-prefixed coroutine form
+    (``agenerate_initial_script``, ``afix_script``, ``aimprove_script``,
+    ``ascore_slide``) so callers can ``asyncio.gather`` independent requests.
+    In-flight async requests are capped at ``OpenAIConfig.max_concurrency`` and,
+    when configured, paced by a :class:`RateLimiter` that also backs off on 429s.
+    """
 
     def __init__(self, config: OpenAIConfig, prompt_store: PromptStore | None = None) -> None:
         self._config = config
         self._prompt_store = prompt_store or PromptStore()
+        self._prompt_cache: Dict[bytes, RenderedPrompt] = {}
+        self._response_cache = ResponseCache(config.response_cache_dir) if config.response_cache_dir else None
         self._client: Optional[OpenAI | AzureOpenAI] = None
+        self._aclient: Optional[AsyncOpenAI | AsyncAzureOpenAI] = None
+        # One semaphore per event loop: asyncio primitives cannot be shared across loops.
+        self._semaphores: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore] = weakref.WeakKeyDictionary()
+        # Pooled connections are bound to the loop that opened them, so each loop also
+        # gets its own async client; the first loop uses ``_aclient`` itself.
+        self._aclients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncOpenAI | AsyncAzureOpenAI] = weakref.WeakKeyDictionary()
+        self._aclient_claimed = False
+        self._rate_limiter = (
+            RateLimiter(config.requests_per_minute, config.tokens_per_minute)
+            if config.requests_per_minute or config.tokens_per_minute
+            else None
+        )
+        # Model names and sampling settings are fixed for the client's lifetime, so
+        # request builders copy these instead of re-deriving them on every call.
+        self._generation_model = config.azure_deployment if config.use_azure and config.azure_deployment else config.default_model
+        self._generation_sampling = self._sampling_params(
+            self._is_reasoning_model(config.default_model) or self._is_reasoning_model(self._generation_model)
+        )
+        # Scoring is an evaluation, not a creative task: greedy decoding keeps the
+        # scores of an unchanged slide stable across iterations.
+        self._scoring_sampling = self._sampling_params(
+            self._is_reasoning_model(self._scoring_model())
+            or (not config.scoring_model and self._is_reasoning_model(config.default_model)),
+            temperature=0.0,
+        )
+        if "reasoning_effort" in self._generation_sampling:
+            logger.info("Using reasoning model with effort: %s", config.reasoning_effort)
         if not config.mock_mode and config.api_key:
+            http_client = DefaultHttpxClient(http2=_HTTP2_AVAILABLE)
+            async_http_client = DefaultAsyncHttpxClient(http2=_HTTP2_AVAILABLE)
             if config.use_azure:
-                # Initialize Azure OpenAI client
+                # Initialize Azure OpenAI clients
                 if not config.azure_endpoint:
                     raise ValueError("azure_endpoint is required for Azure OpenAI")
                 if not config.azure_api_version:
                     raise ValueError("azure_api_version is required for Azure OpenAI")
-                self._client = AzureOpenAI(
-                    api_key=config.api_key,
-                    azure_endpoint=config.azure_endpoint,
-                    api_version=config.azure_api_version,
-                )
+                azure_options = {
+                    "api_key": config.api_key,
+                    "max_retries": config.max_retries,
+                    "azure_endpoint": config.azure_endpoint,
+                    "api_version": config.azure_api_version,
+                }
+                self._client = AzureOpenAI(**azure_options, http_client=http_client)
+                self._aclient = AsyncAzureOpenAI(**azure_options, http_client=async_http_client)
             else:
-                # Initialize standard OpenAI client
-                self._client = OpenAI(api_key=config.api_key)
+                # Initialize standard OpenAI clients
+                self._client = OpenAI(api_key=config.api_key, max_retries=config.max_retries, http_client=http_client)
+                self._aclient = AsyncOpenAI(api_key=config.api_key, max_retries=config.max_retries, http_client=async_http_client)
+        self._connection_warmed = False
+
+    def _sampling_params(self, is_reasoning: bool, temperature: float = 0.3) -> dict[str, object]:
+        if is_reasoning:
+            # Reasoning models (o1, o3, gpt-5) don't support custom temperature
+            # but do support reasoning_effort
+            return {"reasoning_effort": self._config.reasoning_effort}
+        return {"temperature": temperature}
+
+    def _prewarm_connection(self) -> None:
+        """Open the sync client's connection in the background before its first request.
+
+        Called once a real request is about to be built, so the TCP and TLS
+        handshakes overlap with image encoding instead of delaying the request; the
+        pooled connection is then reused. The warm-up is a small authenticated
+        lookup of the generation model. Azure has no such endpoint for
+        deployments, so Azure clients are not pre-warmed.
+        """
+        if self._connection_warmed or self._config.use_azure or not self._client:
+            return
+        self._connection_warmed = True
+        client = self._client
+        model = self._generation_model
+
+        def warm() -> None:
+            try:
+                client.with_options(max_retries=0).models.retrieve(model)
+            except Exception as error:  # pylint: disable=broad-except
+                logger.debug("Connection pre-warm failed: %s", error)
+
+        threading.Thread(target=warm, name="openai-prewarm", daemon=True).start()
 
     def generate_initial_script(
-            self, 
+            self,
             prompt: str,
             reference_image: Optional[Path] = None,
             image_assets: Iterable[ImageInput] = ()) -> ScriptGenerationResult:
 
-        prompt_payload = self._render_template(
-            "initial_script",
-            slide_brief=prompt,
-            image_assets=self._format_images(image_assets),
-        )
-        
+        prompt_sections = self._initial_script_payload(prompt, image_assets)
+        prompt_payload = prompt_sections.text
+
         log_ai_request(logger=logger, operation="GENERATE INITIAL SCRIPT", prompt=prompt_payload, reference_image=reference_image, model=self._config.default_model)
-        
+
         if self._config.mock_mode or not self._client:
             logger.info("Using mock mode for script generation")
             script = self._mock_render_script(prompt=prompt, reference_image=reference_image, iteration_tag="initial")
-            request_id = self._mock_request_id(prompt_payload)
+            request_id = self._mock_request_id(prompt_sections)
         else:
-            script, request_id = self._call_openai_with_vision(prompt_payload=prompt_payload, reference_image=reference_image)
-        
-        log_ai_response(logger, "GENERATE INITIAL SCRIPT", f"Generated {len(script)} characters of script code", request_id)
+            script, request_id = self._call_openai_with_vision(prompt_sections=prompt_sections, reference_image=reference_image)
+
+        log_ai_response(logger, "GENERATE INITIAL SCRIPT", "Generated %d characters of script code", len(script), request_id=request_id)
+        return ScriptGenerationResult(script=script, request_id=request_id, prompt_payload=prompt_payload)
+
+    async def agenerate_initial_script(
+            self,
+            prompt: str,
+            reference_image: Optional[Path] = None,
+            image_assets: Iterable[ImageInput] = ()) -> ScriptGenerationResult:
+        """Coroutine form of :meth:`generate_initial_script`."""
+        if self._config.mock_mode or not self._aclient:
+            return self.generate_initial_script(prompt, reference_image, image_assets)
+
+        prompt_sections = self._initial_script_payload(prompt, image_assets)
+        prompt_payload = prompt_sections.text
+        log_ai_request(logger=logger, operation="GENERATE INITIAL SCRIPT", prompt=prompt_payload, reference_image=reference_image, model=self._config.default_model)
+        script, request_id = await self._acall_openai_with_vision(prompt_sections=prompt_sections, reference_image=reference_image)
+        log_ai_response(logger, "GENERATE INITIAL SCRIPT", "Generated %d characters of script code", len(script), request_id=request_id)
         return ScriptGenerationResult(script=script, request_id=request_id, prompt_payload=prompt_payload)
 
     def fix_script(
@@ -77,27 +451,38 @@ class OpenAIClient:
         failing_script: str,
         errors: list[str],
     ) -> ScriptGenerationResult:
-        
-        image_list = list(image_assets)
-        error_log = "\n".join(errors) if errors else "No error details provided"
-        prompt_payload = self._render_template(
-            "fix_script",
-            prompt=prompt,
-            image_table=self._format_images(image_list),
-            failing_script=failing_script,
-            error_log=error_log,
-        )
-        
+
+        prompt_sections = self._fix_script_payload(prompt, image_assets, failing_script, errors)
+        prompt_payload = prompt_sections.text
+
         log_ai_request(logger=logger, operation="FIX SCRIPT", prompt=prompt_payload, model=self._config.default_model)
-        
+
         if self._config.mock_mode or not self._client:
             logger.info("Using mock mode for script fix")
             script = self._mock_render_script(prompt, iteration_tag="fixed")
-            request_id = self._mock_request_id(prompt_payload)
+            request_id = self._mock_request_id(prompt_sections)
         else:
-            script, request_id = self._call_openai_with_vision(prompt_payload=prompt_payload)
-        
-        log_ai_response(logger, "FIX SCRIPT", f"Generated {len(script)} characters of fixed script code", request_id)
+            script, request_id = self._call_openai_with_vision(prompt_sections=prompt_sections)
+
+        log_ai_response(logger, "FIX SCRIPT", "Generated %d characters of fixed script code", len(script), request_id=request_id)
+        return ScriptGenerationResult(script=script, request_id=request_id, prompt_payload=prompt_payload)
+
+    async def afix_script(
+        self,
+        prompt: str,
+        image_assets: Iterable[ImageInput],
+        failing_script: str,
+        errors: list[str],
+    ) -> ScriptGenerationResult:
+        """Coroutine form of :meth:`fix_script`."""
+        if self._config.mock_mode or not self._aclient:
+            return self.fix_script(prompt, image_assets, failing_script, errors)
+
+        prompt_sections = self._fix_script_payload(prompt, image_assets, failing_script, errors)
+        prompt_payload = prompt_sections.text
+        log_ai_request(logger=logger, operation="FIX SCRIPT", prompt=prompt_payload, model=self._config.default_model)
+        script, request_id = await self._acall_openai_with_vision(prompt_sections=prompt_sections)
+        log_ai_response(logger, "FIX SCRIPT", "Generated %d characters of fixed script code", len(script), request_id=request_id)
         return ScriptGenerationResult(script=script, request_id=request_id, prompt_payload=prompt_payload)
 
     def improve_script(
@@ -110,28 +495,48 @@ class OpenAIClient:
         reference_image: Optional[Path] = None,
         previous_screenshot: Optional[Path] = None,
     ) -> ScriptGenerationResult:
-        
+
         iteration_tag = f"improved_{iteration_index}"
-        prompt_payload = self._render_template(
-            "improve_script",
-            prompt=prompt,
-            image_table=self._format_images(image_assets),
-            previous_script=previous_script,
-            score_feedback=self._format_score(score_feedback),
-            iteration_index=iteration_index,
-            previous_screenshot=str(previous_screenshot) if previous_screenshot else "None",
+        prompt_sections = self._improve_script_payload(
+            prompt, image_assets, previous_script, score_feedback, iteration_index, previous_screenshot
         )
-        
+        prompt_payload = prompt_sections.text
+
         log_ai_request(logger=logger, operation=f"IMPROVE SCRIPT (iteration {iteration_index})", prompt=prompt_payload, reference_image=reference_image,  model=self._config.default_model)
-        
+
         if self._config.mock_mode or not self._client:
             logger.info("Using mock mode for script improvement")
             script = self._mock_render_script(prompt, reference_image=reference_image, previous_screenshot=previous_screenshot, iteration_tag=iteration_tag)
-            request_id = self._mock_request_id(prompt_payload)
+            request_id = self._mock_request_id(prompt_sections)
         else:
-            script, request_id = self._call_openai_with_vision(prompt_payload, reference_image=reference_image, previous_screenshot=previous_screenshot)
-        
-        log_ai_response(logger, f"IMPROVE SCRIPT (iteration {iteration_index})", f"Generated {len(script)} characters of improved script code", request_id)
+            script, request_id = self._call_openai_with_vision(prompt_sections, reference_image=reference_image, previous_screenshot=previous_screenshot)
+
+        log_ai_response(logger, f"IMPROVE SCRIPT (iteration {iteration_index})", "Generated %d characters of improved script code", len(script), request_id=request_id)
+        return ScriptGenerationResult(script=script, request_id=request_id, prompt_payload=prompt_payload)
+
+    async def aimprove_script(
+        self,
+        prompt: str,
+        image_assets: Iterable[ImageInput],
+        previous_script: str,
+        score_feedback: Optional[ScoreBreakdown],
+        iteration_index: int,
+        reference_image: Optional[Path] = None,
+        previous_screenshot: Optional[Path] = None,
+    ) -> ScriptGenerationResult:
+        """Coroutine form of :meth:`improve_script`."""
+        if self._config.mock_mode or not self._aclient:
+            return self.improve_script(
+                prompt, image_assets, previous_script, score_feedback, iteration_index, reference_image, previous_screenshot
+            )
+
+        prompt_sections = self._improve_script_payload(
+            prompt, image_assets, previous_script, score_feedback, iteration_index, previous_screenshot
+        )
+        prompt_payload = prompt_sections.text
+        log_ai_request(logger=logger, operation=f"IMPROVE SCRIPT (iteration {iteration_index})", prompt=prompt_payload, reference_image=reference_image, model=self._config.default_model)
+        script, request_id = await self._acall_openai_with_vision(prompt_sections, reference_image=reference_image, previous_screenshot=previous_screenshot)
+        log_ai_response(logger, f"IMPROVE SCRIPT (iteration {iteration_index})", "Generated %d characters of improved script code", len(script), request_id=request_id)
         return ScriptGenerationResult(script=script, request_id=request_id, prompt_payload=prompt_payload)
 
     def score_slide(
@@ -142,43 +547,267 @@ class OpenAIClient:
         reference_image: Optional[Path],
     ) -> ScoreBreakdown:
         """Score a slide based on prompt, assets, and optionally a reference image.
-        
+
         Uses Vision API to analyze the generated slide screenshot against the brief.
         """
 
         image_list = list(images)
-        prompt_payload = self._render_template(
-            "score_slide",
-            prompt=prompt,
-            image_table=self._format_images(image_list),
-            screenshot_path=str(screenshot_path) if screenshot_path else "None",
-            reference_image=str(reference_image) if reference_image else "None",
-        )
+        prompt_sections = self._score_slide_payload(prompt, image_list, screenshot_path, reference_image)
+        prompt_payload = prompt_sections.text
 
-        log_ai_request(logger=logger, operation="SCORE SLIDE", prompt=prompt_payload, reference_image=reference_image, model=self._config.default_model)
+        log_ai_request(logger=logger, operation="SCORE SLIDE", prompt=prompt_payload, reference_image=reference_image, model=self._scoring_model())
 
         if self._config.mock_mode or not self._client:
             logger.info("Scoring slide (mock mode)")
             return self._mock_score_slide(prompt, prompt_payload, image_list, screenshot_path, reference_image)
-        
+
         # Validate screenshot exists for API scoring
-        if not screenshot_path:
-            raise ValueError("Screenshot path is required for slide scoring")
-        
-        if not screenshot_path.exists():
-            raise FileNotFoundError(f"Screenshot file not found: {screenshot_path}")
-        
+        self._require_screenshot(screenshot_path)
+
         # Call Vision API with all relevant images
         score_data = self._call_openai_for_scoring(
-            prompt_payload=prompt_payload,
+            prompt_sections=prompt_sections,
             screenshot_path=screenshot_path,
             reference_image=reference_image,
             asset_images=[img.path for img in image_list],
         )
-        
-        log_ai_response(logger, "SCORE SLIDE", f"Received scores: {score_data.to_dict()}", request_id="scoring")
+
+        log_ai_response(logger, "SCORE SLIDE", "Received scores: %s", score_data.to_dict(), request_id="scoring")
+        return score_data
+
+    async def ascore_slide(
+        self,
+        prompt: str,
+        images: Iterable[ImageInput],
+        screenshot_path: Optional[Path],
+        reference_image: Optional[Path],
+    ) -> ScoreBreakdown:
+        """Coroutine form of :meth:`score_slide`."""
+        image_list = list(images)
+        if self._config.mock_mode or not self._aclient:
+            return self.score_slide(prompt, image_list, screenshot_path, reference_image)
+
+        prompt_sections = self._score_slide_payload(prompt, image_list, screenshot_path, reference_image)
+        prompt_payload = prompt_sections.text
+        log_ai_request(logger=logger, operation="SCORE SLIDE", prompt=prompt_payload, reference_image=reference_image, model=self._scoring_model())
+        self._require_screenshot(screenshot_path)
+        score_data = await self._acall_openai_for_scoring(
+            prompt_sections=prompt_sections,
+            screenshot_path=screenshot_path,
+            reference_image=reference_image,
+            asset_images=[img.path for img in image_list],
+        )
+        log_ai_response(logger, "SCORE SLIDE", "Received scores: %s", score_data.to_dict(), request_id="scoring")
         return score_data
 
+    def generate_initial_candidates(
+            self,
+            prompt: str,
+            reference_image: Optional[Path] = None,
+            image_assets: Iterable[ImageInput] = (),
+            num_candidates: int = 1) -> list[ScriptGenerationResult]:
+        """Generate several independent initial scripts from one prompt.
+
+        Standard chat models sample every candidate in a single request (``n``), so the
+        prompt is uploaded and prefilled once. Reasoning models reject ``n > 1`` and get
+        one request per candidate instead.
+        """
+        if num_candidates <= 1:
+            return [self.generate_initial_script(prompt, reference_image, image_assets)]
+
+        operation = f"GENERATE INITIAL SCRIPT ({num_candidates} candidates)"
+        prompt_sections = self._initial_script_payload(prompt, image_assets)
+        prompt_payload = prompt_sections.text
+
+        log_ai_request(logger=logger, operation=operation, prompt=prompt_payload, reference_image=reference_image, model=self._config.default_model)
+
+        if self._config.mock_mode or not self._client:
+            logger.info("Using mock mode for candidate generation")
+            candidates = [
+                (
+                    self._mock_render_script(prompt=prompt, reference_image=reference_image, iteration_tag=f"initial_candidate_{index}"),
+                    self._mock_request_id(prompt_sections, f"#{index}"),
+                )
+                for index in range(1, num_candidates + 1)
+            ]
+        else:
+            candidates = self._call_openai_for_candidates(prompt_sections, reference_image, num_candidates)
+
+        log_ai_response(logger, operation, "Generated %d candidate scripts", len(candidates), request_id=candidates[0][1])
+        return [ScriptGenerationResult(script=script, request_id=request_id, prompt_payload=prompt_payload) for script, request_id in candidates]
+
+    def submit_script_batch(self, requests: Sequence[SlideRequest]) -> ScriptBatch:
+        """Queue initial-script generation for several slides as one Batch API job.
+
+        Batch jobs are billed at a discount and draw on a separate rate-limit pool,
+        but may take up to 24 hours, so they suit non-interactive deck generation.
+        Collect the scripts with :meth:`wait_for_batch`.
+        """
+        self._require_batch_client()
+        prompt_payloads: list[str] = []
+        bodies: list[dict[str, object]] = []
+        for request in requests:
+            prompt_sections = self._initial_script_payload(request.prompt, request.images)
+            prompt_payloads.append(prompt_sections.text)
+            bodies.append(self._vision_request(prompt_sections, request.reference_image, None))
+        batch_id = self._submit_batch(bodies)
+        logger.info("Submitted script batch %s with %d requests", batch_id, len(bodies))
+        return ScriptBatch(batch_id=batch_id, prompt_payloads=prompt_payloads)
+
+    def wait_for_batch(self, batch: ScriptBatch, poll_interval: float = 30.0) -> list[ScriptGenerationResult]:
+        """Poll a submitted batch until it finishes and return its scripts in request order.
+
+        Raises:
+            ValueError: If the client is not initialized or any request in the batch failed
+            RuntimeError: If the batch failed, expired or was cancelled
+        """
+        results: list[ScriptGenerationResult] = []
+        responses = self._batch_responses(batch.batch_id, len(batch.prompt_payloads), poll_interval)
+        for prompt_payload, response in zip(batch.prompt_payloads, responses):
+            script, request_id = self._script_from_response(response)
+            log_ai_response(logger, "GENERATE INITIAL SCRIPT (batch)", "Generated %d characters of script code", len(script), request_id=request_id)
+            results.append(ScriptGenerationResult(script=script, request_id=request_id, prompt_payload=prompt_payload))
+        return results
+
+    def submit_scoring_batch(self, items: Sequence[tuple[SlideRequest, Path]]) -> ScoringBatch:
+        """Queue scoring of several ``(request, screenshot)`` pairs as one Batch API job.
+
+        Each request's reference image and assets are attached as in :meth:`score_slide`.
+        Collect the scores with :meth:`wait_for_scoring_batch`.
+        """
+        self._require_batch_client()
+        bodies: list[dict[str, object]] = []
+        for request, screenshot_path in items:
+            prompt_sections = self._score_slide_payload(request.prompt, request.images, screenshot_path, request.reference_image)
+            bodies.append(self._scoring_request(
+                prompt_sections, screenshot_path, request.reference_image, [image.path for image in request.images]
+            ))
+        batch_id = self._submit_batch(bodies)
+        logger.info("Submitted scoring batch %s with %d requests", batch_id, len(bodies))
+        return ScoringBatch(batch_id=batch_id, size=len(bodies))
+
+    def wait_for_scoring_batch(self, batch: ScoringBatch, poll_interval: float = 30.0) -> list[ScoreBreakdown]:
+        """Poll a submitted scoring batch until it finishes and return scores in request order."""
+        responses = self._batch_responses(batch.batch_id, batch.size, poll_interval)
+        return [self._score_from_response(response) for response in responses]
+
+    def _require_batch_client(self) -> None:
+        if self._config.mock_mode or not self._client:
+            raise ValueError("Batch submission requires a configured OpenAI client")
+
+    def _batch_endpoint(self) -> str:
+        # Azure batch deployments take the path without the version prefix.
+        return "/chat/completions" if self._config.use_azure else "/v1/chat/completions"
+
+    def _submit_batch(self, bodies: Sequence[dict[str, object]]) -> str:
+        """Upload ``bodies`` as a JSONL batch input file and start the job; returns its id."""
+        endpoint = self._batch_endpoint()
+        lines = [
+            serialization.dumps({"custom_id": str(index), "method": "POST", "url": endpoint, "body": body})
+            for index, body in enumerate(bodies)
+        ]
+        input_file = self._client.files.create(file=("batch.jsonl", b"\n".join(lines)), purpose="batch")  # type: ignore[union-attr]
+        batch = self._client.batches.create(  # type: ignore[union-attr]
+            input_file_id=input_file.id,
+            endpoint=endpoint,  # type: ignore[arg-type]
+            completion_window="24h",
+        )
+        return batch.id
+
+    def _batch_responses(self, batch_id: str, size: int, poll_interval: float) -> list[ChatCompletion]:
+        """Wait for a batch to finish and return its ``size`` responses in request order."""
+        if not self._client:
+            raise ValueError("OpenAI client not initialized")
+
+        while True:
+            status = self._client.batches.retrieve(batch_id)
+            if status.status == "completed":
+                break
+            if status.status in _BATCH_FAILED_STATUSES:
+                raise RuntimeError(f"Batch {batch_id} ended with status {status.status}")
+            logger.debug("Batch %s is %s; polling again in %.0fs", batch_id, status.status, poll_interval)
+            time.sleep(poll_interval)
+
+        if not status.output_file_id:
+            raise ValueError(f"Batch {batch_id} produced no output")
+
+        responses: dict[str, ChatCompletion] = {}
+        for line in self._client.files.content(status.output_file_id).text.splitlines():
+            if not line.strip():
+                continue
+            record = serialization.loads(line)
+            response = record.get("response") or {}
+            if record.get("error") or response.get("status_code") != 200:
+                raise ValueError(f"Batch request {record.get('custom_id')} failed: {record.get('error') or response.get('body')}")
+            responses[record["custom_id"]] = ChatCompletion.model_validate(response["body"])
+
+        missing = [index for index in range(size) if str(index) not in responses]
+        if missing:
+            raise ValueError(f"Batch {batch_id} is missing a response for request {missing[0]}")
+        return [responses[str(index)] for index in range(size)]
+
+    def _initial_script_payload(self, prompt: str, image_assets: Iterable[ImageInput]) -> RenderedPrompt:
+        return self._render(
+            "initial_script",
+            slide_brief=prompt,
+            image_assets=self._format_images(image_assets),
+        )
+
+    def _fix_script_payload(
+        self,
+        prompt: str,
+        image_assets: Iterable[ImageInput],
+        failing_script: str,
+        errors: list[str],
+    ) -> RenderedPrompt:
+        error_log = "\n".join(errors) if errors else "No error details provided"
+        return self._render(
+            "fix_script",
+            prompt=prompt,
+            image_table=self._format_images(image_assets),
+            failing_script=failing_script,
+            error_log=error_log,
+        )
+
+    def _improve_script_payload(
+        self,
+        prompt: str,
+        image_assets: Iterable[ImageInput],
+        previous_script: str,
+        score_feedback: Optional[ScoreBreakdown],
+        iteration_index: int,
+        previous_screenshot: Optional[Path],
+    ) -> RenderedPrompt:
+        return self._render(
+            "improve_script",
+            prompt=prompt,
+            image_table=self._format_images(image_assets),
+            previous_script=previous_script,
+            score_feedback=self._format_score(score_feedback),
+            iteration_index=iteration_index,
+            previous_screenshot=str(previous_screenshot) if previous_screenshot else "None",
+        )
+
+    def _score_slide_payload(
+        self,
+        prompt: str,
+        image_list: list[ImageInput],
+        screenshot_path: Optional[Path],
+        reference_image: Optional[Path],
+    ) -> RenderedPrompt:
+        return self._render(
+            "score_slide",
+            prompt=prompt,
+            image_table=self._format_images(image_list),
+            screenshot_path=str(screenshot_path) if screenshot_path else "None",
+            reference_image=str(reference_image) if reference_image else "None",
+        )
+
+    @staticmethod
+    def _require_screenshot(screenshot_path: Optional[Path]) -> None:
+        if not screenshot_path:
+            raise ValueError("Screenshot path is required for slide scoring")
+
     def _mock_score_slide(
         self,
         prompt: str,
@@ -225,162 +854,290 @@ class OpenAIClient:
             aggregate=round(aggregate, 2),
             issues=mock_issues,
         )
-        
+
         logger.info("Score breakdown: %s", breakdown.to_dict())
         return breakdown
 
     def _call_openai_with_vision(
         self,
-        prompt_payload: str,
+        prompt_sections: RenderedPrompt,
         reference_image: Optional[Path] = None,
         previous_screenshot: Optional[Path] = None,
     ) -> tuple[str, str]:
         """Call OpenAI Vision API with text prompt and optional images.
-        
+
         Supports both standard chat models (with temperature) and reasoning models
         (o1, o3) which use reasoning_effort instead.
-        
+
         Args:
-            prompt_payload: The text prompt to send
+            prompt_sections: Rendered prompt; the static prefix is sent in the system message
             reference_image: Optional reference image to match
             previous_screenshot: Optional screenshot from previous iteration
-            
+
         Returns:
             Tuple of (generated_script, request_id)
-            
+
         Raises:
             ValueError: If OpenAI client not initialized
             Exception: If API call fails
         """
         if not self._client:
             raise ValueError("OpenAI client not initialized")
-        
+        self._prewarm_connection()
+
         logger.info("Calling OpenAI Vision API with model: %s", self._config.default_model)
-        
+
         try:
-            # Build message content with text and images
-            content: list[dict[str, object]] = [{"type": "text", "text": prompt_payload}]
-            
-            # Add reference image if provided
-            if reference_image and reference_image.exists():
-                logger.debug("Encoding reference image: %s (size: %d bytes)", 
-                           reference_image, reference_image.stat().st_size)
-                base64_image = self._encode_image(reference_image)
-                mime_type = self._get_image_mime_type(reference_image)
-                content.append({
-                    "type": "image_url",
-                    "image_url": {
-                        "url": f"data:{mime_type};base64,{base64_image}",
-                        "detail": "high"
-                    }
-                })
-                content.append({
-                    "type": "text",
-                    "text": "^ This is the reference image to match."
-                })
-            elif reference_image:
-                logger.warning("Reference image does not exist: %s", reference_image)
-            
-            # Add previous screenshot if provided
-            if previous_screenshot and previous_screenshot.exists():
-                logger.debug("Encoding previous screenshot: %s (size: %d bytes)", 
-                           previous_screenshot, previous_screenshot.stat().st_size)
-                base64_image = self._encode_image(previous_screenshot)
-                mime_type = self._get_image_mime_type(previous_screenshot)
-                content.append({
-                    "type": "image_url",
-                    "image_url": {
-                        "url": f"data:{mime_type};base64,{base64_image}",
-                        "detail": "high"
-                    }
-                })
-                content.append({
-                    "type": "text",
-                    "text": "^ This is the previous screenshot from the last iteration."
-                })
-            elif previous_screenshot:
-                logger.warning("Previous screenshot does not exist: %s", previous_screenshot)
-            
-            # Build API parameters
-            # For Azure OpenAI, use deployment name if provided, otherwise use default_model
-            model_name = self._config.azure_deployment if self._config.use_azure and self._config.azure_deployment else self._config.default_model
-            
-            api_params: dict[str, object] = {
-                "model": model_name,
-                "messages": [
-                    {"role": "system", "content": "You are an expert Python developer. Return only executable Python code."},
-                    {"role": "user", "content": content}
-                ],
-            }
-            
-            # Configure parameters based on model type
-            # Check both the configured model name and the actual deployment/model being used
-            is_reasoning = self._is_reasoning_model(self._config.default_model) or self._is_reasoning_model(model_name)
-            
-            if is_reasoning:
-                # Reasoning models (o1, o3, gpt-5) don't support custom temperature
-                # but do support reasoning_effort
-                api_params["reasoning_effort"] = self._config.reasoning_effort
-                logger.info("Using reasoning model with effort: %s", self._config.reasoning_effort)
-            else:
-                # Non-reasoning models support temperature
-                api_params["temperature"] = 0.3
-            
-            response = self._client.chat.completions.create(**api_params)  # type: ignore[arg-type]
-            
-            # Extract response content
-            if not response.choices:
-                raise ValueError("No choices in API response")
-            
-            script = response.choices[0].message.content or ""
-            request_id = response.id
-            
-            # Log usage statistics if available
-            if hasattr(response, 'usage') and response.usage:
-                logger.info(
-                    "OpenAI API call successful. Request ID: %s, "
-                    "Tokens: prompt=%d, completion=%d, total=%d, Response length: %d chars",
-                    request_id,
-                    response.usage.prompt_tokens,
-                    response.usage.completion_tokens,
-                    response.usage.total_tokens,
-                    len(script)
-                )
+            api_params = self._vision_request(prompt_sections, reference_image, previous_screenshot)
+            cache_key, cached = self._cached_response(api_params)
+            if cached:
+                return cached
+            response = self._create_completion(api_params)
+            result = self._script_from_response(response)
+            if cache_key:
+                self._response_cache.put(cache_key, *result)  # type: ignore[union-attr]
+            return result
+        except Exception as error:
+            logger.error("OpenAI API call failed: %s", error)
+            raise
+
+    async def _acall_openai_with_vision(
+        self,
+        prompt_sections: RenderedPrompt,
+        reference_image: Optional[Path] = None,
+        previous_screenshot: Optional[Path] = None,
+    ) -> tuple[str, str]:
+        """Async counterpart of :meth:`_call_openai_with_vision`.
+
+        Images are encoded off the event loop, and the request waits for a free
+        concurrency slot before it is sent.
+        """
+        if not self._aclient:
+            raise ValueError("OpenAI client not initialized")
+
+        logger.info("Calling OpenAI Vision API with model: %s", self._config.default_model)
+
+        try:
+            api_params = await asyncio.to_thread(self._vision_request, prompt_sections, reference_image, previous_screenshot)
+            cache_key, cached = await asyncio.to_thread(self._cached_response, api_params)
+            if cached:
+                return cached
+            async with self._request_slot():
+                response = await self._acreate_completion(api_params)
+            result = self._script_from_response(response)
+            if cache_key:
+                await asyncio.to_thread(self._response_cache.put, cache_key, *result)  # type: ignore[union-attr]
+            return result
+        except Exception as error:
+            logger.error("OpenAI API call failed: %s", error)
+            raise
+
+    def _call_openai_for_candidates(
+        self,
+        prompt_sections: RenderedPrompt,
+        reference_image: Optional[Path],
+        num_candidates: int,
+    ) -> list[tuple[str, str]]:
+        """Request ``num_candidates`` scripts for the same prompt; returns (script, request_id) pairs."""
+        if not self._client:
+            raise ValueError("OpenAI client not initialized")
+        self._prewarm_connection()
+
+        logger.info("Calling OpenAI Vision API for %d candidates with model: %s", num_candidates, self._config.default_model)
+
+        try:
+            api_params = self._vision_request(prompt_sections, reference_image, None)
+            # The whole candidate set is cached as one entry, keyed with ``n`` so it
+            # never collides with a single-script request for the same prompt.
+            cache_key, cached = self._cached_response({**api_params, "n": num_candidates})
+            if cached:
+                return [(script, request_id) for script, request_id in serialization.loads(cached[0])]  # type: ignore[union-attr]
+            if "reasoning_effort" in api_params:
+                # Reasoning models only return a single choice per request.
+                candidates = [
+                    self._script_from_response(self._create_completion(api_params))
+                    for _ in range(num_candidates)
+                ]
             else:
-                logger.info("OpenAI API call successful. Request ID: %s, Response length: %d chars", 
-                          request_id, len(script))
-            
-            # Extract code from markdown code blocks if present
-            script = self._extract_code_from_markdown(script)
-            
-            if not script:
-                logger.error("Extracted script is empty after processing")
-                raise ValueError("OpenAI returned empty script")
-            
-            logger.info("Extracted code length: %d chars", len(script))
-            return script, request_id
+                candidates = self._candidates_from_response(self._create_completion({**api_params, "n": num_candidates}))
+            if cache_key:
+                self._response_cache.put(cache_key, serialization.dumps(candidates).decode("utf-8"), candidates[0][1])  # type: ignore[union-attr]
+            return candidates
         except Exception as error:
-            logger.error("OpenAI API call failed: %s", error, exc_info=True)
+            logger.error("OpenAI API call failed: %s", error)
             raise
 
+    def _cached_response(self, api_params: dict[str, object]) -> tuple[Optional[str], Optional[tuple[str, str]]]:
+        """Look a request up in the response cache; returns ``(cache_key, hit)``."""
+        if not self._response_cache:
+            return None, None
+        cache_key = self._response_cache.key(api_params)
+        cached = self._response_cache.get(cache_key)
+        if cached:
+            logger.info("Response cache hit for request %s (%d chars)", cached[1], len(cached[0]))
+        return cache_key, cached
+
+    def _create_completion(self, api_params: dict[str, object]) -> Any:
+        """Send a chat completion with the sync client."""
+        return self._client.chat.completions.create(**api_params)  # type: ignore[arg-type, union-attr]
+
+    async def _acreate_completion(self, api_params: dict[str, object]) -> Any:
+        """Async counterpart of :meth:`_create_completion`, paced by the rate limiter.
+
+        A 429 pauses the limiter for the server's ``Retry-After`` delay, holding back
+        every queued request rather than only the one that was rejected, then retries.
+        """
+        if not self._rate_limiter:
+            return await self._asend_completion(api_params)
+
+        tokens = estimate_tokens(api_params)
+        attempt = 0
+        while True:
+            await self._rate_limiter.acquire(tokens)
+            try:
+                return await self._asend_completion(api_params)
+            except RateLimitError as error:
+                if attempt >= _RATE_LIMIT_RETRIES:
+                    raise
+                delay = retry_after_seconds(error, attempt)
+                logger.warning("Rate limited by the API; retrying in %.1fs", delay)
+                self._rate_limiter.pause(delay)
+                attempt += 1
+
+    async def _asend_completion(self, api_params: dict[str, object]) -> Any:
+        return await self._loop_client().chat.completions.create(**api_params)  # type: ignore[arg-type]
+
+    def _vision_request(
+        self,
+        prompt_sections: RenderedPrompt,
+        reference_image: Optional[Path],
+        previous_screenshot: Optional[Path],
+    ) -> dict[str, object]:
+        """Build the chat completion parameters for a script generation call."""
+        # Content is ordered from most to least stable so repeated calls share the
+        # longest possible cached prefix: the reference image is the same on every
+        # iteration, while the previous screenshot changes each time.
+        content: list[dict[str, object]] = []
+        reference_part, screenshot_part = self._image_parts(
+            reference_image, previous_screenshot, max_dim=self._config.vision_max_dim, detail=self._config.image_detail
+        )
+
+        # Add reference image if provided
+        if reference_part:
+            logger.debug("Attaching reference image: %s", reference_image)
+            content.append(reference_part)
+            content.append({
+                "type": "text",
+                "text": "^ This is the reference image to match."
+            })
+        elif reference_image:
+            logger.warning("Reference image does not exist: %s", reference_image)
+
+        content.append({"type": "text", "text": prompt_sections.dynamic_suffix})
+
+        # Add previous screenshot if provided
+        if screenshot_part:
+            logger.debug("Attaching previous screenshot: %s", previous_screenshot)
+            content.append(screenshot_part)
+            content.append({
+                "type": "text",
+                "text": "^ This is the previous screenshot from the last iteration."
+            })
+        elif previous_screenshot:
+            logger.warning("Previous screenshot does not exist: %s", previous_screenshot)
+
+        # Build API parameters
+        # For Azure OpenAI, use deployment name if provided, otherwise use default_model
+        system_message = self._system_message(_GENERATION_ROLE, prompt_sections)
+        return {
+            "model": self._generation_model,
+            "messages": [
+                {"role": "system", "content": system_message},
+                {"role": "user", "content": content}
+            ],
+            **self._prompt_cache_params(system_message),
+            **self._generation_sampling,
+        }
+
+    def _script_from_response(self, response: Any) -> tuple[str, str]:
+        """Extract the generated script and request id from a chat completion."""
+        # Extract response content
+        if not response.choices:
+            raise ValueError("No choices in API response")
+
+        script = response.choices[0].message.content or ""
+        request_id = response.id
+
+        # Log usage statistics if available
+        if hasattr(response, 'usage') and response.usage:
+            logger.info(
+                "OpenAI API call successful. Request ID: %s, "
+                "Tokens: prompt=%d, completion=%d, total=%d, Response length: %d chars",
+                request_id,
+                response.usage.prompt_tokens,
+                response.usage.completion_tokens,
+                response.usage.total_tokens,
+                len(script)
+            )
+        else:
+            logger.info("OpenAI API call successful. Request ID: %s, Response length: %d chars",
+                      request_id, len(script))
+
+        # Extract code from markdown code blocks if present
+        script = self._extract_code_from_markdown(script)
+
+        if not script:
+            logger.error("Extracted script is empty after processing")
+            raise ValueError("OpenAI returned empty script")
+
+        logger.info("Extracted code length: %d chars", len(script))
+        return script, request_id
+
+    def _candidates_from_response(self, response: Any) -> list[tuple[str, str]]:
+        """Extract every non-empty script from an ``n > 1`` chat completion."""
+        if not response.choices:
+            raise ValueError("No choices in API response")
+
+        if getattr(response, "usage", None):
+            logger.info(
+                "OpenAI API call successful. Request ID: %s, Choices: %d, Tokens: prompt=%d, completion=%d, total=%d",
+                response.id,
+                len(response.choices),
+                response.usage.prompt_tokens,
+                response.usage.completion_tokens,
+                response.usage.total_tokens,
+            )
+
+        candidates: list[tuple[str, str]] = []
+        for choice in response.choices:
+            script = self._extract_code_from_markdown(choice.message.content or "")
+            if script:
+                candidates.append((script, f"{response.id}:{choice.index}"))
+            else:
+                logger.warning("Candidate %d of %s is empty; skipping it", choice.index, response.id)
+
+        if not candidates:
+            raise ValueError("OpenAI returned no usable scripts")
+        return candidates
+
     def _call_openai_for_scoring(
         self,
-        prompt_payload: str,
+        prompt_sections: RenderedPrompt,
         screenshot_path: Path,
         reference_image: Optional[Path],
         asset_images: list[Path],
     ) -> ScoreBreakdown:
         """Call OpenAI Vision API to score a slide.
-        
+
         Args:
-            prompt_payload: The scoring prompt with criteria
+            prompt_sections: The scoring prompt; criteria in the static prefix, brief in the suffix
             screenshot_path: Screenshot of the generated slide (required)
             reference_image: Optional reference image to compare against
             asset_images: List of user-provided image assets
-            
+
         Returns:
             ScoreBreakdown with scores and improvement issues
-            
+
         Raises:
             ValueError: If OpenAI client not initialized, screenshot missing, or response invalid
             FileNotFoundError: If screenshot file doesn't exist
@@ -388,135 +1145,278 @@ class OpenAIClient:
         """
         if not self._client:
             raise ValueError("OpenAI client not initialized")
-        
-        if not screenshot_path.exists():
-            raise FileNotFoundError(f"Screenshot file not found: {screenshot_path}")
-        
-        logger.info("Calling OpenAI Vision API for scoring with model: %s", self._config.default_model)
-        
+        self._prewarm_connection()
+
+        logger.info("Calling OpenAI Vision API for scoring with model: %s", self._scoring_model())
+
         try:
-            # Build message content with text and all relevant images
-            content: list[dict[str, object]] = [{"type": "text", "text": prompt_payload}]
-            
-            # Add screenshot (required - the main subject to score)
-            logger.debug("Encoding slide screenshot: %s", screenshot_path)
-            base64_image = self._encode_image(screenshot_path)
-            mime_type = self._get_image_mime_type(screenshot_path)
+            api_params = self._scoring_request(prompt_sections, screenshot_path, reference_image, asset_images)
+            cache_key, cached = self._cached_response(api_params)
+            if cached:
+                return self._score_from_text(cached[0])
+            response = self._create_completion(api_params)
+            return self._score_and_cache(response, cache_key)
+        except Exception as error:
+            logger.error("Scoring API call failed: %s", error)
+            raise
+
+    async def _acall_openai_for_scoring(
+        self,
+        prompt_sections: RenderedPrompt,
+        screenshot_path: Path,
+        reference_image: Optional[Path],
+        asset_images: list[Path],
+    ) -> ScoreBreakdown:
+        """Async counterpart of :meth:`_call_openai_for_scoring`."""
+        if not self._aclient:
+            raise ValueError("OpenAI client not initialized")
+
+        logger.info("Calling OpenAI Vision API for scoring with model: %s", self._scoring_model())
+
+        try:
+            api_params = await asyncio.to_thread(self._scoring_request, prompt_sections, screenshot_path, reference_image, asset_images)
+            cache_key, cached = await asyncio.to_thread(self._cached_response, api_params)
+            if cached:
+                return self._score_from_text(cached[0])
+            async with self._request_slot():
+                response = await self._acreate_completion(api_params)
+            return self._score_and_cache(response, cache_key)
+        except Exception as error:
+            logger.error("Scoring API call failed: %s", error)
+            raise
+
+    def _scoring_request(
+        self,
+        prompt_sections: RenderedPrompt,
+        screenshot_path: Path,
+        reference_image: Optional[Path],
+        asset_images: Sequence[Path] = (),
+    ) -> dict[str, object]:
+        """Build the chat completion parameters for a scoring call.
+
+        Asset images are attached only when ``score_with_assets`` is enabled; they
+        are encoded in the same concurrent batch as the reference and screenshot.
+        """
+        # Stable inputs go first so repeated scoring calls share a cached prefix:
+        # the reference image and assets, then the brief, then the screenshot being scored.
+        content: list[dict[str, object]] = []
+        attached_assets = list(asset_images) if self._config.score_with_assets else []
+        reference_part, screenshot_part, *asset_parts = self._image_parts(
+            reference_image, screenshot_path, *attached_assets, max_dim=self._config.vision_max_dim, detail=self._config.image_detail
+        )
+        if screenshot_part is None:
+            raise FileNotFoundError(f"Screenshot file not found: {screenshot_path}")
+
+        # Add reference image if provided
+        if reference_part:
+            logger.debug("Attaching reference image: %s", reference_image)
+            content.append(reference_part)
             content.append({
-                "type": "image_url",
-                "image_url": {
-                    "url": f"data:{mime_type};base64,{base64_image}",
-                    "detail": "high"
-                }
+                "type": "text",
+                "text": "^ This is the reference image to compare layout and style against."
             })
+        elif reference_image:
+            logger.warning("Reference image does not exist: %s", reference_image)
+
+        for asset_path, asset_part in zip(attached_assets, asset_parts):
+            if asset_part:
+                content.append(asset_part)
+            else:
+                logger.warning("Asset image does not exist: %s", asset_path)
+        if any(asset_parts):
             content.append({
                 "type": "text",
-                "text": "^ This is the generated slide to evaluate."
+                "text": "^ These are the image assets the slide was asked to use."
             })
-            
-            # Add reference image if provided
-            if reference_image and reference_image.exists():
-                logger.debug("Encoding reference image: %s", reference_image)
-                base64_image = self._encode_image(reference_image)
-                mime_type = self._get_image_mime_type(reference_image)
-                content.append({
-                    "type": "image_url",
-                    "image_url": {
-                        "url": f"data:{mime_type};base64,{base64_image}",
-                        "detail": "high"
-                    }
-                })
-                content.append({
-                    "type": "text",
-                    "text": "^ This is the reference image to compare layout and style against."
-                })
-            
-            # Build API parameters for JSON response
-            model_name = self._config.azure_deployment if self._config.use_azure and self._config.azure_deployment else self._config.default_model
-            
-            api_params: dict[str, object] = {
-                "model": model_name,
-                "messages": [
-                    {"role": "system", "content": "You are an expert presentation evaluator. Analyze slides objectively and return only valid JSON."},
-                    {"role": "user", "content": content}
-                ],
-                "response_format": {"type": "json_object"},
-            }
-            
-            # Configure parameters based on model type
-            is_reasoning = self._is_reasoning_model(self._config.default_model) or self._is_reasoning_model(model_name)
-            
-            if is_reasoning:
-                api_params["reasoning_effort"] = self._config.reasoning_effort
-                logger.info("Using reasoning model for scoring with effort: %s", self._config.reasoning_effort)
-            else:
-                api_params["temperature"] = 0.3
-            
-            response = self._client.chat.completions.create(**api_params)  # type: ignore[arg-type]
-            
-            if not response.choices:
-                raise ValueError("No choices in API response")
-            
-            response_text = response.choices[0].message.content or ""
-            request_id = response.id
-            
-            logger.info("Scoring API call successful. Request ID: %s", request_id)
-            
-            # Parse JSON response
-            import json
-            score_json = json.loads(response_text)
-            
-            # Extract scores and issues
-            completeness = float(score_json.get("completeness", 0))
-            content_accuracy = float(score_json.get("content_accuracy", 0))
-            layout_match = float(score_json.get("layout_match", 0))
-            visual_quality = float(score_json.get("visual_quality", 0))
-            issues = score_json.get("issues", [])
-            
-            # Ensure issues is a list of strings
-            if not isinstance(issues, list):
-                issues = [str(issues)]
-            else:
-                issues = [str(issue) for issue in issues]
-            
-            aggregate = (completeness + content_accuracy + layout_match + visual_quality) / 4
-            
-            return ScoreBreakdown(
-                completeness=round(completeness, 2),
-                content_accuracy=round(content_accuracy, 2),
-                layout_match=round(layout_match, 2),
-                visual_quality=round(visual_quality, 2),
-                aggregate=round(aggregate, 2),
-                issues=issues,
-            )
-            
+
+        content.append({"type": "text", "text": prompt_sections.dynamic_suffix})
+
+        # Add screenshot (required - the main subject to score)
+        logger.debug("Attaching slide screenshot: %s", screenshot_path)
+        content.append(screenshot_part)
+        content.append({
+            "type": "text",
+            "text": "^ This is the generated slide to evaluate."
+        })
+
+        # Build API parameters for JSON response
+        system_message = self._system_message(_SCORING_ROLE, prompt_sections)
+        return {
+            "model": self._scoring_model(),
+            "messages": [
+                {"role": "system", "content": system_message},
+                {"role": "user", "content": content}
+            ],
+            "response_format": _SCORE_RESPONSE_FORMAT,
+            **self._prompt_cache_params(system_message),
+            **self._scoring_sampling,
+        }
+
+    def _scoring_model(self) -> str:
+        """Model (or Azure deployment) used for scoring; falls back to the generation model."""
+        if self._config.scoring_model:
+            return self._config.scoring_model
+        return self._config.azure_deployment if self._config.use_azure and self._config.azure_deployment else self._config.default_model
+
+    def _prompt_cache_params(self, system_message: str) -> dict[str, object]:
+        """Route requests sharing a system prompt to the same OpenAI prompt cache.
+
+        OpenAI caches prefixes automatically, but a ``prompt_cache_key`` keeps
+        requests with the same prefix on the same cache shard, raising the hit
+        rate. Azure deployments do not accept the parameter.
+        """
+        if self._config.use_azure:
+            return {}
+        return {"prompt_cache_key": _prompt_cache_key(system_message)}
+
+    @staticmethod
+    def _system_message(role: str, prompt_sections: RenderedPrompt) -> str:
+        """Combine the role line with the template's static prefix.
+
+        The result depends only on the template, so it is byte-identical across
+        requests and forms the cacheable prefix of every call.
+        """
+        return _system_content(role, prompt_sections.static_prefix)
+
+    @staticmethod
+    def _score_from_response(response: Any) -> ScoreBreakdown:
+        """Parse the JSON scores returned by a scoring call."""
+        return OpenAIClient._score_from_text(OpenAIClient._scoring_text(response)[0])
+
+    def _score_and_cache(self, response: Any, cache_key: Optional[str]) -> ScoreBreakdown:
+        """Parse a scoring response, caching its text once it is known to be valid."""
+        response_text, request_id = self._scoring_text(response)
+        score = self._score_from_text(response_text)
+        if cache_key:
+            self._response_cache.put(cache_key, response_text, request_id)  # type: ignore[union-attr]
+        return score
+
+    @staticmethod
+    def _scoring_text(response: Any) -> tuple[str, str]:
+        if not response.choices:
+            raise ValueError("No choices in API response")
+        logger.info("Scoring API call successful. Request ID: %s", response.id)
+        return response.choices[0].message.content or "", response.id
+
+    @staticmethod
+    def _score_from_text(response_text: str) -> ScoreBreakdown:
+        # Parse JSON response
+        try:
+            score_json = serialization.loads(response_text)
         except json.JSONDecodeError as error:
             logger.error("Failed to parse scoring JSON response: %s", error)
             raise ValueError(f"Invalid JSON response from scoring API: {error}") from error
-        except Exception as error:
-            logger.error("Scoring API call failed: %s", error, exc_info=True)
-            raise
-    
-    @staticmethod
-    def _encode_image(image_path: Path) -> str:
-        """Encode image to base64 string.
+
+        # Extract scores and issues
+        completeness = float(score_json.get("completeness", 0))
+        content_accuracy = float(score_json.get("content_accuracy", 0))
+        layout_match = float(score_json.get("layout_match", 0))
+        visual_quality = float(score_json.get("visual_quality", 0))
+        issues = score_json.get("issues", [])
+
+        # Ensure issues is a list of strings
+        if not isinstance(issues, list):
+            issues = [str(issues)]
+        else:
+            issues = [str(issue) for issue in issues]
+
+        aggregate = (completeness + content_accuracy + layout_match + visual_quality) / 4
+
+        return ScoreBreakdown(
+            completeness=round(completeness, 2),
+            content_accuracy=round(content_accuracy, 2),
+            layout_match=round(layout_match, 2),
+            visual_quality=round(visual_quality, 2),
+            aggregate=round(aggregate, 2),
+            issues=issues,
+        )
+
+    async def aclose(self) -> None:
+        """Close the running event loop's async client.
+
+        Call this before a loop that sent requests ends; a later loop gets a fresh client.
+        """
+        client = self._aclients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.close()
+
+    def _loop_client(self) -> AsyncOpenAI | AsyncAzureOpenAI:
+        """Async client for the running event loop, with its own connection pool."""
+        loop = asyncio.get_running_loop()
+        client = self._aclients.get(loop)
+        if client is None:
+            if self._aclient_claimed:
+                client = self._aclient.with_options(http_client=DefaultAsyncHttpxClient(http2=_HTTP2_AVAILABLE))  # type: ignore[union-attr]
+            else:
+                client = self._aclient
+                self._aclient_claimed = True
+            self._aclients[loop] = client  # type: ignore[assignment]
+        return client  # type: ignore[return-value]
+
+    def _request_slot(self) -> asyncio.Semaphore:
+        """Semaphore bounding in-flight async requests on the running event loop."""
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(self._config.max_concurrency)
+        return semaphore
+
+    @classmethod
+    def _image_parts(cls, *image_paths: Optional[Path], max_dim: int = 0, detail: str = "high") -> list[Optional[dict[str, object]]]:
+        """Build image parts for ``image_paths``, reading and encoding them concurrently.
+
+        ``None`` entries and missing files map to ``None`` so callers can unpack the
+        result positionally. Existence is not checked up front: the single ``stat`` in
+        :meth:`_image_data_url` doubles as the check.
+        """
+        present = list(dict.fromkeys(path for path in image_paths if path is not None))
+        if len(present) > 1:
+            parts = dict(zip(present, _encoding_pool().map(cls._existing_image_part, present, repeat(max_dim), repeat(detail))))
+        else:
+            parts = {path: cls._existing_image_part(path, max_dim, detail) for path in present}
+        return [parts[path] if path is not None else None for path in image_paths]
+
+    @classmethod
+    def _existing_image_part(cls, image_path: Path, max_dim: int, detail: str) -> Optional[dict[str, object]]:
+        try:
+            return cls._image_part(image_path, max_dim, detail)
+        except FileNotFoundError:
+            return None
+
+    @classmethod
+    def _image_part(cls, image_path: Path, max_dim: int = 0, detail: str = "high") -> dict[str, object]:
+        """Build an ``image_url`` content part for ``image_path`` at the given vision ``detail``."""
+        return {"type": "image_url", "image_url": {"url": cls._image_data_url(image_path, max_dim), "detail": detail}}
+
+    @classmethod
+    def _image_data_url(cls, image_path: Path, max_dim: int = 0) -> str:
+        """Return the image as a base64 ``data:`` URL.
+        
+        Chat Completions only accepts image parts as URLs, so images are inlined.
+        URLs are cached by content SHA-256 (itself cached per path, mtime and size),
+        so the reference image is encoded once rather than on every improvement or
+        scoring call, even when it has been copied to a new path.
         
         Args:
             image_path: Path to the image file
+            max_dim: If non-zero, larger images are downscaled to this long side
             
         Returns:
-            Base64 encoded string of the image
+            ``data:<mime>;base64,...`` URL of the image
             
         Raises:
             FileNotFoundError: If image file doesn't exist
             IOError: If image cannot be read
         """
-        if not image_path.exists():
-            raise FileNotFoundError(f"Image file not found: {image_path}")
+        try:
+            stat = image_path.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Image file not found: {image_path}") from None
         
         try:
-            with open(image_path, "rb") as image_file:
-                return base64.b64encode(image_file.read()).decode("utf-8")
+            path = str(image_path)
+            digest = _file_sha256(path, stat.st_mtime_ns, stat.st_size)
+            return _encode_data_url(path, digest, stat.st_size, cls._get_image_mime_type(image_path), max_dim)
         except Exception as error:
             raise IOError(f"Failed to encode image {image_path}: {error}") from error
     
@@ -530,16 +1430,7 @@ class OpenAIClient:
         Returns:
             MIME type string (e.g., "image/png")
         """
-        ext = image_path.suffix.lower()
-        mime_types = {
-            ".png": "image/png",
-            ".jpg": "image/jpeg",
-            ".jpeg": "image/jpeg",
-            ".gif": "image/gif",
-            ".webp": "image/webp",
-            ".bmp": "image/bmp",
-        }
-        return mime_types.get(ext, "image/png")  # Default to PNG if unknown
+        return _IMAGE_MIME_TYPES.get(image_path.suffix.lower(), "image/png")  # Default to PNG if unknown
     
     @staticmethod
     def _is_reasoning_model(model: str) -> bool:
@@ -555,16 +1446,15 @@ class OpenAIClient:
         Returns:
             True if the model is a reasoning model, False otherwise
         """
-        # Reasoning models include o1, o3, gpt-5, and their variants
-        reasoning_model_prefixes = ("o1", "o3", "gpt-5")
-        return any(model.startswith(prefix) for prefix in reasoning_model_prefixes)
+        return model.startswith(_REASONING_MODEL_PREFIXES)
     
     @staticmethod
     def _extract_code_from_markdown(text: str) -> str:
         """Extract Python code from markdown code blocks.
         
-        Handles both ```python and ``` code blocks. If no code blocks are found,
-        returns the original text (assuming it's already pure code).
+        Handles ```python, ```py and bare ``` blocks; blocks fenced for other
+        languages (e.g. ```bash usage notes) are ignored. If no Python block is
+        found, returns the original text (assuming it's already pure code).
         
         Args:
             text: Response text that may contain markdown code blocks
@@ -572,28 +1462,9 @@ class OpenAIClient:
         Returns:
             Extracted Python code
         """
-        lines = text.split("\n")
-        in_code_block = False
-        code_lines: list[str] = []
-        found_code_block = False
-        
-        for line in lines:
-            stripped = line.strip()
-            
-            # Check for code block markers
-            if stripped.startswith("```python") or stripped.startswith("```"):
-                in_code_block = not in_code_block
-                if not in_code_block:
-                    found_code_block = True
-                continue
-            
-            # Add lines that are inside code blocks
-            if in_code_block:
-                code_lines.append(line)
-        
-        # If we found code blocks, return the extracted code
-        if found_code_block and code_lines:
-            return "\n".join(code_lines).strip()
+        blocks = [body.strip() for language, body in _CODE_BLOCK_RE.findall(text) if language.lower() in _PYTHON_FENCE_TAGS]
+        if any(blocks):
+            return "\n".join(block for block in blocks if block)
         
         # Otherwise, return original text (it's probably already pure code)
         return text.strip()
@@ -609,127 +1480,55 @@ class OpenAIClient:
         title = prompt_lines[0] if prompt_lines else "Auto Generated Slide"
         bullet_lines = prompt_lines[1:] if len(prompt_lines) > 1 else []
 
-        lines: list[str] = [
+        bullets = [f"    bullet_points.append({bullet_line!r})" for bullet_line in bullet_lines or ["Generated overview based on the prompt."]]
+        return "\n".join([
             f"# Auto generated script ({iteration_tag})",
-            "import argparse",
-            "import json",
-            "from pathlib import Path",
-            "from typing import Dict, Optional",
-            "",
-            "from pptx import Presentation",
-            "from pptx.util import Inches, Pt",
-            "",
-            "",
-            "def build_text_frame(slide, title_text, bullet_points):",
-            "    left = Inches(0.6)",
-            "    top = Inches(0.6)",
-            "    width = Inches(12.1)",
-            "    height = Inches(3.8)",
-            "    textbox = slide.shapes.add_textbox(left, top, width, height)",
-            "    text_frame = textbox.text_frame",
-            "    text_frame.text = title_text",
-            "    text_frame.paragraphs[0].font.size = Pt(40)",
-            "    text_frame.paragraphs[0].font.bold = True",
-            "    for bullet in bullet_points:",
-            "        paragraph = text_frame.add_paragraph()",
-            "        paragraph.text = bullet",
-            "        paragraph.level = 1",
-            "        paragraph.font.size = Pt(20)",
-            "",
-            "",
-            "def place_images(slide, image_map):",
-            "    image_specs = []",
-        ]
-
-
-        lines.extend(
-            [
-                "    if not image_specs:",
-                "        return",
-                "    base_left = Inches(0.5)",
-                "    base_top = Inches(4.5)",
-                "    spacing = Inches(0.3)",
-                "    image_width = Inches(2.8)",
-                "    image_height = Inches(2.2)",
-                "    max_per_row = max(1, min(3, len(image_specs)))",
-                "    for index, (name, path, description) in enumerate(image_specs):",
-                "        if not path:",
-                "            continue",
-                "        try:",
-                "            column = index % max_per_row",
-                "            row = index // max_per_row",
-                "            left = base_left + (image_width + spacing) * column",
-                "            top = base_top + (image_height + spacing) * row",
-                "            slide.shapes.add_picture(path, left, top, width=image_width, height=image_height)",
-                "            if description:",
-                "                caption_top = min(top + image_height + Inches(0.1), Inches(7.0))",
-                "                caption_box = slide.shapes.add_textbox(left, caption_top, image_width, Inches(0.6))",
-                "                caption_frame = caption_box.text_frame",
-                "                caption_frame.text = description",
-                "                caption_frame.paragraphs[0].font.size = Pt(12)",
-                "                caption_frame.paragraphs[0].font.italic = True",
-                "        except Exception as error:  # pylint: disable=broad-except",
-                "            print(f\"Failed to place image {name}: {error}\", flush=True)",
-                "",
-                "",
-                "def main(output_path: Path, image_map: Optional[Dict[str, str]] = None):",
-                "    image_map = image_map or {}",
-                "    presentation = Presentation()",
-                "    presentation.slide_width = Inches(13.33)",
-                "    presentation.slide_height = Inches(7.5)",
-                "    slide = presentation.slides.add_slide(presentation.slide_layouts[6])",
-                "    bullet_points = []",
-            ]
-        )
+            _MOCK_SCRIPT_HEAD,
+            *bullets,
+            f"    build_text_frame(slide, {title!r}, bullet_points)",
+            _MOCK_SCRIPT_TAIL,
+        ])
 
-        for bullet_line in bullet_lines or ["Generated overview based on the prompt."]:
-            lines.append(f"    bullet_points.append({bullet_line!r})")
-
-        lines.extend(
-            [
-                f"    build_text_frame(slide, {title!r}, bullet_points)",
-                "    place_images(slide, image_map)",
-                "    presentation.save(output_path)",
-                "",
-                "",
-                "def parse_args():",
-                '    parser = argparse.ArgumentParser(description="Generated slide authoring script")',
-                '    parser.add_argument("--output", required=True, type=Path)',
-                '    parser.add_argument("--images", required=False, type=Path)',
-                "    return parser.parse_args()",
-                "",
-                "",
-                "def load_image_map(images_path: Optional[Path]) -> Dict[str, str]:",
-                "    if not images_path or not images_path.exists():",
-                "        return {}",
-                "    with images_path.open(\"r\", encoding=\"utf-8\") as handle:",
-                "        return json.load(handle)",
-                "",
-                "",
-                "if __name__ == \"__main__\":",
-                "    args = parse_args()",
-                "    image_map = load_image_map(args.images)",
-                "    main(args.output, image_map)",
-            ]
-        )
+    @staticmethod
+    def _mock_request_id(prompt_sections: RenderedPrompt, suffix: str = "") -> str:
+        """Derive a stable id from the SHA-256 of the prompt text plus ``suffix``.
 
-        return "\n".join(lines)
+        The hash state after the static prefix is cached, so only the dynamic part
+        is hashed per call.
+        """
+        if prompt_sections.static_prefix and prompt_sections.dynamic_suffix:
+            digest = _prefix_sha256(prompt_sections.static_prefix).copy()
+            digest.update(f"{prompt_sections.dynamic_suffix}{suffix}".encode("utf-8"))
+        else:
+            digest = hashlib.sha256(f"{prompt_sections.text}{suffix}".encode("utf-8"))
+        return f"mock-{digest.hexdigest()[:12]}"
 
-    @staticmethod
-    def _mock_request_id(seed: str) -> str:
-        digest = hashlib.sha256(seed.encode("utf-8")).hexdigest()
-        return f"mock-{digest[:12]}"
+    def _render(self, name: str, **context: object) -> RenderedPrompt:
+        """Render a template, reusing the result for repeated identical arguments.
 
-    def _render_template(self, name: str, **context: object) -> str:
-        return self._prompt_store.render(name, **context)
+        Retries and fix attempts often re-send the same prompt; the key is a
+        BLAKE2 digest of the template name and context, so large scripts and
+        error logs are not kept twice as dictionary keys.
+        """
+        digest = hashlib.blake2b(name.encode("utf-8"), digest_size=16)
+        for key, value in sorted(context.items()):
+            for part in (key, str(value)):
+                encoded = part.encode("utf-8")
+                digest.update(len(encoded).to_bytes(8, "little"))
+                digest.update(encoded)
+        cache_key = digest.digest()
+        rendered = self._prompt_cache.get(cache_key)
+        if rendered is None:
+            rendered = self._prompt_store.render_sections(name, **context)
+            if len(self._prompt_cache) >= _PROMPT_CACHE_SIZE:
+                del self._prompt_cache[next(iter(self._prompt_cache))]
+            self._prompt_cache[cache_key] = rendered
+        return rendered
 
     @staticmethod
     def _format_images(images: Iterable[ImageInput]) -> str:
-        if not images:
-            return "(no images provided)"
-        lines = ["- {name}: {description} ({path})".format(name=image.name, description=image.description, path=image.path)
-                 for image in images]
-        return "\n".join(lines)
+        # Materialise once: the table is cached per tuple and one-shot iterables stay correct.
+        return _format_image_table(tuple(images))
 
     @staticmethod
     def _format_score(score: Optional[ScoreBreakdown]) -> str:
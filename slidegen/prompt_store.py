@@ -1,7 +1,39 @@
 from __future__ import annotations
 
+import string
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Hashable
+
+# Line in a template separating the invariant instructions from per-request content.
+DYNAMIC_MARKER = "<<<DYNAMIC>>>"
+
+
+@dataclass(frozen=True)
+class RenderedPrompt:
+    """A rendered template split at :data:`DYNAMIC_MARKER`.
+
+    ``static_prefix`` depends only on the template, so it is byte-identical across
+    requests and can be served from the provider's prompt cache.
+    """
+
+    static_prefix: str
+    dynamic_suffix: str
+
+    @property
+    def text(self) -> str:
+        return "\n\n".join(part for part in (self.static_prefix, self.dynamic_suffix) if part)
+
+
+@dataclass(frozen=True)
+class _CompiledTemplate:
+    """A template split at :data:`DYNAMIC_MARKER`, with its placeholders pre-parsed."""
+
+    static: str
+    dynamic: str
+    has_marker: bool
+    static_fields: tuple[str, ...]
+    uses_shared: bool
 
 
 class PromptStore:
@@ -12,6 +44,8 @@ class PromptStore:
         if not self._base_dir.exists():
             raise FileNotFoundError(f"Prompt directory not found: {self._base_dir}")
         self._cache: Dict[str, str] = {}
+        self._compiled: Dict[str, _CompiledTemplate] = {}
+        self._static_prefixes: Dict[tuple[Hashable, ...], str] = {}
 
     def get(self, name: str) -> str:
         template_name = self._normalize_name(name)
@@ -23,11 +57,44 @@ class PromptStore:
         return self._cache[template_name]
 
     def render(self, name: str, **context: object) -> str:
-        template = self.get(name)
+        return self.render_sections(name, **context).text
+
+    def render_sections(self, name: str, **context: object) -> RenderedPrompt:
+        """Render a template, keeping its static prefix apart from the dynamic suffix.
+
+        Templates without a marker are treated as entirely dynamic. The static
+        prefix is formatted once per distinct set of values it uses (normally just
+        the shared fragments), so repeat renders only format the dynamic part.
+        """
+        compiled = self._compile(name)
         # Auto-inject shared templates if referenced
-        if "{shared_" in template:
+        if compiled.uses_shared:
             context = self._inject_shared_templates(context)
-        return template.format(**context)
+        dynamic_suffix = compiled.dynamic.format(**context)
+        if not compiled.has_marker:
+            return RenderedPrompt(static_prefix="", dynamic_suffix=dynamic_suffix)
+        key = (compiled, *(context.get(field) for field in compiled.static_fields))
+        static_prefix = self._static_prefixes.get(key)
+        if static_prefix is None:
+            static_prefix = self._static_prefixes[key] = compiled.static.format(**context).rstrip("\n")
+        return RenderedPrompt(static_prefix=static_prefix, dynamic_suffix=dynamic_suffix.lstrip("\n"))
+
+    def _compile(self, name: str) -> _CompiledTemplate:
+        template_name = self._normalize_name(name)
+        compiled = self._compiled.get(template_name)
+        if compiled is None:
+            template = self.get(template_name)
+            static, marker, dynamic = template.partition(DYNAMIC_MARKER)
+            if not marker:
+                static, dynamic = "", template
+            compiled = self._compiled[template_name] = _CompiledTemplate(
+                static=static,
+                dynamic=dynamic,
+                has_marker=bool(marker),
+                static_fields=tuple(dict.fromkeys(field for _, field, _, _ in string.Formatter().parse(static) if field)),
+                uses_shared="{shared_" in template,
+            )
+        return compiled
     
     def _inject_shared_templates(self, context: dict[str, object]) -> dict[str, object]:
         """Automatically inject shared template fragments."""
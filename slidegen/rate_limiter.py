@@ -0,0 +1,102 @@
+"""Client-side request and token rate limiting for the async OpenAI path."""
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+from typing import Any, Mapping, Optional
+
+from .logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Rough costs used to estimate a request's size before it is sent.
+_CHARS_PER_TOKEN = 4
+_TOKENS_PER_IMAGE = 1105  # a high-detail 1024x1024 image
+_TOKENS_PER_LOW_DETAIL_IMAGE = 85
+_COMPLETION_TOKEN_ESTIMATE = 2000
+
+
+def estimate_tokens(api_params: Mapping[str, Any]) -> int:
+    """Estimate prompt plus completion tokens for a chat completion request."""
+    text_chars = 0
+    image_tokens = 0
+    for message in api_params.get("messages", ()):
+        content = message.get("content")
+        if isinstance(content, str):
+            text_chars += len(content)
+            continue
+        for part in content or ():
+            if part.get("type") == "image_url":
+                low = part.get("image_url", {}).get("detail") == "low"
+                image_tokens += _TOKENS_PER_LOW_DETAIL_IMAGE if low else _TOKENS_PER_IMAGE
+            else:
+                text_chars += len(part.get("text", ""))
+    completion = api_params.get("max_completion_tokens") or _COMPLETION_TOKEN_ESTIMATE
+    return (text_chars // _CHARS_PER_TOKEN + image_tokens + completion) * int(api_params.get("n", 1))
+
+
+class RateLimiter:
+    """Token buckets for requests per minute and tokens per minute.
+
+    Both buckets start full and refill continuously, so bursts up to the
+    per-minute limit go out immediately and sustained traffic is smoothed to
+    the limit. A limit of 0 disables that bucket. State is kept against the
+    monotonic clock rather than an event loop, so one limiter can serve
+    ``asyncio.run`` calls made one after another.
+    """
+
+    def __init__(self, requests_per_minute: int, tokens_per_minute: int) -> None:
+        self._capacities = (float(requests_per_minute), float(tokens_per_minute))
+        self._levels = list(self._capacities)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+
+    async def acquire(self, tokens: int) -> None:
+        """Wait until one request of about ``tokens`` tokens fits in both buckets."""
+        # Requests larger than the whole bucket would never fit; let them drain it instead.
+        wanted = (1.0, float(min(tokens, self._capacities[1])))
+        while True:
+            now = time.monotonic()
+            if now < self._paused_until:
+                await asyncio.sleep(self._paused_until - now)
+                continue
+            self._refill(now)
+            wait = max(
+                ((need - level) * 60.0 / capacity for need, level, capacity in zip(wanted, self._levels, self._capacities) if capacity and level < need),
+                default=0.0,
+            )
+            if not wait:
+                # Check and take happen without an await in between, so no lock is needed.
+                for index, (need, capacity) in enumerate(zip(wanted, self._capacities)):
+                    if capacity:
+                        self._levels[index] -= need
+                return
+            await asyncio.sleep(wait)
+
+    def pause(self, seconds: float) -> None:
+        """Hold back every caller for ``seconds``, e.g. after the server returns 429."""
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated
+        self._updated = now
+        for index, capacity in enumerate(self._capacities):
+            self._levels[index] = min(capacity, self._levels[index] + elapsed * capacity / 60.0)
+
+
+def retry_after_seconds(error: Exception, attempt: int) -> float:
+    """Delay before retrying a rate-limited request.
+
+    Uses the server's ``retry-after-ms`` or ``retry-after`` header when present,
+    otherwise exponential backoff starting at one second, capped at a minute. The
+    backoff is jittered so requests rejected together do not retry in lockstep.
+    """
+    response: Optional[Any] = getattr(error, "response", None)
+    headers = getattr(response, "headers", None) or {}
+    for header, scale in (("retry-after-ms", 0.001), ("retry-after", 1.0)):
+        try:
+            return float(headers[header]) * scale
+        except (KeyError, TypeError, ValueError):
+            continue
+    return min(2.0 ** attempt, 60.0) * random.uniform(0.5, 1.0)
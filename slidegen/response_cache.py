@@ -0,0 +1,57 @@
+"""Exact-match disk cache for model responses."""
+from __future__ import annotations
+
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+from typing import Mapping, Optional
+
+from . import serialization
+from .logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+class ResponseCache:
+    """Store response text under a digest of the full request parameters.
+
+    The key covers the model, sampling settings, messages and inlined images, so
+    only a byte-identical request can be answered from the cache. Entries are
+    small JSON files written atomically, making the directory safe to share
+    between concurrent runs.
+    """
+
+    def __init__(self, cache_dir: Path) -> None:
+        self._cache_dir = cache_dir
+        self._cache_dir.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def key(request: Mapping[str, object]) -> str:
+        return hashlib.blake2b(serialization.canonical_dumps(request), digest_size=20).hexdigest()
+
+    def get(self, key: str) -> Optional[tuple[str, str]]:
+        """Return the cached ``(text, request_id)`` for ``key``, if any."""
+        try:
+            with open(self._path(key), "rb") as handle:
+                entry = serialization.loads(handle.read())
+        except FileNotFoundError:
+            return None
+        except ValueError:
+            logger.warning("Ignoring unreadable response cache entry %s", key)
+            return None
+        return entry["text"], entry["request_id"]  # type: ignore[index]
+
+    def put(self, key: str, text: str, request_id: str) -> None:
+        payload = serialization.dumps({"text": text, "request_id": request_id})
+        descriptor, temp_path = tempfile.mkstemp(dir=self._cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(descriptor, "wb") as handle:
+                handle.write(payload)
+            os.replace(temp_path, self._path(key))
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
+    def _path(self, key: str) -> Path:
+        return self._cache_dir / f"{key}.json"
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Sequence
 
 from .config import ScoreWeights
 from .openai_client import OpenAIClient
@@ -14,6 +17,38 @@ class ScoringService:
 
     def score(self, request: SlideRequest, screenshot_path: Path, reference_image: Path | None) -> ScoreBreakdown:
         raw_score = self._client.score_slide(request.prompt, request.images, screenshot_path, reference_image)
+        return self._weighted(raw_score)
+
+    def score_many(
+        self,
+        request: SlideRequest,
+        screenshot_paths: Sequence[Path],
+        reference_image: Path | None,
+    ) -> list[ScoreBreakdown]:
+        """Score several screenshots for the same request, with the API calls in flight together."""
+        if len(screenshot_paths) < 2:
+            return [self.score(request, path, reference_image) for path in screenshot_paths]
+
+        async def score_all() -> list[ScoreBreakdown]:
+            try:
+                return await asyncio.gather(
+                    *(self._client.ascore_slide(request.prompt, request.images, path, reference_image) for path in screenshot_paths)
+                )
+            finally:
+                await self._client.aclose()
+
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            raw_scores = asyncio.run(score_all())
+        else:
+            # A blocking call cannot wait on the loop it is running on, so the
+            # requests get their own loop on a helper thread instead.
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                raw_scores = executor.submit(asyncio.run, score_all()).result()
+        return [self._weighted(raw_score) for raw_score in raw_scores]
+
+    def _weighted(self, raw_score: ScoreBreakdown) -> ScoreBreakdown:
         aggregate = (
             raw_score.completeness * self._weights.completeness
             + raw_score.content_accuracy * self._weights.content_accuracy
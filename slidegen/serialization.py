@@ -0,0 +1,98 @@
+"""JSON encoding and decoding helpers with an optional orjson fast path."""
+from __future__ import annotations
+
+import dataclasses
+import json
+from enum import Enum
+from pathlib import PurePath
+from typing import BinaryIO, Mapping
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None  # type: ignore[assignment]
+
+
+def dumps(value: object, *, indent: bool = False) -> bytes:
+    """Serialize ``value`` to UTF-8 JSON bytes, two-space indented when requested.
+
+    Dataclasses are encoded field by field and paths as strings, so records can be
+    passed through without building an intermediate dict first.
+    """
+    if orjson is not None:
+        return orjson.dumps(value, default=_default, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(value, default=_default, indent=2 if indent else None, ensure_ascii=False).encode("utf-8")
+
+
+def canonical_dumps(value: object) -> bytes:
+    """Serialize ``value`` to compact, key-sorted UTF-8 JSON.
+
+    Always encoded with the standard library, so the bytes (and any digest of
+    them) do not depend on whether orjson is installed.
+    """
+    return json.dumps(value, default=_default, sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def loads(data: str | bytes) -> object:
+    """Parse JSON text or UTF-8 bytes.
+
+    Malformed input raises :class:`json.JSONDecodeError` on both paths
+    (``orjson.JSONDecodeError`` subclasses it).
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def to_builtins(value: object) -> object:
+    """Convert dataclasses, enums, paths and containers to the plain values ``dumps`` would write."""
+    if isinstance(value, Enum):
+        return to_builtins(value.value)
+    if isinstance(value, PurePath):
+        return str(value)
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return {item.name: to_builtins(getattr(value, item.name)) for item in dataclasses.fields(value)}
+    if isinstance(value, Mapping):
+        return {key: to_builtins(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [to_builtins(item) for item in value]
+    return value
+
+
+def _default(value: object) -> object:
+    if isinstance(value, PurePath):
+        return str(value)
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return {item.name: getattr(value, item.name) for item in dataclasses.fields(value)}
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dump(value: Mapping[str, object], handle: BinaryIO) -> None:
+    """Stream ``value`` to ``handle`` as indented JSON, one top-level entry at a time.
+
+    List entries are written item by item so only a single element is encoded in memory.
+    The output is identical to ``dumps(value, indent=True)``.
+    """
+    if not value:
+        handle.write(b"{}")
+        return
+    separator = b"{\n  "
+    for key, item in value.items():
+        handle.write(separator)
+        handle.write(dumps(key) + b": ")
+        if isinstance(item, list) and item:
+            item_separator = b"[\n    "
+            for element in item:
+                handle.write(item_separator)
+                handle.write(_reindent(dumps(element, indent=True), 4))
+                item_separator = b",\n    "
+            handle.write(b"\n  ]")
+        else:
+            handle.write(_reindent(dumps(item, indent=True), 2))
+        separator = b",\n  "
+    handle.write(b"\n}")
+
+
+def _reindent(encoded: bytes, width: int) -> bytes:
+    # JSON strings escape newlines, so every raw newline is layout whitespace.
+    return encoded.replace(b"\n", b"\n" + b" " * width)
@@ -6,7 +6,7 @@ from typing import Dict, Optional
 from .artifacts import ArtifactManager, RunPaths
 from .config import Settings
 from .execution import ExecutionEngine
-from .logging_config import get_logger
+from .logging_config import PROGRESS, get_logger
 from .openai_client import OpenAIClient
 from .screenshot import ScreenshotService
 from .scoring import ScoringService
@@ -18,6 +18,7 @@ from .types import (
     PipelineStage,
     RunMetadata,
     ScriptOrigin,
+    ScoreBreakdown,
     ScriptVersion,
     SlideRequest,
 )
@@ -41,7 +42,7 @@ class SlideGenStateMachine:
         self._scoring_service = scoring_service
 
     def run(self, request: SlideRequest, run_paths: RunPaths) -> RunMetadata:
-        logger.progress("Starting slide generation workflow")  # type: ignore[attr-defined]
+        logger.log(PROGRESS, "Starting slide generation workflow")
         logger.info("Request prompt: %s", request.prompt[:100] + "..." if len(request.prompt) > 100 else request.prompt)
         logger.info("Number of images: %d", len(request.images))
         logger.info("Has reference image: %s", request.reference_image is not None)
@@ -53,152 +54,176 @@ class SlideGenStateMachine:
         stored_request = SlideRequest(prompt=request.prompt, images=stored_images, reference_image=reference_image)
         metadata = RunMetadata(run_id=run_paths.run_id, request=stored_request)
         script_manager = ScriptManager(self._artifact_manager, run_paths, metadata)
-        execution_engine = ExecutionEngine(
+        # The engine may own a persistent worker process; closing it ends the worker with the run.
+        with ExecutionEngine(
             self._artifact_manager,
             run_paths,
             self._settings.behavior,
-        )
-        image_map = {image.name: image.path for image in stored_images}
-        script_cache: Dict[str, str] = {}
+        ) as execution_engine:
+            image_map = {image.name: image.path for image in stored_images}
+            script_cache: Dict[str, str] = {}
 
-        metadata.status = PipelineStage.INITIAL_GENERATION
-        self._persist_metadata(run_paths, metadata)
-        logger.progress("Generating initial script...")  # type: ignore[attr-defined]
-        logger.info("Stage: INITIAL_GENERATION")
-
-        generation = self._openai.generate_initial_script(prompt=request.prompt, image_assets=stored_images, reference_image=request.reference_image)
-        current_version = script_manager.create_version(
-            content=generation.script,
-            origin=ScriptOrigin.INITIAL,
-            request_id=generation.request_id,
-        )
-        script_cache[current_version.version_id] = generation.script
-        logger.info("Initial script created: %s (request_id: %s)", current_version.version_id, generation.request_id)
-        logger.progress("Script generated: %s", current_version.version_id)  # type: ignore[attr-defined]
-
-        execution = self._execute_script(
-            stage=PipelineStage.EXECUTE_SCRIPT,
-            execution_engine=execution_engine,
-            script=current_version,
-            image_map=image_map,
-            metadata=metadata,
-            run_paths=run_paths,
-        )
+            metadata.status = PipelineStage.INITIAL_GENERATION
+            self._persist_metadata(run_paths, metadata)
+            logger.log(PROGRESS, "Generating initial script...")
+            logger.info("Stage: INITIAL_GENERATION")
 
-        if not execution.success:
-            logger.warning("Initial script execution failed, entering fix loop")
-            execution = self._run_fix_loop(
-                request=request,
-                stored_images=stored_images,
-                execution_engine=execution_engine,
-                script_manager=script_manager,
-                metadata=metadata,
-                run_paths=run_paths,
-                image_map=image_map,
-                last_script=current_version,
-                last_script_content=generation.script,
-                script_cache=script_cache,
-                initial_execution=execution,
-            )
-            if not execution or not execution.success:
-                metadata.status = PipelineStage.FAILED
-                self._persist_metadata(run_paths, metadata)
-                error_details = execution.stderr if execution and execution.stderr else "Unknown error"
-                logger.error("All script fix attempts failed. Last error: %s", error_details)
-                logger.progress("X All script fix attempts failed. Last error:\n%s", error_details)  # type: ignore[attr-defined]
-                return metadata
-            latest_version = script_manager.get_latest()
-            if latest_version is None:
-                raise RuntimeError("Script manager did not return a version after successful fix")
-            current_version = latest_version
-            logger.info("Script successfully fixed: %s", current_version.version_id)
-
-        self._handle_successful_iteration(
-            run_paths=run_paths,
-            metadata=metadata,
-            script_version=current_version,
-            execution=execution,
-        )
-        if metadata.best_score:
-            logger.info("Initial score: %s/100", metadata.best_score.aggregate)
-            logger.progress("Initial score: %.1f/100", metadata.best_score.aggregate)  # type: ignore[attr-defined]
-        else:
-            logger.warning("No score available for initial version")
+            if self._settings.behavior.initial_candidates > 1:
+                current_version, execution = self._run_initial_candidates(
+                    request=request,
+                    stored_images=stored_images,
+                    execution_engine=execution_engine,
+                    script_manager=script_manager,
+                    metadata=metadata,
+                    run_paths=run_paths,
+                    image_map=image_map,
+                    script_cache=script_cache,
+                )
+                # Successful candidates were scored while picking the best one.
+                already_scored = execution.success
+            else:
+                generation = self._openai.generate_initial_script(prompt=request.prompt, image_assets=stored_images, reference_image=request.reference_image)
+                current_version = script_manager.create_version(
+                    content=generation.script,
+                    origin=ScriptOrigin.INITIAL,
+                    request_id=generation.request_id,
+                )
+                script_cache[current_version.version_id] = generation.script
+                logger.info("Initial script created: %s (request_id: %s)", current_version.version_id, generation.request_id)
+                logger.log(PROGRESS, "Script generated: %s", current_version.version_id)
 
-        if metadata.best_score and metadata.best_score.aggregate >= self._settings.behavior.target_score_threshold:
-            logger.info("Target score reached: %.1f >= %.1f", metadata.best_score.aggregate, self._settings.behavior.target_score_threshold)
-            logger.progress("Target score reached! (%.1f >= %.1f)", metadata.best_score.aggregate, self._settings.behavior.target_score_threshold)  # type: ignore[attr-defined]
-            metadata.status = PipelineStage.COMPLETE
-            self._persist_metadata(run_paths, metadata)
-            return metadata
+                execution = self._execute_script(
+                    stage=PipelineStage.EXECUTE_SCRIPT,
+                    execution_engine=execution_engine,
+                    script=current_version,
+                    image_map=image_map,
+                    metadata=metadata,
+                    run_paths=run_paths,
+                )
+                already_scored = False
 
-        logger.info("Starting improvement loop (max %d iterations)", self._settings.behavior.max_improvement_iterations)
-        logger.progress("Starting improvement iterations (max %d)...", self._settings.behavior.max_improvement_iterations)  # type: ignore[attr-defined]
-        for iteration_index in range(1, self._settings.behavior.max_improvement_iterations + 1):
-            logger.info("=" * 60)
-            logger.info("Improvement iteration %d/%d", iteration_index, self._settings.behavior.max_improvement_iterations)
-            logger.progress("Improvement iteration %d/%d...", iteration_index, self._settings.behavior.max_improvement_iterations)  # type: ignore[attr-defined]
-            metadata.status = PipelineStage.IMPROVEMENT_LOOP
-            self._persist_metadata(run_paths, metadata)
-            
-            # Get the previous iteration's screenshot to pass to the LLM
-            previous_screenshot = None
-            if metadata.iterations:
-                last_iteration = metadata.iterations[-1]
-                if last_iteration.screenshot_path:
-                    previous_screenshot = last_iteration.screenshot_path
-                    logger.info("Using previous screenshot for improvement: %s", previous_screenshot)
-            
-            improvement = self._openai.improve_script(
-                prompt=request.prompt,
-                image_assets=stored_images,
-                previous_script=script_cache[current_version.version_id],
-                score_feedback=metadata.best_score,
-                iteration_index=iteration_index,
-                reference_image=request.reference_image,
-                previous_screenshot=previous_screenshot,
-            )
-            improved_version = script_manager.create_version(
-                content=improvement.script,
-                origin=ScriptOrigin.IMPROVEMENT,
-                parent_version_id=current_version.version_id,
-                request_id=improvement.request_id,
-            )
-            script_cache[improved_version.version_id] = improvement.script
-            logger.info("Improved script created: %s (request_id: %s)", improved_version.version_id, improvement.request_id)
-            
-            execution = self._execute_script(
-                stage=PipelineStage.IMPROVEMENT_LOOP,
-                execution_engine=execution_engine,
-                script=improved_version,
-                image_map=image_map,
-                metadata=metadata,
-                run_paths=run_paths,
-            )
             if not execution.success:
-                logger.warning("Improvement iteration %d failed, continuing to next iteration", iteration_index)
-                continue
-            current_version = improved_version
-            self._handle_successful_iteration(
-                run_paths=run_paths,
-                metadata=metadata,
-                script_version=current_version,
-                execution=execution,
-            )
-            if metadata.iterations and metadata.iterations[-1].score:
-                score = metadata.iterations[-1].score.aggregate
-                logger.info("Iteration %d score: %.1f/100", iteration_index, score)
-                logger.progress("Iteration %d score: %.1f/100", iteration_index, score)  # type: ignore[attr-defined]
+                logger.warning("Initial script execution failed, entering fix loop")
+                execution = self._run_fix_loop(
+                    request=request,
+                    stored_images=stored_images,
+                    execution_engine=execution_engine,
+                    script_manager=script_manager,
+                    metadata=metadata,
+                    run_paths=run_paths,
+                    image_map=image_map,
+                    last_script=current_version,
+                    last_script_content=script_cache[current_version.version_id],
+                    script_cache=script_cache,
+                    initial_execution=execution,
+                )
+                if not execution or not execution.success:
+                    metadata.status = PipelineStage.FAILED
+                    self._persist_metadata(run_paths, metadata)
+                    error_details = execution.stderr if execution and execution.stderr else "Unknown error"
+                    logger.error("All script fix attempts failed. Last error: %s", error_details)
+                    logger.log(PROGRESS, "X All script fix attempts failed. Last error:\n%s", error_details)
+                    return metadata
+                latest_version = script_manager.get_latest()
+                if latest_version is None:
+                    raise RuntimeError("Script manager did not return a version after successful fix")
+                current_version = latest_version
+                logger.info("Script successfully fixed: %s", current_version.version_id)
+
+            if not already_scored:
+                self._handle_successful_iteration(
+                    run_paths=run_paths,
+                    metadata=metadata,
+                    script_version=current_version,
+                    execution=execution,
+                )
+            if metadata.best_score:
+                logger.info("Initial score: %s/100", metadata.best_score.aggregate)
+                logger.log(PROGRESS, "Initial score: %.1f/100", metadata.best_score.aggregate)
+            else:
+                logger.warning("No score available for initial version")
+
             if metadata.best_score and metadata.best_score.aggregate >= self._settings.behavior.target_score_threshold:
                 logger.info("Target score reached: %.1f >= %.1f", metadata.best_score.aggregate, self._settings.behavior.target_score_threshold)
-                logger.progress("Target score reached! (%.1f >= %.1f)", metadata.best_score.aggregate, self._settings.behavior.target_score_threshold)  # type: ignore[attr-defined]
-                break
+                logger.log(PROGRESS, "Target score reached! (%.1f >= %.1f)", metadata.best_score.aggregate, self._settings.behavior.target_score_threshold)
+                metadata.status = PipelineStage.COMPLETE
+                self._persist_metadata(run_paths, metadata)
+                return metadata
 
-        logger.info("Workflow complete")
-        logger.progress("Workflow complete.")  # type: ignore[attr-defined]
-        metadata.status = PipelineStage.COMPLETE
-        self._persist_metadata(run_paths, metadata)
-        return metadata
+            logger.info("Starting improvement loop (max %d iterations)", self._settings.behavior.max_improvement_iterations)
+            logger.log(PROGRESS, "Starting improvement iterations (max %d)...", self._settings.behavior.max_improvement_iterations)
+            for iteration_index in range(1, self._settings.behavior.max_improvement_iterations + 1):
+                logger.info("=" * 60)
+                logger.info("Improvement iteration %d/%d", iteration_index, self._settings.behavior.max_improvement_iterations)
+                logger.log(PROGRESS, "Improvement iteration %d/%d...", iteration_index, self._settings.behavior.max_improvement_iterations)
+                metadata.status = PipelineStage.IMPROVEMENT_LOOP
+                self._persist_metadata(run_paths, metadata)
+
+                # Get the screenshot of the script being improved to pass to the LLM
+                previous_screenshot = None
+                if metadata.iterations:
+                    last_iteration = metadata.iterations[-1]
+                    if last_iteration.screenshot_path:
+                        previous_screenshot = last_iteration.screenshot_path
+                        if last_iteration.script_version_id != current_version.version_id:
+                            # After a candidate sweep the last record may be a losing candidate.
+                            previous_screenshot = next(
+                                (record.screenshot_path for record in reversed(metadata.iterations)
+                                 if record.script_version_id == current_version.version_id and record.screenshot_path),
+                                previous_screenshot,
+                            )
+                        logger.info("Using previous screenshot for improvement: %s", previous_screenshot)
+
+                improvement = self._openai.improve_script(
+                    prompt=request.prompt,
+                    image_assets=stored_images,
+                    previous_script=script_cache[current_version.version_id],
+                    score_feedback=metadata.best_score,
+                    iteration_index=iteration_index,
+                    reference_image=request.reference_image,
+                    previous_screenshot=previous_screenshot,
+                )
+                improved_version = script_manager.create_version(
+                    content=improvement.script,
+                    origin=ScriptOrigin.IMPROVEMENT,
+                    parent_version_id=current_version.version_id,
+                    request_id=improvement.request_id,
+                )
+                script_cache[improved_version.version_id] = improvement.script
+                logger.info("Improved script created: %s (request_id: %s)", improved_version.version_id, improvement.request_id)
+
+                execution = self._execute_script(
+                    stage=PipelineStage.IMPROVEMENT_LOOP,
+                    execution_engine=execution_engine,
+                    script=improved_version,
+                    image_map=image_map,
+                    metadata=metadata,
+                    run_paths=run_paths,
+                )
+                if not execution.success:
+                    logger.warning("Improvement iteration %d failed, continuing to next iteration", iteration_index)
+                    continue
+                current_version = improved_version
+                self._handle_successful_iteration(
+                    run_paths=run_paths,
+                    metadata=metadata,
+                    script_version=current_version,
+                    execution=execution,
+                )
+                if metadata.iterations and metadata.iterations[-1].score:
+                    score = metadata.iterations[-1].score.aggregate
+                    logger.info("Iteration %d score: %.1f/100", iteration_index, score)
+                    logger.log(PROGRESS, "Iteration %d score: %.1f/100", iteration_index, score)
+                if metadata.best_score and metadata.best_score.aggregate >= self._settings.behavior.target_score_threshold:
+                    logger.info("Target score reached: %.1f >= %.1f", metadata.best_score.aggregate, self._settings.behavior.target_score_threshold)
+                    logger.log(PROGRESS, "Target score reached! (%.1f >= %.1f)", metadata.best_score.aggregate, self._settings.behavior.target_score_threshold)
+                    break
+
+            logger.info("Workflow complete")
+            logger.log(PROGRESS, "Workflow complete.")
+            metadata.status = PipelineStage.COMPLETE
+            self._persist_metadata(run_paths, metadata)
+            return metadata
 
     def _execute_script(
         self,
@@ -211,6 +236,17 @@ class SlideGenStateMachine:
     ) -> ExecutionResult:
         logger.info("Executing script: %s (stage: %s)", script.version_id, stage.value)
         execution = execution_engine.execute(script, image_map)
+        self._record_execution(stage, script, execution, metadata, run_paths)
+        return execution
+
+    def _record_execution(
+        self,
+        stage: PipelineStage,
+        script: ScriptVersion,
+        execution: ExecutionResult,
+        metadata: RunMetadata,
+        run_paths: RunPaths,
+    ) -> None:
         metadata.iterations.append(
             IterationRecord(stage=stage, script_version_id=script.version_id, execution=execution)
         )
@@ -220,8 +256,68 @@ class SlideGenStateMachine:
             logger.error("Script execution failed for %s: %s", script.version_id, execution.stderr[:200] if execution.stderr else "Unknown error")
         else:
             logger.info("Script execution succeeded for %s", script.version_id)
-        
-        return execution
+
+    def _run_initial_candidates(
+        self,
+        request: SlideRequest,
+        stored_images: list[ImageInput],
+        execution_engine: ExecutionEngine,
+        script_manager: ScriptManager,
+        metadata: RunMetadata,
+        run_paths: RunPaths,
+        image_map: Dict[str, Path],
+        script_cache: Dict[str, str],
+    ) -> tuple[ScriptVersion, ExecutionResult]:
+        """Generate, run and score several initial scripts, returning the best one.
+
+        If no candidate runs successfully, the first one is returned with its failed
+        execution so the fix loop can take over.
+        """
+        generations = self._openai.generate_initial_candidates(
+            prompt=request.prompt,
+            image_assets=stored_images,
+            reference_image=request.reference_image,
+            num_candidates=self._settings.behavior.initial_candidates,
+        )
+        versions: list[ScriptVersion] = []
+        for generation in generations:
+            version = script_manager.create_version(
+                content=generation.script,
+                origin=ScriptOrigin.INITIAL,
+                request_id=generation.request_id,
+            )
+            script_cache[version.version_id] = generation.script
+            versions.append(version)
+            logger.info("Initial candidate created: %s (request_id: %s)", version.version_id, generation.request_id)
+        logger.log(PROGRESS, "Generated %d candidate scripts", len(versions))
+
+        logger.info("Executing %d candidate scripts", len(versions))
+        executions = execution_engine.execute_batch(versions, image_map)
+        captured: list[tuple[ScriptVersion, IterationRecord, Path]] = []
+        for version, execution in zip(versions, executions):
+            self._record_execution(PipelineStage.EXECUTE_SCRIPT, version, execution, metadata, run_paths)
+            if execution.success:
+                # Screenshots drive a single renderer, so capture them one at a time.
+                screenshot_path = self._capture_screenshot(run_paths, metadata, version, execution)
+                if screenshot_path:
+                    captured.append((version, metadata.iterations[-1], screenshot_path))
+
+        if captured:
+            metadata.status = PipelineStage.SCORING
+            self._persist_metadata(run_paths, metadata)
+            logger.info("Scoring %d candidates", len(captured))
+            scores = self._scoring_service.score_many(
+                metadata.request, [screenshot_path for _, _, screenshot_path in captured], metadata.request.reference_image
+            )
+            for (version, record, _), score in zip(captured, scores):
+                self._record_score(metadata, version, record, score)
+            self._persist_metadata(run_paths, metadata)
+
+        for version, execution in zip(versions, executions):
+            if version.version_id == metadata.best_version_id:
+                logger.log(PROGRESS, "Best candidate: %s", version.version_id)
+                return version, execution
+        return versions[0], executions[0]
 
     def _run_fix_loop(
         self,
@@ -282,9 +378,28 @@ class SlideGenStateMachine:
         script_version: ScriptVersion,
         execution: ExecutionResult,
     ) -> None:
+        screenshot_path = self._capture_screenshot(run_paths, metadata, script_version, execution)
+        if not screenshot_path:
+            return
+
+        metadata.status = PipelineStage.SCORING
+        self._persist_metadata(run_paths, metadata)
+        logger.info("Scoring slide for %s", script_version.version_id)
+        score = self._scoring_service.score(metadata.request, screenshot_path, metadata.request.reference_image)
+        self._record_score(metadata, script_version, metadata.iterations[-1], score)
+        self._persist_metadata(run_paths, metadata)
+
+    def _capture_screenshot(
+        self,
+        run_paths: RunPaths,
+        metadata: RunMetadata,
+        script_version: ScriptVersion,
+        execution: ExecutionResult,
+    ) -> Optional[Path]:
+        """Screenshot the latest iteration's presentation; returns None if it produced none."""
         if not execution.pptx_path:
             logger.warning("No PPTX path in execution result")
-            return
+            return None
         
         logger.info("Handling successful iteration for %s", script_version.version_id)
         metadata.status = PipelineStage.SCREENSHOT
@@ -298,16 +413,20 @@ class SlideGenStateMachine:
             logger.info("Screenshot captured successfully")
         except Exception as screenshot_error:  # pylint: disable=broad-except
             logger.error("Screenshot capture failed: %s", screenshot_error, exc_info=True)
-            logger.progress("CRITICAL ERROR: Screenshot capture failed")  # type: ignore[attr-defined]
-            logger.progress("Error: %s", screenshot_error)  # type: ignore[attr-defined]
-            logger.progress("PPTX created at: %s", execution.pptx_path)  # type: ignore[attr-defined]
+            logger.log(PROGRESS, "CRITICAL ERROR: Screenshot capture failed")
+            logger.log(PROGRESS, "Error: %s", screenshot_error)
+            logger.log(PROGRESS, "PPTX created at: %s", execution.pptx_path)
             raise RuntimeError(f"Screenshot capture failed: {screenshot_error}") from screenshot_error
+        return screenshot_path
 
-        metadata.status = PipelineStage.SCORING
-        self._persist_metadata(run_paths, metadata)
-        logger.info("Scoring slide for %s", script_version.version_id)
-        score = self._scoring_service.score(metadata.request, screenshot_path, metadata.request.reference_image)
-        metadata.iterations[-1].score = score
+    @staticmethod
+    def _record_score(
+        metadata: RunMetadata,
+        script_version: ScriptVersion,
+        record: IterationRecord,
+        score: ScoreBreakdown,
+    ) -> None:
+        record.score = score
         logger.info("Score: %.1f/100 (completeness=%.1f, content=%.1f, layout=%.1f, visual=%.1f)", 
                    score.aggregate, score.completeness, score.content_accuracy, 
                    score.layout_match, score.visual_quality)
@@ -319,7 +438,5 @@ class SlideGenStateMachine:
             metadata.best_score = score
             metadata.best_version_id = script_version.version_id
 
-        self._persist_metadata(run_paths, metadata)
-
     def _persist_metadata(self, run_paths: RunPaths, metadata: RunMetadata) -> None:
         self._artifact_manager.write_metadata(run_paths, metadata)
\ No newline at end of file
@@ -5,6 +5,8 @@ from enum import Enum
 from pathlib import Path
 from typing import Dict, Optional
 
+from . import serialization
+
 
 class ScriptOrigin(str, Enum):
     INITIAL = "initial"
@@ -29,21 +31,21 @@ class PipelineStage(str, Enum):
     FAILED = "failed"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ImageInput:
     name: str
     path: Path
     description: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SlideRequest:
     prompt: str
     images: list[ImageInput]
     reference_image: Optional[Path] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ScriptVersion:
     version_id: str
     origin: ScriptOrigin
@@ -53,7 +55,7 @@ class ScriptVersion:
     request_id: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ExecutionResult:
     success: bool
     pptx_path: Optional[Path]
@@ -63,7 +65,7 @@ class ExecutionResult:
     duration_seconds: float
 
 
-@dataclass
+@dataclass(slots=True)
 class ScoreBreakdown:
     completeness: float
     content_accuracy: float
@@ -83,7 +85,7 @@ class ScoreBreakdown:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class IterationRecord:
     stage: PipelineStage
     script_version_id: str
@@ -92,7 +94,7 @@ class IterationRecord:
     score: Optional[ScoreBreakdown] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class RunMetadata:
     run_id: str
     request: SlideRequest
@@ -103,45 +105,18 @@ class RunMetadata:
     status: PipelineStage = PipelineStage.INITIAL_GENERATION
 
     def to_dict(self) -> Dict[str, object]:
+        return {key: serialization.to_builtins(value) for key, value in self.json_fields().items()}
+
+    def json_fields(self) -> Dict[str, object]:
+        """Top-level ``metadata.json`` entries; nested records stay as dataclasses for the encoder."""
         return {
             "run_id": self.run_id,
             "prompt": self.request.prompt,
-            "images": [
-                {"name": img.name, "path": str(img.path), "description": img.description}
-                for img in self.request.images
-            ],
-            "reference_image": str(self.request.reference_image) if self.request.reference_image else None,
-            "script_versions": [
-                {
-                    "version_id": v.version_id,
-                    "origin": v.origin.value,
-                    "path": str(v.path),
-                    "status": v.status.value,
-                    "parent_version_id": v.parent_version_id,
-                    "request_id": v.request_id,
-                }
-                for v in self.script_versions
-            ],
-            "iterations": [
-                {
-                    "stage": record.stage.value,
-                    "script_version_id": record.script_version_id,
-                    "execution": {
-                        "success": record.execution.success,
-                        "pptx_path": str(record.execution.pptx_path)
-                        if record.execution.pptx_path
-                        else None,
-                        "stdout": record.execution.stdout,
-                        "stderr": record.execution.stderr,
-                        "return_code": record.execution.return_code,
-                        "duration_seconds": record.execution.duration_seconds,
-                    },
-                    "screenshot_path": str(record.screenshot_path) if record.screenshot_path else None,
-                    "score": record.score.to_dict() if record.score else None,
-                }
-                for record in self.iterations
-            ],
+            "images": self.request.images,
+            "reference_image": self.request.reference_image,
+            "script_versions": self.script_versions,
+            "iterations": self.iterations,
             "best_version_id": self.best_version_id,
-            "best_score": self.best_score.to_dict() if self.best_score else None,
-            "status": self.status.value,
+            "best_score": self.best_score,
+            "status": self.status,
         }
@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import os
+import shutil
+
+import pytest
+
+from slidegen.artifacts import ArtifactManager, fast_copy
+from slidegen.types import ImageInput
+
+
+def test_fast_copy_copies_content_and_metadata(tmp_path):
+    source = tmp_path / "source.bin"
+    source.write_bytes(os.urandom(256 * 1024))
+    os.utime(source, (1_600_000_000, 1_600_000_000))
+    target = tmp_path / "target.bin"
+
+    fast_copy(source, target)
+
+    assert target.read_bytes() == source.read_bytes()
+    assert target.stat().st_mtime == source.stat().st_mtime
+
+
+def test_fast_copy_rejects_same_file(tmp_path):
+    source = tmp_path / "source.bin"
+    source.write_bytes(b"data")
+    with pytest.raises(shutil.SameFileError):
+        fast_copy(source, source)
+    assert source.read_bytes() == b"data"
+
+
+def test_store_images_copies_every_image_in_order(tmp_path):
+    manager = ArtifactManager(tmp_path / "runs")
+    run_paths = manager.create_run("run")
+    images = []
+    for index in range(4):
+        path = tmp_path / f"image{index}.png"
+        path.write_bytes(bytes([index]) * 1024)
+        images.append(ImageInput(name=f"img{index}", path=path, description=f"Image {index}"))
+
+    stored = list(manager.store_images(run_paths, images))
+
+    assert [image.name for image in stored] == ["img0", "img1", "img2", "img3"]
+    for original, copy in zip(images, stored):
+        assert copy.path == run_paths.input_dir / original.path.name
+        assert copy.path.read_bytes() == original.path.read_bytes()
+
+
+def test_persist_prompt_skips_identical_rewrite(tmp_path):
+    manager = ArtifactManager(tmp_path / "runs")
+    run_paths = manager.create_run("run")
+
+    prompt_path = manager.persist_prompt(run_paths, "Title\nBullet")
+    os.utime(prompt_path, (1_600_000_000, 1_600_000_000))
+    manager.persist_prompt(run_paths, "Title\nBullet")
+    assert prompt_path.stat().st_mtime == 1_600_000_000
+
+    manager.persist_prompt(run_paths, "Title\nBullet two")
+    assert prompt_path.read_text(encoding="utf-8") == "Title\nBullet two"
+
+
+def test_create_run_fills_in_missing_directories_for_reused_id(tmp_path):
+    manager = ArtifactManager(tmp_path / "runs")
+    first = manager.create_run("run")
+    (first.logs_dir / "keep.log").write_text("kept", encoding="utf-8")
+    first.scripts_dir.rmdir()
+
+    second = manager.create_run("run")
+
+    assert all(path.is_dir() for path in (second.input_dir, second.scripts_dir, second.outputs_dir, second.logs_dir))
+    assert (second.logs_dir / "keep.log").read_text(encoding="utf-8") == "kept"
+
+
+def test_utc_stamp_matches_strftime_layout():
+    from datetime import datetime
+
+    from slidegen.artifacts import utc_stamp
+
+    assert datetime.strptime(utc_stamp(), "%Y%m%d_%H%M%S_%f")
+    assert datetime.strptime(utc_stamp(microseconds=False), "%Y%m%d_%H%M%S")
+
+
+def test_link_or_copy_replaces_target_and_falls_back_to_copy(tmp_path, monkeypatch):
+    from slidegen.artifacts import link_or_copy
+
+    source = tmp_path / "slide.pptx"
+    source.write_bytes(b"deck")
+    linked = tmp_path / "linked.pptx"
+    linked.write_bytes(b"stale")
+
+    link_or_copy(source, linked)
+    assert linked.read_bytes() == b"deck"
+
+    def refuse_link(*_args):
+        raise OSError("cross-device link")
+
+    monkeypatch.setattr(os, "link", refuse_link)
+    copied = tmp_path / "copied.pptx"
+    link_or_copy(source, copied)
+    assert copied.read_bytes() == b"deck"
+    assert not os.path.samefile(source, copied)
+
+
+def test_store_images_copies_new_images_and_keeps_stored_ones(tmp_path):
+    manager = ArtifactManager(tmp_path / "runs")
+    run_paths = manager.create_run("run")
+    outside = tmp_path / "chart.png"
+    outside.write_bytes(b"chart")
+    already_stored = run_paths.input_dir / "logo.png"
+    already_stored.write_bytes(b"logo")
+    images = [
+        ImageInput(name="chart", path=outside, description="Chart"),
+        ImageInput(name="logo", path=already_stored, description="Logo"),
+    ]
+
+    stored = list(manager.store_images(run_paths, images))
+
+    assert stored[0].path == run_paths.input_dir / "chart.png"
+    assert not os.path.samefile(outside, stored[0].path)  # scripts must not be able to write the original
+    assert stored[1] == images[1]
+
+
+def test_store_images_gives_colliding_names_distinct_targets(tmp_path):
+    manager = ArtifactManager(tmp_path / "runs")
+    run_paths = manager.create_run("run")
+    sources = []
+    for folder in ("a", "b"):
+        (tmp_path / folder).mkdir()
+        sources.append(tmp_path / folder / "x.png")
+        sources[-1].write_bytes(folder.encode())
+    images = [ImageInput(name=f"img{index}", path=path, description="") for index, path in enumerate([*sources, sources[0]])]
+
+    stored = list(manager.store_images(run_paths, images))
+
+    assert [image.path.name for image in stored] == ["x.png", "x_2.png", "x.png"]
+    assert [image.path.read_bytes() for image in stored] == [b"a", b"b", b"a"]
+    assert [path.read_bytes() for path in sources] == [b"a", b"b"]
+
+
+def test_copy_over_a_linked_target_leaves_the_link_source_intact(tmp_path):
+    from slidegen.artifacts import link_or_copy
+
+    original = tmp_path / "original.png"
+    original.write_bytes(b"original")
+    other = tmp_path / "other.png"
+    other.write_bytes(b"other")
+    target = tmp_path / "target.png"
+
+    link_or_copy(original, target)
+    fast_copy(other, target)
+
+    assert target.read_bytes() == b"other"
+    assert original.read_bytes() == b"original"
+    assert not list(tmp_path.glob(".*.tmp"))
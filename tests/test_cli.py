@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+import pytest
+
+from slidegen.cli import parse_image_specs
+
+
+def test_parse_image_specs_strips_fields(tmp_path):
+    image = tmp_path / "logo.png"
+    image.write_bytes(b"png")
+
+    specs = parse_image_specs([f"  logo | {image} |  Company logo | dark  "])
+
+    assert specs[0].name == "logo"
+    assert specs[0].path == image.resolve()
+    assert specs[0].description == "Company logo | dark"
+
+
+@pytest.mark.parametrize("raw", ["logo.png", "logo|logo.png", "logo| |desc"])
+def test_parse_image_specs_rejects_malformed_values(raw):
+    with pytest.raises(ValueError):
+        parse_image_specs([raw])
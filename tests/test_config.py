@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from pathlib import Path
 
+import pytest
+
 from slidegen.config import load_settings
 
 
@@ -16,3 +18,74 @@ def test_load_settings_mock_mode(monkeypatch, tmp_path):
     assert settings.score_weights.total == 1.0
     assert settings.screenshot.window_search_timeout_seconds == 10.0
     assert settings.screenshot.focus_delay_seconds == 0.6
+
+
+def test_load_settings_reads_env_file(monkeypatch, tmp_path):
+    for key in ("OPENAI_USE_MOCK", "OPENAI_DEFAULT_MODEL", "MAX_SCRIPT_RETRIES", "TARGET_SCORE_THRESHOLD"):
+        monkeypatch.delenv(key, raising=False)
+    monkeypatch.setenv("DEFAULT_OUTPUT_DIR", str(tmp_path / "runs"))
+    env_file = tmp_path / ".env"
+    env_file.write_text(
+        "# comment\n"
+        "OPENAI_USE_MOCK=true\n"
+        'export OPENAI_DEFAULT_MODEL="gpt-test" # trailing comment\n'
+        "MAX_SCRIPT_RETRIES = 5  # retries\n"
+        "TARGET_SCORE_THRESHOLD='72.5'\n"
+        "MALFORMED_LINE\n",
+        encoding="utf-8",
+    )
+    monkeypatch.setenv("MAX_SCRIPT_RETRIES", "7")
+
+    settings = load_settings(env_path=env_file)
+
+    assert settings.openai.mock_mode is True
+    assert settings.openai.default_model == "gpt-test"
+    assert settings.behavior.target_score_threshold == 72.5
+    # Process environment wins over the .env file
+    assert settings.behavior.max_script_retries == 7
+
+
+def test_load_settings_rejects_weights_not_summing_to_one(monkeypatch, tmp_path):
+    monkeypatch.setenv("OPENAI_USE_MOCK", "true")
+    monkeypatch.setenv("DEFAULT_OUTPUT_DIR", str(tmp_path / "runs"))
+    monkeypatch.setenv("SCORE_WEIGHT_VISUAL_QUALITY", "0.5")
+
+    for _ in range(2):  # a failed validation must not be cached as valid
+        with pytest.raises(ValueError, match="sum to 1.0"):
+            load_settings(env_path=tmp_path / ".env")
+
+
+def test_load_settings_rejects_zero_initial_candidates(monkeypatch, tmp_path):
+    monkeypatch.setenv("OPENAI_USE_MOCK", "true")
+    monkeypatch.setenv("DEFAULT_OUTPUT_DIR", str(tmp_path / "runs"))
+    monkeypatch.setenv("INITIAL_CANDIDATES", "0")
+
+    with pytest.raises(ValueError, match="INITIAL_CANDIDATES"):
+        load_settings(env_path=tmp_path / ".env")
+
+
+def test_env_file_supports_escapes_multiline_values_and_interpolation(monkeypatch, tmp_path):
+    monkeypatch.setenv("SLIDEGEN_TEST_HOME", "/home/test")
+    monkeypatch.delenv("SLIDEGEN_TEST_UNSET", raising=False)
+    env_file = tmp_path / ".env"
+    env_file.write_text(
+        'ESCAPED="line one\\nsaid \\"hi\\""\n'
+        "LITERAL='keep \\n and ${SLIDEGEN_TEST_HOME}'\n"
+        'MULTILINE="first\n'
+        'second" # comment after the closing quote\n'
+        "BASE=${SLIDEGEN_TEST_HOME}/runs\n"
+        'NESTED="${BASE}/latest"\n'
+        "FALLBACK=${SLIDEGEN_TEST_UNSET:-default}\n",
+        encoding="utf-8",
+    )
+
+    from slidegen.config import _parse_env_file
+
+    assert _parse_env_file(env_file) == {
+        "ESCAPED": 'line one\nsaid "hi"',
+        "LITERAL": "keep \\n and ${SLIDEGEN_TEST_HOME}",
+        "MULTILINE": "first\nsecond",
+        "BASE": "/home/test/runs",
+        "NESTED": "/home/test/runs/latest",
+        "FALLBACK": "default",
+    }
@@ -0,0 +1,265 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from slidegen.artifacts import ArtifactManager
+from slidegen.config import BehaviorConfig
+from slidegen.execution import ExecutionEngine
+from slidegen.types import ScriptOrigin, ScriptStatus, ScriptVersion
+
+
+def _engine(tmp_path: Path, timeout: int = 30, **behavior_options):
+    manager = ArtifactManager(tmp_path / "runs")
+    run_paths = manager.create_run("run")
+    behavior = BehaviorConfig(
+        max_script_retries=1,
+        max_improvement_iterations=1,
+        execution_timeout_seconds=timeout,
+        target_score_threshold=80.0,
+        **behavior_options,
+    )
+    return ExecutionEngine(manager, run_paths, behavior), manager, run_paths
+
+
+def _script(manager: ArtifactManager, run_paths, version_id: str, body: str) -> ScriptVersion:
+    path = manager.persist_script(run_paths, version_id, body)
+    return ScriptVersion(version_id=version_id, origin=ScriptOrigin.INITIAL, path=path, status=ScriptStatus.PENDING)
+
+
+def test_execute_streams_large_output_to_log(tmp_path):
+    engine, manager, run_paths = _engine(tmp_path)
+    script = _script(manager, run_paths, "v1", "import sys\nfor i in range(20000):\n    print('line', i)\nsys.exit(3)\n")
+
+    result = engine.execute(script, {})
+
+    assert not result.success
+    assert result.return_code == 3
+    stdout_log, _ = manager.execution_log_paths(run_paths, "v1")
+    persisted = stdout_log.read_text(encoding="utf-8")
+    assert "line 0\n" in persisted and "line 19999\n" in persisted
+    assert "Return code: 3" in persisted
+    # Only the tail of the child output is kept in memory
+    assert "line 19999" in result.stdout
+    assert "line 0\n" not in result.stdout
+    assert "Script exited with code 3" in result.stderr
+
+
+def test_execute_reports_timeout(tmp_path):
+    engine, manager, run_paths = _engine(tmp_path, timeout=1)
+    script = _script(manager, run_paths, "v1", "import sys, time\nprint('starting', file=sys.stderr, flush=True)\ntime.sleep(30)\n")
+
+    result = engine.execute(script, {})
+
+    assert not result.success
+    assert result.return_code == -1
+    assert "starting" in result.stderr
+    assert "Execution timed out" in result.stderr
+    _, stderr_log = manager.execution_log_paths(run_paths, "v1")
+    assert "Execution timed out" in stderr_log.read_text(encoding="utf-8")
+
+
+_IMAGE_MAP_SCRIPT = (
+    "import argparse, json\n"
+    "from pptx import Presentation\n"
+    "parser = argparse.ArgumentParser()\n"
+    "parser.add_argument('--output')\n"
+    "parser.add_argument('--images')\n"
+    "args = parser.parse_args()\n"
+    "with open(args.images, encoding='utf-8') as handle:\n"
+    "    print(json.load(handle)['logo'])\n"
+    "presentation = Presentation()\n"
+    "presentation.slides.add_slide(presentation.slide_layouts[6])\n"
+    "presentation.save(args.output)\n"
+)
+
+
+def test_execute_succeeds_and_passes_image_map(tmp_path):
+    engine, manager, run_paths = _engine(tmp_path)
+    script = _script(manager, run_paths, "v1", _IMAGE_MAP_SCRIPT)
+
+    result = engine.execute(script, {"logo": Path("/images/logo.png")})
+
+    assert result.success, result.stderr
+    assert result.pptx_path == run_paths.outputs_dir / "slide_v1.pptx"
+    assert script.status == ScriptStatus.SUCCESS
+    assert str(Path("/images/logo.png")) in result.stdout
+
+
+def test_execute_rejects_presentation_without_slides(tmp_path):
+    engine, manager, run_paths = _engine(tmp_path)
+    body = (
+        "import argparse\n"
+        "from pptx import Presentation\n"
+        "parser = argparse.ArgumentParser()\n"
+        "parser.add_argument('--output')\n"
+        "parser.add_argument('--images')\n"
+        "Presentation().save(parser.parse_args().output)\n"
+    )
+    script = _script(manager, run_paths, "v1", body)
+
+    result = engine.execute(script, {})
+
+    assert not result.success
+    assert "Presentation has no slides" in result.stderr
+
+
+def test_execute_batch_returns_results_in_order(tmp_path):
+    engine, manager, run_paths = _engine(tmp_path)
+    scripts = [
+        _script(manager, run_paths, f"v{index}", f"import sys, time\ntime.sleep(0.2)\nsys.exit({index})\n")
+        for index in range(1, 4)
+    ]
+
+    results = engine.execute_batch(scripts, {"logo": Path("/images/logo.png")}, max_workers=2)
+
+    assert [result.return_code for result in results] == [1, 2, 3]
+    assert all(script.status == ScriptStatus.FAILURE for script in scripts)
+    # One shared image map for the whole batch
+    assert sorted(path.name for path in run_paths.input_dir.glob("*.json")) == ["images.json"]
+    assert all("input/images.json" in result.stdout for result in results)
+
+
+def test_execute_rejects_truncated_presentation(tmp_path):
+    engine, manager, run_paths = _engine(tmp_path)
+    body = (
+        "import argparse, io\n"
+        "from pptx import Presentation\n"
+        "parser = argparse.ArgumentParser()\n"
+        "parser.add_argument('--output')\n"
+        "parser.add_argument('--images')\n"
+        "presentation = Presentation()\n"
+        "presentation.slides.add_slide(presentation.slide_layouts[6])\n"
+        "buffer = io.BytesIO()\n"
+        "presentation.save(buffer)\n"
+        "with open(parser.parse_args().output, 'wb') as handle:\n"
+        "    handle.write(buffer.getvalue()[:-200])\n"
+    )
+    script = _script(manager, run_paths, "v1", body)
+
+    result = engine.execute(script, {})
+
+    assert not result.success
+    assert "Validation error" in result.stderr
+
+
+@pytest.mark.skipif(not Path("/dev/stdin").exists(), reason="requires /dev/stdin")
+def test_execute_can_pipe_image_map_through_stdin(tmp_path):
+    engine, manager, run_paths = _engine(tmp_path, image_map_via_stdin=True)
+    script = _script(manager, run_paths, "v1", _IMAGE_MAP_SCRIPT)
+
+    result = engine.execute(script, {"logo": Path("/images/logo.png")})
+
+    assert result.success, result.stderr
+    assert str(Path("/images/logo.png")) in result.stdout
+    assert not (run_paths.input_dir / "v1_images.json").exists()
+
+
+def test_image_map_encoding_is_reused_until_the_map_changes(tmp_path):
+    engine, _, _ = _engine(tmp_path)
+    image_map = {"logo": Path("/images/logo.png")}
+
+    first = engine._encode_image_map(image_map)
+    assert engine._encode_image_map(image_map) is first
+
+    image_map["chart"] = Path("/images/chart.png")
+    assert b"chart" in engine._encode_image_map(image_map)
+
+
+def test_persistent_worker_runs_scripts_and_reports_exit_codes(tmp_path):
+    engine, manager, run_paths = _engine(tmp_path, persistent_script_worker=True)
+    try:
+        succeeded = _script(manager, run_paths, "v1", _IMAGE_MAP_SCRIPT)
+        failed = _script(manager, run_paths, "v2", "import sys\nprint('bad input', file=sys.stderr)\nsys.exit(4)\n")
+
+        first = engine.execute(succeeded, {"logo": Path("/images/logo.png")})
+        second = engine.execute(failed, {})
+        pids = [
+            engine.execute(_script(manager, run_paths, f"pid{index}", "import os\nprint('pid', os.getpid())\n"), {}).stdout
+            for index in range(2)
+        ]
+    finally:
+        engine.close()
+
+    # Both scripts ran in the same warm interpreter
+    assert [line for line in pids[0].splitlines() if line.startswith("pid ")] == [
+        line for line in pids[1].splitlines() if line.startswith("pid ")
+    ]
+
+    assert first.success, first.stderr
+    assert str(Path("/images/logo.png")) in first.stdout
+    stdout_log, _ = manager.execution_log_paths(run_paths, "v1")
+    persisted = stdout_log.read_text(encoding="utf-8")
+    assert persisted.index("Executing script: v1") < persisted.index("/images/logo.png") < persisted.index("Return code: 0")
+    assert second.return_code == 4
+    assert "bad input" in second.stderr
+
+
+def test_leaving_the_engine_context_stops_the_worker(tmp_path):
+    engine, manager, run_paths = _engine(tmp_path, persistent_script_worker=True)
+    with engine:
+        assert engine.execute(_script(manager, run_paths, "v1", "print('hi')\n"), {}).return_code == 0
+        process = engine._worker._process
+
+    assert process is not None and process.poll() is not None
+    assert engine._worker._process is None
+
+
+def test_persistent_worker_timeout_restarts_worker(tmp_path):
+    engine, manager, run_paths = _engine(tmp_path, timeout=1, persistent_script_worker=True)
+    try:
+        hung = _script(manager, run_paths, "v1", "import time\nprint('waiting', flush=True)\ntime.sleep(30)\n")
+        result = engine.execute(hung, {})
+        follow_up = engine.execute(_script(manager, run_paths, "v2", "print('after restart')\n"), {})
+    finally:
+        engine.close()
+
+    assert result.return_code == -1
+    assert "Execution timed out" in result.stderr
+    assert "waiting" in result.stdout
+    assert follow_up.return_code == 0
+    assert "after restart" in follow_up.stdout
+
+
+def test_persistent_worker_falls_back_when_the_worker_dies(tmp_path):
+    engine, manager, run_paths = _engine(tmp_path, persistent_script_worker=True)
+    try:
+        script = _script(manager, run_paths, "v1", "import os\nprint('hard exit', flush=True)\nos._exit(5)\n")
+        result = engine.execute(script, {})
+    finally:
+        engine.close()
+
+    assert result.return_code == 5
+    stdout_log, _ = manager.execution_log_paths(run_paths, "v1")
+    assert stdout_log.read_text(encoding="utf-8").count("hard exit") == 1
+
+
+@pytest.mark.parametrize(("mode", "expected_success"), [("off", True), ("fast", False)])
+def test_presentation_validation_modes(tmp_path, mode, expected_success):
+    engine, manager, run_paths = _engine(tmp_path, presentation_validation=mode)
+    body = (
+        "import argparse\n"
+        "parser = argparse.ArgumentParser()\n"
+        "parser.add_argument('--output')\n"
+        "parser.add_argument('--images')\n"
+        "with open(parser.parse_args().output, 'wb') as handle:\n"
+        "    handle.write(b'not a deck')\n"
+    )
+    script = _script(manager, run_paths, "v1", body)
+
+    result = engine.execute(script, {})
+
+    assert result.success is expected_success
+    if not expected_success:
+        assert "too small to be valid" in result.stderr
+
+
+def test_importing_the_engine_does_not_load_python_pptx():
+    import subprocess
+    import sys
+
+    probe = "import sys, slidegen.execution; sys.exit('pptx' in sys.modules)"
+    completed = subprocess.run([sys.executable, "-c", probe], cwd=Path(__file__).resolve().parents[1], check=False)
+
+    assert completed.returncode == 0
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import logging
+import logging.handlers
+import time
+
+from slidegen.logging_config import PROGRESS, get_logger, setup_logging
+
+
+def _wait_for(predicate, timeout: float = 2.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+def test_file_log_is_buffered_and_flushed_on_reconfigure(tmp_path):
+    log_file = tmp_path / "logs" / "run.log"
+    setup_logging(log_file_path=log_file)
+    logger = get_logger("slidegen.test")
+    try:
+        logger.info("first record")
+        logger.log(PROGRESS, "progress only on console")
+        assert "first record" not in log_file.read_text(encoding="utf-8")
+
+        logger.error("failure record")  # flushed by the background writer
+        assert _wait_for(lambda: "first record" in log_file.read_text(encoding="utf-8"))
+
+        logger.info("last record")
+    finally:
+        setup_logging(log_file_path=None)
+
+    contents = log_file.read_text(encoding="utf-8")
+    assert "last record" in contents
+    assert "progress only on console" not in contents
+    assert not any(isinstance(handler, logging.handlers.QueueHandler) for handler in logging.getLogger().handlers)
+
+
+def test_ai_request_and_response_are_single_records(caplog):
+    from slidegen.logging_config import log_ai_request, log_ai_response
+
+    logger = get_logger("slidegen.test")
+    with caplog.at_level(logging.INFO, logger="slidegen.test"):
+        log_ai_request(logger, "GENERATE", "Make a slide", model="gpt-test")
+        log_ai_response(logger, "GENERATE", "print('hi')", request_id="req-1")
+
+    assert len(caplog.records) == 2
+    request, response = (record.getMessage() for record in caplog.records)
+    assert "AI REQUEST: GENERATE\nModel: gpt-test" in request
+    assert request.endswith("PROMPT:\nMake a slide\n" + "=" * 80)
+    assert "Request ID: req-1" in response
+    assert "RESPONSE:\nprint('hi')" in response
+
+
+def test_ai_response_formats_args_only_when_enabled(caplog):
+    from slidegen.logging_config import log_ai_response
+
+    class Exploding:
+        def __str__(self) -> str:
+            raise AssertionError("formatted while INFO was disabled")
+
+    logger = get_logger("slidegen.test")
+    with caplog.at_level(logging.WARNING, logger="slidegen.test"):
+        log_ai_response(logger, "SCORE", "Received scores: %s", Exploding())
+    with caplog.at_level(logging.INFO, logger="slidegen.test"):
+        log_ai_response(logger, "GENERATE", "Generated %d characters", 42, request_id="req-1")
+
+    assert "RESPONSE:\nGenerated 42 characters" in caplog.records[-1].getMessage()
@@ -0,0 +1,457 @@
+from __future__ import annotations
+
+import asyncio
+import base64
+import hashlib
+import io
+import json
+from dataclasses import replace
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from openai import RateLimitError
+from PIL import Image
+
+from slidegen.config import OpenAIConfig
+from slidegen import openai_client
+from slidegen.openai_client import OpenAIClient, _stream_data_url
+from slidegen.prompt_store import RenderedPrompt
+from slidegen.types import ImageInput, SlideRequest
+
+_SCRIPT = "```python\nprint('slide')\n```"
+
+
+def _config(**overrides: object) -> OpenAIConfig:
+    config = OpenAIConfig(api_key=None, default_model="gpt-test", vision_model="gpt-test", mock_mode=True, reasoning_effort="medium", use_azure=False, azure_endpoint=None, azure_deployment=None, azure_api_version=None)
+    return replace(config, **overrides)
+
+
+class _FakeCompletions:
+    """Async ``chat.completions`` stand-in that records how many calls overlap."""
+
+    def __init__(self) -> None:
+        self.in_flight = 0
+        self.peak = 0
+        self.calls = 0
+
+    async def create(self, **params: object) -> SimpleNamespace:
+        self.calls += 1
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        message = SimpleNamespace(content=_SCRIPT)
+        return SimpleNamespace(id=f"req-{self.calls}", choices=[SimpleNamespace(message=message)], usage=None)
+
+
+def _client_with_fake_async(max_concurrency: int) -> tuple[OpenAIClient, _FakeCompletions]:
+    client = OpenAIClient(_config(mock_mode=False, max_concurrency=max_concurrency))
+    completions = _FakeCompletions()
+    aclient = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+    # Later event loops get a copy of the client; the copy shares the recorded calls.
+    aclient.with_options = lambda **_: aclient
+    client._aclient = aclient  # type: ignore[assignment]
+    return client, completions
+
+
+def test_async_mock_mode_matches_sync():
+    client = OpenAIClient(_config())
+    images = [ImageInput(name="logo", path=Path("logo.png"), description="Brand logo")]
+
+    sync_result = client.generate_initial_script("Quarterly Review", image_assets=images)
+    async_result = asyncio.run(client.agenerate_initial_script("Quarterly Review", image_assets=images))
+
+    assert async_result == sync_result
+
+
+def test_async_requests_respect_max_concurrency():
+    client, completions = _client_with_fake_async(max_concurrency=2)
+
+    async def fix_many() -> list:
+        return await asyncio.gather(
+            *(client.afix_script(f"Slide {index}", [], "print()", ["boom"]) for index in range(6))
+        )
+
+    results = asyncio.run(fix_many())
+
+    assert completions.calls == 6
+    assert completions.peak == 2
+    assert [result.script for result in results] == ["print('slide')"] * 6
+
+
+def test_async_client_usable_across_event_loops():
+    client, completions = _client_with_fake_async(max_concurrency=1)
+
+    for _ in range(2):
+        result = asyncio.run(client.afix_script("Slide", [], "print()", []))
+        assert result.script == "print('slide')"
+
+    assert completions.calls == 2
+
+
+def test_vision_request_puts_static_prompt_first(tmp_path):
+    client = OpenAIClient(_config())
+    reference = tmp_path / "reference.png"
+    reference.write_bytes(b"reference")
+    screenshot = tmp_path / "screenshot.png"
+    screenshot.write_bytes(b"screenshot")
+
+    requests = [
+        client._vision_request(
+            client._improve_script_payload("Brief", [], "print()", None, iteration, screenshot),
+            reference,
+            screenshot,
+        )
+        for iteration in (1, 2)
+    ]
+
+    system_messages = [request["messages"][0]["content"] for request in requests]
+    assert system_messages[0] == system_messages[1]
+    assert "Iteration Index" not in system_messages[0]
+    content = requests[0]["messages"][1]["content"]
+    assert [part["type"] for part in content] == ["image_url", "text", "text", "image_url", "text"]
+    assert "Iteration Index: 1" in content[2]["text"]
+
+
+def test_image_data_url_reuses_result_until_file_changes(tmp_path, monkeypatch):
+    image = tmp_path / "reference.png"
+    image.write_bytes(b"first")
+    opened: list[str] = []
+    real_open = open
+
+    def tracking_open(path, *args, **kwargs):
+        opened.append(str(path))
+        return real_open(path, *args, **kwargs)
+
+    monkeypatch.setattr("builtins.open", tracking_open)
+
+    first = OpenAIClient._image_data_url(image)
+    assert first.startswith("data:image/png;base64,")
+    assert OpenAIClient._image_data_url(image) is first
+    assert opened.count(str(image)) == 2  # hashed once, encoded once
+
+    copy = tmp_path / "copy.png"
+    copy.write_bytes(b"first")
+    assert OpenAIClient._image_data_url(copy) is first
+    assert opened.count(str(copy)) == 1  # hashed only; same content reuses the URL
+
+    image.write_bytes(b"second, longer")
+    assert OpenAIClient._image_data_url(image) != first
+    assert opened.count(str(image)) == 4
+
+
+class _FakeBatchClient:
+    """Sync client stand-in covering the Files and Batches calls used for batch jobs."""
+
+    def __init__(self, answer=lambda custom_id: f"print({custom_id})") -> None:
+        self.answer = answer
+        self.uploaded: list[dict] = []
+        self.polls = 0
+        self.files = SimpleNamespace(create=self._upload, content=self._content)
+        self.batches = SimpleNamespace(create=self._create, retrieve=self._retrieve)
+
+    def _upload(self, file: tuple[str, bytes], purpose: str) -> SimpleNamespace:
+        assert purpose == "batch"
+        self.uploaded = [json.loads(line) for line in file[1].splitlines()]
+        return SimpleNamespace(id="file-in")
+
+    def _create(self, input_file_id: str, endpoint: str, completion_window: str) -> SimpleNamespace:
+        assert (input_file_id, endpoint, completion_window) == ("file-in", "/v1/chat/completions", "24h")
+        return SimpleNamespace(id="batch-1")
+
+    def _retrieve(self, batch_id: str) -> SimpleNamespace:
+        self.polls += 1
+        status = "completed" if self.polls > 1 else "in_progress"
+        return SimpleNamespace(status=status, output_file_id="file-out")
+
+    def _content(self, file_id: str) -> SimpleNamespace:
+        # Output order is not guaranteed; answer in reverse to check results are re-ordered.
+        lines = []
+        for item in reversed(self.uploaded):
+            body = {
+                "id": f"chatcmpl-{item['custom_id']}",
+                "object": "chat.completion",
+                "created": 0,
+                "model": "gpt-test",
+                "choices": [{"index": 0, "finish_reason": "stop", "message": {"role": "assistant", "content": self.answer(item["custom_id"])}}],
+            }
+            lines.append(json.dumps({"custom_id": item["custom_id"], "response": {"status_code": 200, "body": body}, "error": None}))
+        return SimpleNamespace(text="\n".join(lines))
+
+
+def test_script_batch_round_trip():
+    client = OpenAIClient(_config(mock_mode=False))
+    fake = _FakeBatchClient()
+    client._client = fake  # type: ignore[assignment]
+
+    batch = client.submit_script_batch([SlideRequest(prompt="First", images=[]), SlideRequest(prompt="Second", images=[])])
+    results = client.wait_for_batch(batch, poll_interval=0)
+
+    assert [item["url"] for item in fake.uploaded] == ["/v1/chat/completions"] * 2
+    assert fake.polls == 2
+    assert [result.script for result in results] == ["print(0)", "print(1)"]
+    assert [result.request_id for result in results] == ["chatcmpl-0", "chatcmpl-1"]
+    assert "First" in results[0].prompt_payload
+
+
+def test_scoring_batch_round_trip(tmp_path):
+    client = OpenAIClient(_config(mock_mode=False))
+    scores = {"completeness": 80, "content_accuracy": 70, "layout_match": 60, "visual_quality": 50}
+    fake = _FakeBatchClient(answer=lambda custom_id: json.dumps({**scores, "issues": [f"issue {custom_id}"]}))
+    client._client = fake  # type: ignore[assignment]
+    screenshots = []
+    for name in ("first", "second"):
+        screenshots.append(tmp_path / f"{name}.png")
+        screenshots[-1].write_bytes(name.encode())
+
+    batch = client.submit_scoring_batch([(SlideRequest(prompt=name, images=[]), path) for name, path in zip(("A", "B"), screenshots)])
+    results = client.wait_for_scoring_batch(batch, poll_interval=0)
+
+    response_format = fake.uploaded[0]["body"]["response_format"]
+    assert response_format["type"] == "json_schema"
+    assert response_format["json_schema"]["schema"]["required"] == [*scores, "issues"]
+    assert [result.issues for result in results] == [["issue 0"], ["issue 1"]]
+    assert results[0].aggregate == 65.0
+
+
+def test_initial_candidates_use_one_request_with_n():
+    client = OpenAIClient(_config(mock_mode=False))
+    calls: list[dict] = []
+
+    def create(**params: object) -> SimpleNamespace:
+        calls.append(params)
+        choices = [
+            SimpleNamespace(index=index, message=SimpleNamespace(content=content))
+            for index, content in enumerate(["print(0)", "", "```python\nprint(2)\n```"])
+        ]
+        return SimpleNamespace(id="req", choices=choices, usage=None)
+
+    client._client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))  # type: ignore[assignment]
+
+    results = client.generate_initial_candidates("Brief", num_candidates=3)
+
+    assert len(calls) == 1
+    assert calls[0]["n"] == 3
+    assert [(result.script, result.request_id) for result in results] == [("print(0)", "req:0"), ("print(2)", "req:2")]
+
+
+def test_initial_candidates_in_mock_mode_are_distinct():
+    client = OpenAIClient(_config())
+
+    results = client.generate_initial_candidates("Brief", num_candidates=2)
+
+    assert len(results) == 2
+    assert len({result.request_id for result in results}) == 2
+
+
+def test_extract_code_from_markdown():
+    extract = OpenAIClient._extract_code_from_markdown
+
+    assert extract("  print('bare')  ") == "print('bare')"
+    assert extract("Here you go:\n```python\nprint(1)\n```\nDone.") == "print(1)"
+    assert extract("```\nprint(1)\n```") == "print(1)"
+    # Non-Python blocks are skipped rather than concatenated into the script.
+    assert extract("```python\nprint(1)\n```\nRun it with:\n```bash\npython slide.py\n```") == "print(1)"
+    # Fences inside string literals mid-line do not end the block.
+    assert extract("```py\ntext = 'a ``` b'\nprint(text)\n```") == "text = 'a ``` b'\nprint(text)"
+
+
+def test_repeated_prompts_are_rendered_once(monkeypatch):
+    client = OpenAIClient(_config())
+    renders: list[str] = []
+    real_render = client._prompt_store.render_sections
+
+    def counting_render(name: str, **context: object):
+        renders.append(name)
+        return real_render(name, **context)
+
+    monkeypatch.setattr(client._prompt_store, "render_sections", counting_render)
+
+    first = client.fix_script("Brief", [], "print()", ["NameError"])
+    second = client.fix_script("Brief", [], "print()", ["NameError"])
+    client.fix_script("Brief", [], "print()", ["TypeError"])
+
+    assert first.prompt_payload == second.prompt_payload
+    assert renders == ["fix_script", "fix_script"]
+
+
+def test_image_parts_keep_positions(tmp_path):
+    first = tmp_path / "first.png"
+    first.write_bytes(b"first")
+    second = tmp_path / "second.jpg"
+    second.write_bytes(b"second")
+
+    parts = OpenAIClient._image_parts(first, None, second, first)
+
+    assert parts[1] is None
+    assert parts[0] == parts[3] == OpenAIClient._image_part(first)
+    assert parts[2]["image_url"]["url"].startswith("data:image/jpeg;base64,")
+
+
+def test_missing_images_are_skipped_or_rejected(tmp_path):
+    client = OpenAIClient(_config())
+    screenshot = tmp_path / "screenshot.png"
+    screenshot.write_bytes(b"screenshot")
+    missing = tmp_path / "missing.png"
+
+    assert OpenAIClient._image_parts(missing, screenshot)[0] is None
+    request = client._vision_request(client._fix_script_payload("Brief", [], "print()", []), missing, screenshot)
+    assert [part["type"] for part in request["messages"][1]["content"]] == ["text", "image_url", "text"]
+
+    payload = client._score_slide_payload("Brief", [], missing, None)
+    with pytest.raises(FileNotFoundError, match="Screenshot file not found"):
+        client._scoring_request(payload, missing, None)
+
+
+def test_async_requests_retry_after_rate_limit(monkeypatch):
+    completions = _FakeCompletions()
+    client = OpenAIClient(_config(mock_mode=False, requests_per_minute=600))
+    client._aclient = SimpleNamespace(chat=SimpleNamespace(completions=completions))  # type: ignore[assignment]
+    paused: list[float] = []
+    monkeypatch.setattr(client._rate_limiter, "pause", paused.append)
+    real_create = completions.create
+
+    async def create_after_429(**params: object) -> SimpleNamespace:
+        if not paused:
+            response = SimpleNamespace(status_code=429, headers={"retry-after": "0"}, request=None)
+            raise RateLimitError("rate limited", response=response, body=None)  # type: ignore[arg-type]
+        return await real_create(**params)
+
+    monkeypatch.setattr(completions, "create", create_after_429)
+
+    result = asyncio.run(client.afix_script("Slide", [], "print()", []))
+
+    assert result.script == "print('slide')"
+    assert paused == [0.0]
+
+
+def test_scoring_uses_scoring_model(tmp_path):
+    screenshot = tmp_path / "screenshot.png"
+    screenshot.write_bytes(b"screenshot")
+    client = OpenAIClient(_config(default_model="o3", scoring_model="gpt-4o-mini"))
+
+    request = client._scoring_request(client._score_slide_payload("Brief", [], screenshot, None), screenshot, None)
+
+    assert request["model"] == "gpt-4o-mini"
+    assert "reasoning_effort" not in request
+    assert request["temperature"] == 0.0
+
+
+def test_image_detail_applies_to_every_request_image(tmp_path):
+    screenshot = tmp_path / "screenshot.png"
+    screenshot.write_bytes(b"screenshot")
+    client = OpenAIClient(_config(image_detail="low"))
+
+    scoring = client._scoring_request(client._score_slide_payload("Brief", [], screenshot, None), screenshot, None)
+    vision = client._vision_request(RenderedPrompt("static", "dynamic"), screenshot, screenshot)
+
+    for request in (scoring, vision):
+        images = [part for part in request["messages"][1]["content"] if part["type"] == "image_url"]
+        assert images and all(part["image_url"]["detail"] == "low" for part in images)
+    assert OpenAIClient(_config(default_model="o3"))._scoring_model() == "o3"
+
+
+def test_large_images_are_downscaled_when_enabled(tmp_path):
+    large = tmp_path / "screenshot.png"
+    Image.new("RGB", (3000, 1500), "white").save(large)
+    small = tmp_path / "logo.png"
+    Image.new("RGB", (200, 100), "white").save(small)
+
+    url = OpenAIClient._image_data_url(large, max_dim=1568)
+    assert url.startswith("data:image/jpeg;base64,")
+    with Image.open(io.BytesIO(base64.b64decode(url.split(",", 1)[1]))) as sent:
+        assert sent.size == (1568, 784)
+
+    assert OpenAIClient._image_data_url(small, max_dim=1568) == OpenAIClient._image_data_url(small)
+    assert OpenAIClient._image_data_url(large).startswith("data:image/png;base64,")
+
+
+def test_is_reasoning_model():
+    assert [OpenAIClient._is_reasoning_model(model) for model in ("o1-preview", "o3", "gpt-5-mini", "gpt-4o", "gpt-4.1")] == [True, True, True, False, False]
+
+
+def test_scoring_attaches_assets_only_when_enabled(tmp_path):
+    screenshot = tmp_path / "screenshot.png"
+    screenshot.write_bytes(b"screenshot")
+    logo = tmp_path / "logo.png"
+    logo.write_bytes(b"logo")
+    assets = [logo, tmp_path / "missing.png"]
+
+    def content_types(client: OpenAIClient) -> list[str]:
+        payload = client._score_slide_payload("Brief", [], screenshot, None)
+        request = client._scoring_request(payload, screenshot, None, assets)
+        return [part["type"] for part in request["messages"][1]["content"]]
+
+    assert content_types(OpenAIClient(_config())) == ["text", "image_url", "text"]
+    assert content_types(OpenAIClient(_config(score_with_assets=True))) == ["image_url", "text", "text", "image_url", "text"]
+
+
+def test_real_client_prewarms_its_connection_once_before_the_first_request(monkeypatch):
+    retrieved: list[str] = []
+
+    class _Models:
+        def retrieve(self, model):
+            retrieved.append(model)
+
+    class _Thread:
+        def __init__(self, target, name, daemon):
+            self._target = target
+
+        def start(self):
+            self._target()
+
+    client = OpenAIClient(_config(mock_mode=False, api_key="sk-test"))
+    assert client._connection_warmed is False
+    monkeypatch.setattr(openai_client.threading, "Thread", _Thread)
+    monkeypatch.setattr(client, "_client", SimpleNamespace(with_options=lambda **_: SimpleNamespace(models=_Models())))
+
+    client._prewarm_connection()
+    client._prewarm_connection()
+
+    assert retrieved == [client._generation_model]
+
+
+def test_requests_with_the_same_system_prompt_share_a_cache_key(tmp_path):
+    screenshot = tmp_path / "screenshot.png"
+    screenshot.write_bytes(b"screenshot")
+    client = OpenAIClient(_config())
+
+    fixes = [client._vision_request(client._fix_script_payload(f"Brief {index}", [], "print()", []), None, None) for index in (1, 2)]
+    score = client._scoring_request(client._score_slide_payload("Brief", [], screenshot, None), screenshot, None)
+
+    assert fixes[0]["prompt_cache_key"] == fixes[1]["prompt_cache_key"] != score["prompt_cache_key"]
+    azure = OpenAIClient(_config(use_azure=True, azure_deployment="slides"))
+    assert "prompt_cache_key" not in azure._vision_request(azure._fix_script_payload("Brief", [], "print()", []), None, None)
+
+
+@pytest.mark.parametrize("size", [0, 1, 2, 3, 4, 3 * 64 * 1024, 3 * 64 * 1024 + 1, 500_000])
+def test_stream_data_url_matches_one_shot_encoding(size):
+    data = bytes(range(256)) * (size // 256) + bytes(size % 256)
+    expected = "data:image/png;base64," + base64.b64encode(data).decode("ascii")
+
+    assert _stream_data_url(io.BytesIO(data), size, "image/png") == expected
+    assert _stream_data_url(io.BytesIO(data), size + 10, "image/png") == expected  # file shrank after stat
+
+
+def test_mock_request_id_hashes_the_full_prompt_text():
+    prompts = [RenderedPrompt("static", "dynamic"), RenderedPrompt("", "dynamic"), RenderedPrompt("static", "")]
+
+    for prompt in prompts:
+        for suffix in ("", "#2"):
+            expected = "mock-" + hashlib.sha256(f"{prompt.text}{suffix}".encode()).hexdigest()[:12]
+            assert OpenAIClient._mock_request_id(prompt, suffix) == expected
+
+
+def test_format_images_accepts_one_shot_iterables():
+    images = [ImageInput(name="logo", path=Path("logo.png"), description="Brand logo")]
+
+    assert OpenAIClient._format_images(iter(images)) == "- logo: Brand logo (logo.png)"
+    assert OpenAIClient._format_images(iter(())) == "(no images provided)"
+
+
+def test_max_retries_is_passed_to_the_sdk_clients():
+    client = OpenAIClient(_config(mock_mode=False, api_key="sk-test", max_retries=5))
+
+    assert client._client.max_retries == 5
+    assert client._aclient.max_retries == 5
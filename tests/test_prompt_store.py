@@ -249,3 +249,48 @@ def test_shared_templates_cached_once():
     
     # Cache should only grow by 1 (fix_script), not by 4 (fix_script + 3 shared)
     assert cache_size_2 == cache_size_1 + 1
+
+
+def test_render_sections_keeps_dynamic_content_out_of_prefix():
+    """Test the static prefix is identical across requests and the marker is dropped."""
+    store = PromptStore()
+
+    first = store.render_sections("fix_script", prompt="Slide A", image_table="None",
+                                  failing_script="code A", error_log="error A")
+    second = store.render_sections("fix_script", prompt="Slide B", image_table="None",
+                                   failing_script="code B", error_log="error B")
+
+    assert first.static_prefix == second.static_prefix
+    assert "Slide A" not in first.static_prefix
+    assert "Slide A" in first.dynamic_suffix
+    assert "<<<DYNAMIC>>>" not in first.text
+    assert first.text == store.render("fix_script", prompt="Slide A", image_table="None",
+                                      failing_script="code A", error_log="error A")
+
+
+def test_render_sections_without_marker_is_all_dynamic(tmp_path):
+    """Test templates without a marker render entirely into the dynamic suffix."""
+    (tmp_path / "plain.txt").write_text("Hello {audience}")
+    store = PromptStore(base_dir=tmp_path)
+
+    rendered = store.render_sections("plain", audience="World")
+
+    assert rendered.static_prefix == ""
+    assert rendered.dynamic_suffix == "Hello World"
+    assert rendered.text == "Hello World"
+
+
+def test_static_prefix_formatted_once_per_template(tmp_path):
+    """Test repeat renders reuse the formatted static prefix and only format the dynamic part."""
+    (tmp_path / "brief.txt").write_text("Rules: {shared_requirements}\n<<<DYNAMIC>>>\nBrief: {brief}")
+    (tmp_path / "shared_requirements.txt").write_text("be concise")
+    store = PromptStore(base_dir=tmp_path)
+
+    first = store.render_sections("brief", brief="A")
+    second = store.render_sections("brief", brief="B")
+    custom = store.render_sections("brief", brief="C", shared_requirements="be bold")
+
+    assert first.static_prefix == "Rules: be concise"
+    assert second.static_prefix is first.static_prefix
+    assert second.dynamic_suffix == "Brief: B"
+    assert custom.static_prefix == "Rules: be bold"
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+
+from slidegen import rate_limiter
+from slidegen.rate_limiter import RateLimiter, estimate_tokens, retry_after_seconds
+
+
+class _Clock:
+    """Fake monotonic clock advanced by ``asyncio.sleep``."""
+
+    def __init__(self, monkeypatch) -> None:
+        self.now = 0.0
+        self.sleeps: list[float] = []
+        monkeypatch.setattr(rate_limiter.time, "monotonic", lambda: self.now)
+        monkeypatch.setattr(rate_limiter.asyncio, "sleep", self._sleep)
+
+    async def _sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def test_requests_beyond_the_burst_wait_for_refill(monkeypatch):
+    clock = _Clock(monkeypatch)
+    limiter = RateLimiter(requests_per_minute=2, tokens_per_minute=0)
+
+    async def send(count: int) -> None:
+        for _ in range(count):
+            await limiter.acquire(tokens=100)
+
+    asyncio.run(send(3))
+
+    assert clock.now == 30.0  # third request waits for half a minute's refill
+
+
+def test_token_bucket_paces_large_requests(monkeypatch):
+    clock = _Clock(monkeypatch)
+    limiter = RateLimiter(requests_per_minute=0, tokens_per_minute=1000)
+
+    async def send() -> None:
+        await limiter.acquire(tokens=600)
+        await limiter.acquire(tokens=600)
+        await limiter.acquire(tokens=5000)  # larger than the bucket: drains it rather than waiting forever
+
+    asyncio.run(send())
+
+    assert clock.sleeps == [12.0, 60.0]
+
+
+def test_pause_holds_back_callers(monkeypatch):
+    clock = _Clock(monkeypatch)
+    limiter = RateLimiter(requests_per_minute=60, tokens_per_minute=0)
+    limiter.pause(5)
+
+    asyncio.run(limiter.acquire(tokens=1))
+
+    assert clock.now == 5.0
+
+
+def test_retry_after_prefers_server_headers():
+    def error(headers: dict[str, str]) -> Exception:
+        failure = Exception("rate limited")
+        failure.response = SimpleNamespace(headers=headers)  # type: ignore[attr-defined]
+        return failure
+
+    assert retry_after_seconds(error({"retry-after-ms": "1500", "retry-after": "9"}), attempt=0) == 1.5
+    assert retry_after_seconds(error({"retry-after": "7"}), attempt=0) == 7.0
+    assert 2.0 <= retry_after_seconds(error({}), attempt=2) <= 4.0
+    assert 30.0 <= retry_after_seconds(error({}), attempt=10) <= 60.0
+
+
+def test_estimate_tokens_counts_text_images_and_choices():
+    api_params = {
+        "n": 2,
+        "max_completion_tokens": 100,
+        "messages": [
+            {"role": "system", "content": "x" * 400},
+            {"role": "user", "content": [{"type": "text", "text": "y" * 40}, {"type": "image_url", "image_url": {"url": "data:"}}]},
+            {"role": "user", "content": [{"type": "image_url", "image_url": {"url": "data:", "detail": "low"}}]},
+        ],
+    }
+
+    assert estimate_tokens(api_params) == (100 + 10 + 1105 + 85 + 100) * 2
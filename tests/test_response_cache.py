@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+from dataclasses import replace
+from types import SimpleNamespace
+
+from slidegen import serialization
+from slidegen.config import OpenAIConfig
+from slidegen.openai_client import OpenAIClient
+from slidegen.response_cache import ResponseCache
+
+
+def test_round_trip_and_key_sensitivity(tmp_path):
+    cache = ResponseCache(tmp_path / "responses")
+    key = cache.key({"model": "gpt-test", "temperature": 0.3, "messages": ["a"]})
+
+    assert cache.get(key) is None
+    cache.put(key, "print(1)", "req-1")
+
+    assert cache.get(key) == ("print(1)", "req-1")
+    assert cache.key({"model": "gpt-test", "temperature": 0.3, "messages": ["b"]}) != key
+    assert not list((tmp_path / "responses").glob("*.tmp"))
+
+
+def test_key_does_not_depend_on_the_json_backend(monkeypatch):
+    request = {"model": "gpt-test", "temperature": 0.3, "messages": [{"role": "user", "content": "Résumé ✓"}]}
+    keys = set()
+    for module in (serialization.orjson, None):
+        monkeypatch.setattr(serialization, "orjson", module)
+        keys.add(ResponseCache.key(request))
+
+    assert len(keys) == 1
+
+
+def test_unreadable_entry_is_a_miss(tmp_path):
+    cache = ResponseCache(tmp_path)
+    key = cache.key({"model": "gpt-test"})
+    (tmp_path / f"{key}.json").write_text("{truncated")
+
+    assert cache.get(key) is None
+
+
+def test_client_reuses_cached_script(tmp_path):
+    config = OpenAIConfig(api_key=None, default_model="gpt-test", vision_model="gpt-test", mock_mode=False, reasoning_effort="medium", use_azure=False, azure_endpoint=None, azure_deployment=None, azure_api_version=None)
+    client = OpenAIClient(replace(config, response_cache_dir=tmp_path))
+    calls: list[dict] = []
+
+    def create(**params: object) -> SimpleNamespace:
+        calls.append(params)
+        message = SimpleNamespace(content="print('cached')")
+        return SimpleNamespace(id=f"req-{len(calls)}", choices=[SimpleNamespace(message=message)], usage=None)
+
+    client._client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))  # type: ignore[assignment]
+    prompt = client._fix_script_payload("Brief", [], "print()", ["NameError"])
+
+    first = client._call_openai_with_vision(prompt)
+    second = client._call_openai_with_vision(prompt)
+
+    assert first == second == ("print('cached')", "req-1")
+    assert len(calls) == 1
+
+
+def test_client_caches_candidate_sets_apart_from_single_scripts(tmp_path):
+    config = OpenAIConfig(api_key=None, default_model="gpt-test", vision_model="gpt-test", mock_mode=False, reasoning_effort="medium", use_azure=False, azure_endpoint=None, azure_deployment=None, azure_api_version=None)
+    client = OpenAIClient(replace(config, response_cache_dir=tmp_path))
+    calls: list[dict] = []
+
+    def create(**params: object) -> SimpleNamespace:
+        calls.append(params)
+        choices = [SimpleNamespace(index=index, message=SimpleNamespace(content=f"print({index})")) for index in range(params.get("n", 1))]  # type: ignore[arg-type]
+        return SimpleNamespace(id=f"req-{len(calls)}", choices=choices, usage=None)
+
+    client._client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))  # type: ignore[assignment]
+    prompt = client._initial_script_payload("Brief", [])
+
+    first = client._call_openai_for_candidates(prompt, None, 2)
+    second = client._call_openai_for_candidates(prompt, None, 2)
+    single = client._call_openai_with_vision(prompt)
+
+    assert first == second == [("print(0)", "req-1:0"), ("print(1)", "req-1:1")]
+    assert single == ("print(0)", "req-2")
+    assert len(calls) == 2
+
+
+def test_client_reuses_cached_score_until_the_screenshot_changes(tmp_path):
+    config = OpenAIConfig(api_key=None, default_model="gpt-test", vision_model="gpt-test", mock_mode=False, reasoning_effort="medium", use_azure=False, azure_endpoint=None, azure_deployment=None, azure_api_version=None)
+    client = OpenAIClient(replace(config, response_cache_dir=tmp_path / "responses"))
+    calls: list[dict] = []
+
+    def create(**params: object) -> SimpleNamespace:
+        calls.append(params)
+        message = SimpleNamespace(content='{"completeness": 80, "content_accuracy": 70, "layout_match": 60, "visual_quality": 90, "issues": ["Tighten spacing"]}')
+        return SimpleNamespace(id=f"req-{len(calls)}", choices=[SimpleNamespace(message=message)], usage=None)
+
+    client._client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))  # type: ignore[assignment]
+    screenshot = tmp_path / "slide.png"
+    screenshot.write_bytes(b"\x89PNG first")
+
+    first = client.score_slide("Brief", [], screenshot, None)
+    second = client.score_slide("Brief", [], screenshot, None)
+    screenshot.write_bytes(b"\x89PNG second render")
+    client.score_slide("Brief", [], screenshot, None)
+
+    assert first == second
+    assert second.aggregate == 75.0 and second.issues == ["Tighten spacing"]
+    assert len(calls) == 2
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+from types import SimpleNamespace
+
+from PIL import Image
+
+from slidegen.config import OpenAIConfig, ScoreWeights
+from slidegen.openai_client import OpenAIClient
+from slidegen.scoring import ScoringService
+from slidegen.types import ScoreBreakdown, SlideRequest
+
+
+class _OverlapClient:
+    """``ascore_slide`` stand-in that records how many calls are in flight together."""
+
+    def __init__(self) -> None:
+        self.in_flight = 0
+        self.peak = 0
+
+    async def ascore_slide(self, prompt, images, screenshot_path, reference_image) -> ScoreBreakdown:
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        value = float(screenshot_path.stem)
+        return ScoreBreakdown(value, value, value, value, value, issues=[screenshot_path.name])
+
+    async def aclose(self) -> None:
+        pass
+
+
+class _LoopBoundCompletions:
+    """Async ``chat.completions`` stand-in that, like a pooled connection, only works on its first loop."""
+
+    def __init__(self) -> None:
+        self.loop: asyncio.AbstractEventLoop | None = None
+        self.closed = False
+
+    async def create(self, **params: object) -> SimpleNamespace:
+        loop = asyncio.get_running_loop()
+        if self.closed:
+            raise RuntimeError("Cannot send a request, as the client has been closed")
+        if self.loop not in (None, loop):
+            raise RuntimeError("Event loop is closed")
+        self.loop = loop
+        message = SimpleNamespace(content='{"completeness": 80, "content_accuracy": 80, "layout_match": 80, "visual_quality": 80, "issues": []}')
+        return SimpleNamespace(id="req", choices=[SimpleNamespace(message=message)], usage=None)
+
+
+def _loop_bound_client() -> SimpleNamespace:
+    completions = _LoopBoundCompletions()
+
+    async def close() -> None:
+        completions.closed = True
+
+    return SimpleNamespace(chat=SimpleNamespace(completions=completions), close=close, with_options=lambda **_: _loop_bound_client())
+
+
+def test_score_many_runs_calls_concurrently_and_keeps_order():
+    client = _OverlapClient()
+    service = ScoringService(ScoreWeights(0.4, 0.2, 0.2, 0.2), client)  # type: ignore[arg-type]
+
+    scores = service.score_many(SlideRequest(prompt="Brief", images=[]), [Path("70.png"), Path("90.png"), Path("80.png")], None)
+
+    assert client.peak == 3
+    assert [score.aggregate for score in scores] == [70.0, 90.0, 80.0]
+    assert scores[1].issues == ["90.png"]
+
+
+def test_score_many_can_run_repeatedly_and_inside_an_event_loop(tmp_path):
+    config = OpenAIConfig(api_key=None, default_model="gpt-test", vision_model="gpt-test", mock_mode=False, reasoning_effort="medium", use_azure=False, azure_endpoint=None, azure_deployment=None, azure_api_version=None)
+    client = OpenAIClient(config)
+    client._aclient = _loop_bound_client()  # type: ignore[assignment]
+    service = ScoringService(ScoreWeights(0.4, 0.2, 0.2, 0.2), client)
+    screenshots = [tmp_path / f"{index}.png" for index in range(2)]
+    for path in screenshots:
+        Image.new("RGB", (4, 4)).save(path)
+    request = SlideRequest(prompt="Brief", images=[])
+
+    async def score_from_a_coroutine() -> list[ScoreBreakdown]:
+        return service.score_many(request, screenshots, None)
+
+    for scores in (service.score_many(request, screenshots, None), service.score_many(request, screenshots, None), asyncio.run(score_from_a_coroutine())):
+        assert [score.aggregate for score in scores] == [80.0, 80.0]
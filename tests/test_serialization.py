@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import io
+import json
+
+import pytest
+
+from slidegen import serialization
+
+
+def test_dumps_round_trips_nested_values():
+    value = {"run_id": "abc", "iterations": [{"score": 81.5, "issues": ["Ünïcode"]}], "best": None}
+    assert json.loads(serialization.dumps(value)) == value
+    assert json.loads(serialization.dumps(value, indent=True)) == value
+
+
+def test_dumps_stdlib_fallback_matches(monkeypatch):
+    value = {"name": "logo", "path": "/tmp/logo.png"}
+    monkeypatch.setattr(serialization, "orjson", None)
+    indented = serialization.dumps(value, indent=True)
+    assert indented.startswith(b'{\n  "name"')
+    assert json.loads(indented) == value
+
+
+def test_dump_streams_same_bytes_as_dumps(monkeypatch):
+    value = {
+        "run_id": "abc",
+        "images": [],
+        "iterations": [{"stage": "fix_loop", "execution": {"stdout": "line1\nline2"}}, {"stage": "scoring"}],
+        "best_score": {"aggregate": 80.0, "issues": ["a", "b"]},
+        "empty": {},
+    }
+    for module in (serialization.orjson, None):
+        monkeypatch.setattr(serialization, "orjson", module)
+        buffer = io.BytesIO()
+        serialization.dump(value, buffer)
+        assert buffer.getvalue() == serialization.dumps(value, indent=True)
+
+
+def test_run_metadata_fields_encode_like_to_dict(monkeypatch):
+    from pathlib import Path
+
+    from slidegen.types import (
+        ExecutionResult,
+        ImageInput,
+        IterationRecord,
+        PipelineStage,
+        RunMetadata,
+        ScoreBreakdown,
+        ScriptOrigin,
+        ScriptStatus,
+        ScriptVersion,
+        SlideRequest,
+    )
+
+    score = ScoreBreakdown(90.0, 80.0, 70.0, 60.0, 75.0, ["tight margins"])
+    metadata = RunMetadata(
+        run_id="abc",
+        request=SlideRequest(prompt="Q3", images=[ImageInput("logo", Path("/tmp/logo.png"), "Logo")]),
+        script_versions=[ScriptVersion("v1", ScriptOrigin.INITIAL, Path("/tmp/v1.py"), ScriptStatus.SUCCESS)],
+        iterations=[
+            IterationRecord(
+                stage=PipelineStage.SCORING,
+                script_version_id="v1",
+                execution=ExecutionResult(True, Path("/tmp/v1.pptx"), "ok", "", 0, 1.5),
+                screenshot_path=Path("/tmp/v1.png"),
+                score=score,
+            )
+        ],
+        best_version_id="v1",
+        best_score=score,
+        status=PipelineStage.COMPLETE,
+    )
+    for module in (serialization.orjson, None):
+        monkeypatch.setattr(serialization, "orjson", module)
+        data = metadata.to_dict()
+        assert data["images"] == [{"name": "logo", "path": "/tmp/logo.png", "description": "Logo"}]
+        assert data["reference_image"] is None
+        assert data["script_versions"][0]["origin"] == "initial"
+        assert data["iterations"][0]["execution"]["pptx_path"] == "/tmp/v1.pptx"
+        assert data["iterations"][0]["score"] == score.to_dict()
+        assert data["status"] == "complete"
+        buffer = io.BytesIO()
+        serialization.dump(metadata.json_fields(), buffer)
+        assert json.loads(buffer.getvalue()) == data
+
+
+def test_loads_accepts_text_and_bytes_on_both_paths(monkeypatch):
+    payload = '{"completeness": 82.5, "issues": ["Ünïcode"]}'
+    for orjson_module in (serialization.orjson, None):
+        monkeypatch.setattr(serialization, "orjson", orjson_module)
+        assert serialization.loads(payload) == {"completeness": 82.5, "issues": ["Ünïcode"]}
+        assert serialization.loads(payload.encode("utf-8")) == serialization.loads(payload)
+        with pytest.raises(json.JSONDecodeError):
+            serialization.loads("{not json")